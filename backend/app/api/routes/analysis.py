@@ -42,7 +42,8 @@ async def start_analysis(
     analysis_id = str(uuid4())
 
     # Start analysis in background
-    background_tasks.add_task(run_analysis, project_id)
+    force = options.force if options else False
+    background_tasks.add_task(run_analysis, project_id, force=force)
 
     return AnalysisStartResponse(
         analysis_id=analysis_id,
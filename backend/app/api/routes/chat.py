@@ -17,7 +17,6 @@ from app.schemas.chat import (
     ChatResponse,
     ChatSessionResponse,
     ChatSessionListResponse,
-    ChatSessionListItem,
     ChatMessage,
     ChatResponseContent,
     ChatSource,
@@ -25,6 +24,7 @@ from app.schemas.chat import (
     TokenUsage,
     ChatSessionCreate,
     ChatSessionUpdate,
+    CHAT_SESSION_LIST_ADAPTER,
 )
 from app.services.rag_service import get_rag_service
 
@@ -455,18 +455,20 @@ async def list_chat_sessions(project_id: str, db: Session = Depends(get_db)):
         ChatSession.project_id == project_id
     ).order_by(ChatSession.updated_at.desc()).all()
 
-    items = []
+    rows = []
     for session in sessions:
         message_count = len(session.messages)
         last_message = session.messages[-1] if session.messages else None
 
-        items.append(ChatSessionListItem(
-            id=session.id,
-            title=session.title or "Untitled conversation",
-            message_count=message_count,
-            created_at=session.created_at,
-            last_message_at=last_message.created_at if last_message else session.created_at
-        ))
+        rows.append({
+            "id": session.id,
+            "title": session.title or "Untitled conversation",
+            "message_count": message_count,
+            "created_at": session.created_at,
+            "last_message_at": last_message.created_at if last_message else session.created_at,
+        })
+
+    items = CHAT_SESSION_LIST_ADAPTER.validate_python(rows)
 
     return ChatSessionListResponse(items=items)
 
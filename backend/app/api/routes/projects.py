@@ -3,7 +3,8 @@
 from fastapi import APIRouter, HTTPException, Query, Depends, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import Optional
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from uuid import uuid4
 
 from app.schemas.project import (
@@ -11,8 +12,8 @@ from app.schemas.project import (
     ProjectUpdate,
     ProjectResponse,
     ProjectListResponse,
-    ProjectListItem,
     ProjectStatus,
+    PROJECT_LIST_ADAPTER,
 )
 from app.schemas.analysis import (
     AnalysisCreate,
@@ -25,6 +26,14 @@ from app.services.analysis_service import run_analysis
 
 router = APIRouter()
 
+# Statuses for which a new analysis request conflicts with one in flight
+_ANALYSIS_ACTIVE_STATUSES = frozenset({
+    ProjectStatus.pending,
+    ProjectStatus.cloning,
+    ProjectStatus.scanning,
+    ProjectStatus.analyzing,
+})
+
 
 @router.post("", response_model=ProjectResponse, status_code=201)
 async def create_project(
@@ -100,20 +109,8 @@ async def list_projects(
     # Apply pagination
     projects = query.offset(offset).limit(limit).all()
 
-    # Convert to list items
-    items = [
-        ProjectListItem(
-            id=p.id,
-            name=p.name,
-            source_type=p.source_type,
-            source=p.source,
-            status=p.status,
-            stats=p.stats,
-            last_analyzed_at=p.last_analyzed_at,
-            created_at=p.created_at,
-        )
-        for p in projects
-    ]
+    # Convert to list items (column names match ProjectListItem fields)
+    items = PROJECT_LIST_ADAPTER.validate_python(projects, from_attributes=True)
 
     return ProjectListResponse(
         items=items,
@@ -161,7 +158,7 @@ async def update_project(
     if update.settings:
         project.settings = update.settings.dict()
 
-    project.updated_at = datetime.utcnow()
+    project.updated_at = datetime.now(timezone.utc)
 
     db.commit()
     db.refresh(project)
@@ -226,7 +223,8 @@ async def start_analysis(
 
     Raises:
         404: Project not found
-        409: Analysis already running (unless force=True)
+        409: Analysis already running (unless force=True, which also
+            re-analyzes every file instead of only those changed)
     """
     # Get project
     project = db.query(Project).filter(Project.id == project_id).first()
@@ -241,13 +239,11 @@ async def start_analysis(
             }
         )
 
-    # Check if analysis is already running
-    active_statuses = [ProjectStatus.pending, ProjectStatus.cloning,
-                      ProjectStatus.scanning, ProjectStatus.analyzing]
+    force = request.force if request else False
 
-    if project.status in active_statuses:
+    # Check if analysis is already running
+    if project.status in _ANALYSIS_ACTIVE_STATUSES:
         # Analysis already running
-        force = request.force if request else False
         if not force:
             raise HTTPException(
                 status_code=409,
@@ -263,15 +259,15 @@ async def start_analysis(
 
     # Update project status to pending
     project.status = ProjectStatus.pending
-    project.updated_at = datetime.utcnow()
+    project.updated_at = datetime.now(timezone.utc)
     db.commit()
     db.refresh(project)
 
     # Trigger analysis in background
     # Note: We reuse project_id as analysis_id for simplicity in MVP
     # In production, each analysis would have its own unique ID
-    analysis_id = f"{project_id}-{int(datetime.utcnow().timestamp())}"
-    background_tasks.add_task(run_analysis, project_id)
+    analysis_id = f"{project_id}-{int(time.time())}"
+    background_tasks.add_task(run_analysis, project_id, force=force)
 
     return AnalysisStartResponse(
         analysis_id=analysis_id,
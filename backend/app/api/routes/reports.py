@@ -18,6 +18,7 @@ from app.schemas.report import (
     ReportType,
     ReportContent,
     ReportSection,
+    REPORT_LIST_ADAPTER,
 )
 from app.schemas.project import ProjectStatus
 from app.services.report_generator import ReportGenerator
@@ -38,17 +39,16 @@ async def list_reports(project_id: str, db: Session = Depends(get_db)):
     # Get existing reports from database
     reports = db.query(Report).filter(Report.project_id == project_id).all()
 
-    items = []
-    for report in reports:
-        items.append(
-            ReportListItem(
-                id=report.id,
-                type=ReportType(report.type),
-                title=report.title,
-                model_used=report.model_used,
-                generated_at=report.created_at,
-            )
-        )
+    items = REPORT_LIST_ADAPTER.validate_python([
+        {
+            "id": report.id,
+            "type": report.type,
+            "title": report.title,
+            "model_used": report.model_used,
+            "generated_at": report.created_at,
+        }
+        for report in reports
+    ])
 
     # If no reports exist but project is ready, show available report types
     if not items and project.status == ProjectStatus.ready:
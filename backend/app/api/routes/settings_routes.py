@@ -34,6 +34,7 @@ from app.schemas.settings import (
     OpenRouterModel,
     OpenRouterPricing,
 )
+from app.api.responses import ORJSONResponse
 from app.config import settings
 from app.database import get_db
 from app.services.llm import get_llm_provider, get_embedding_provider, reload_provider
@@ -45,6 +46,13 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Trust boundary: responses assembled purely from app config, ORM rows and
+# hardware detection use model_construct() and skip input validation. Request
+# bodies (SettingsUpdate, LLMConfigUpdate, TestConnectionRequest, ...) are
+# untrusted and always go through normal validation. The hottest read-only
+# endpoints return an ORJSONResponse directly, bypassing FastAPI's
+# response_model re-validation and jsonable_encoder pass.
+
 
 # Additional schemas for model management
 class ModelListResponse(BaseModel):
@@ -85,28 +93,29 @@ async def get_settings():
     llm_healthy = await llm.health_check()
     embedding_healthy = await embedding.health_check()
 
-    return SettingsResponse(
-        llm=LLMSettings(
+    response = SettingsResponse.model_construct(
+        llm=LLMSettings.model_construct(
             provider=settings.llm_provider,
             model=settings.llm_model,
             status="ready" if llm_healthy else "unavailable",
-            capabilities=LLMCapabilities(
+            capabilities=LLMCapabilities.model_construct(
                 max_context_length=4096,
                 supports_streaming=True
             ),
             base_url=settings.llm_base_url
         ),
-        embedding=EmbeddingSettings(
+        embedding=EmbeddingSettings.model_construct(
             model=settings.embedding_model,
             dimensions=settings.embedding_dimensions,
             status="ready" if embedding_healthy else "unavailable"
         ),
-        analysis=AnalysisSettings(
+        analysis=AnalysisSettings.model_construct(
             supported_languages=["python", "javascript", "typescript"],
             max_file_size_mb=settings.max_file_size_mb,
             max_repo_size_mb=settings.max_repo_size_mb
         )
     )
+    return ORJSONResponse(response.model_dump(mode="json"))
 
 
 @router.put("", response_model=SettingsResponse)
@@ -306,7 +315,7 @@ async def get_hardware_info():
     """
     hardware = await detect_hardware()
 
-    return HardwareInfoResponse(
+    response = HardwareInfoResponse.model_construct(
         gpu=GPUInfoResponse(
             detected=hardware.gpu.detected,
             name=hardware.gpu.name,
@@ -322,7 +331,7 @@ async def get_hardware_info():
             ram_total_gb=hardware.cpu.ram_total_gb,
             ram_available_gb=hardware.cpu.ram_available_gb,
         ),
-        recommendations=RecommendationsResponse(
+        recommendations=RecommendationsResponse.model_construct(
             max_model_params=hardware.recommendations.max_model_params,
             recommended_models=[
                 ModelRecommendationResponse(name=m.name, reason=m.reason)
@@ -331,6 +340,7 @@ async def get_hardware_info():
             inference_mode=hardware.recommendations.inference_mode,
         ),
     )
+    return ORJSONResponse(response.model_dump(mode="json"))
 
 
 # -------------------------------------------------------------------------
@@ -352,7 +362,7 @@ async def get_llm_config(db: Session = Depends(get_db)):
     if settings_model.last_health_status is not None:
         status = "ready" if settings_model.last_health_status else "unavailable"
 
-    return LLMConfigResponse(
+    return LLMConfigResponse.model_construct(
         provider_type=settings_model.provider_type,
         model=settings_model.model,
         base_url=settings_model.base_url,
@@ -497,23 +507,23 @@ async def list_openrouter_models(
     try:
         models = await service.list_openrouter_models(api_key)
 
-        return OpenRouterModelsResponse(
-            models=[
-                OpenRouterModel(
-                    id=m.id,
-                    name=m.name,
-                    provider=m.provider,
-                    context_length=m.context_length,
-                    pricing=OpenRouterPricing(
-                        input_per_million=m.pricing.get("input_per_million", 0),
-                        output_per_million=m.pricing.get("output_per_million", 0),
-                    ),
-                    capabilities=m.capabilities,
-                    description=m.description,
-                )
-                for m in models
-            ]
-        )
+        items = [
+            OpenRouterModel(
+                id=m.id,
+                name=m.name,
+                provider=m.provider,
+                context_length=m.context_length,
+                pricing=OpenRouterPricing(
+                    input_per_million=m.pricing.get("input_per_million", 0),
+                    output_per_million=m.pricing.get("output_per_million", 0),
+                ),
+                capabilities=m.capabilities,
+                description=m.description,
+            )
+            for m in models
+        ]
+        body = OpenRouterModelsResponse(models=items).model_dump_json()
+        return ORJSONResponse(body.encode())
 
     except ValueError as e:
         error_msg = str(e)
@@ -1,6 +1,6 @@
 """Application configuration."""
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional
 
 
@@ -40,6 +40,9 @@ class Settings(BaseSettings):
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
     embedding_dimensions: int = 384
 
+    # Analysis
+    parse_cache_enabled: bool = True  # Reuse per-file results across re-analyses
+
     # Debug settings
     debug_analysis_delay: int = 0  # Seconds to delay between analysis phases (0 to disable)
 
@@ -53,8 +56,7 @@ class Settings(BaseSettings):
     max_search_query_length: int = 500
     max_search_limit: int = 100
 
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(env_file=".env")
 
 
 settings = Settings()
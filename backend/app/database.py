@@ -1,27 +1,110 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import JSON, String, TypeDecorator, create_engine, make_url
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
+
+def json_serializer(value) -> str:
+    """Serialize JSON column values with orjson (SQLAlchemy expects str)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+json_deserializer = orjson.loads
+
 # Create SQLite database engine
 # check_same_thread=False is needed for FastAPI to work with SQLite
 # Use DATABASE_URL from env if set, otherwise use default local path
 SQLALCHEMY_DATABASE_URL = settings.database_url or f"sqlite:///./{settings.database_name}"
 
+# Connection pool sizing, so concurrent analyses (each holding a session for
+# its whole run) don't wait on the default 5 + 10 connections. Pre-ping and
+# recycle replace stale connections at checkout instead of failing mid-run.
+POOL_OPTIONS = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_timeout": 30,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
+# In-memory SQLite uses a single-connection pool that takes none of these
+_in_memory = make_url(SQLALCHEMY_DATABASE_URL).database in (None, "", ":memory:")
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    echo=False  # Set to True for SQL query logging during development
+    query_cache_size=1200,  # Compiled statement cache (default 500)
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
+    echo=False,  # Set to True for SQL query logging during development
+    **({} if _in_memory else POOL_OPTIONS),
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: sessions are short-lived (per request / per task), so
+# objects keep their loaded state after commit instead of re-SELECTing on the
+# next attribute access. Columns written with SQL expressions (func.now(),
+# onupdate defaults) are still expired by the flush and reload on access.
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+)
 
 # Base class for models
 Base = declarative_base()
 
+# JSON column type: binary JSONB on PostgreSQL, plain JSON elsewhere (SQLite)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class StringEnum(TypeDecorator):
+    """
+    Enum column type stored as VARCHAR(32).
+
+    No native ENUM type or CHECK constraint is created. Members are stored by
+    name (the same representation SQLAlchemy's ``Enum`` uses); like ``Enum``,
+    writing a value that is neither a member name nor a member value raises
+    LookupError. Rows are mapped back with a single lookup in the enum's
+    prebuilt name->member map instead of going through the generic Enum
+    result processor.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def __init__(self, enum_class):
+        super().__init__(length=32)
+        self.enum_class = enum_class
+        self._members = enum_class._member_map_
+        self._values = enum_class._value2member_map_
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, self.enum_class):
+            return value.name
+        if value in self._members:
+            return value
+        member = self._values.get(value)
+        if member is None:
+            raise LookupError(
+                f"{value!r} is not among the defined enum values. "
+                f"Enum name: {self.enum_class.__name__}. "
+                f"Possible values: {', '.join(self._members)}"
+            )
+        return member.name
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[value]
+
 
 def get_db():
     """
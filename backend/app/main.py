@@ -8,9 +8,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.config import settings
+from app.api.responses import ORJSONResponse
 from app.api.routes import projects, analysis, reports, diagrams, files, search, chat, settings_routes, admin
 from app.database import init_db, SessionLocal
 from app.services.llm import reload_provider, close_providers
+from app.services.analyzer.pool import shutdown_analysis_pool
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +25,7 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.version,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -31,7 +34,7 @@ app = FastAPI(
 async def startup_event():
     """Initialize database and LLM provider on application startup."""
     init_db()
-    print(f"✓ Database initialized: {settings.database_name}")
+    logging.info("Database initialized: %s", settings.database_name)
 
     # Initialize LLM provider from persisted settings
     await initialize_llm_from_settings()
@@ -67,27 +70,29 @@ async def initialize_llm_from_settings():
                 }
 
                 await reload_provider(config)
-                print(
-                    f"✓ LLM provider initialized from settings: "
-                    f"{settings_model.provider_type.value} / {settings_model.model}"
+                logging.info(
+                    "LLM provider initialized from settings: %s / %s",
+                    settings_model.provider_type.value,
+                    settings_model.model,
                 )
             else:
                 # No saved settings, use environment defaults
-                print("✓ LLM provider using environment defaults (no saved settings)")
+                logging.info("LLM provider using environment defaults (no saved settings)")
 
         finally:
             db.close()
 
     except Exception as e:
         logging.warning(f"Could not initialize LLM from settings: {e}")
-        print("✓ LLM provider using environment defaults")
+        logging.info("LLM provider using environment defaults")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on application shutdown."""
     await close_providers()
-    print("✓ Providers closed")
+    logging.info("Providers closed")
+    shutdown_analysis_pool()
 
 # Configure CORS
 app.add_middleware(
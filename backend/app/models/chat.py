@@ -1,9 +1,9 @@
 """Chat database models for persistent conversation history."""
 
-from sqlalchemy import Column, String, DateTime, JSON, Text, Boolean, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Text, Boolean, ForeignKey
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, JSONType, StringEnum
 import enum
 
 
@@ -77,12 +77,12 @@ class ChatMessage(Base):
     session_id = Column(String, ForeignKey("chat_sessions.id"), nullable=False, index=True)
 
     # Message content
-    role = Column(SQLEnum(MessageRole), nullable=False)
+    role = Column(StringEnum(MessageRole), nullable=False)
     content = Column(Text, nullable=False)
 
     # Source citations (for assistant messages from RAG)
     # Format: [{"file_path": str, "start_line": int, "end_line": int, "snippet": str, "relevance_score": float}]
-    sources = Column(JSON, nullable=True)
+    sources = Column(JSONType, nullable=True)
 
     # Timestamp
     created_at = Column(DateTime, nullable=False, default=func.now(), server_default=func.now())
@@ -91,7 +91,9 @@ class ChatMessage(Base):
     session = relationship("ChatSession", back_populates="messages")
 
     def __repr__(self):
-        content_preview = self.content[:50] + "..." if len(self.content) > 50 else self.content
+        # Slice once so the preview cost is bounded regardless of message size
+        head = (self.content or "")[:51]
+        content_preview = head if len(head) <= 50 else head[:50] + "..."
         return f"<ChatMessage(id={self.id}, role={self.role}, content={content_preview})>"
 
     def to_dict(self):
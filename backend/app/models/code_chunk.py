@@ -2,10 +2,10 @@
 
 import enum
 
-from sqlalchemy import Column, String, DateTime, Integer, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Integer
 from sqlalchemy.sql import func
 
-from app.database import Base
+from app.database import Base, StringEnum
 
 
 class ChunkType(str, enum.Enum):
@@ -35,7 +35,7 @@ class CodeChunk(Base):
     language = Column(String, nullable=True)
 
     # Chunk information
-    chunk_type = Column(SQLEnum(ChunkType), nullable=False)
+    chunk_type = Column(StringEnum(ChunkType), nullable=False)
     start_line = Column(Integer, nullable=False)
     end_line = Column(Integer, nullable=False)
 
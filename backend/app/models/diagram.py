@@ -1,16 +1,43 @@
 """Diagram database model."""
 
-from sqlalchemy import Column, String, DateTime, JSON, Text, ForeignKey, Enum as SQLEnum
+import operator
+
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, JSONType, StringEnum
 from app.schemas.diagram import DiagramType
 
 
+# Serialized keys for Diagram.to_dict(); diagram_metadata is exposed as "metadata"
+_DIAGRAM_KEYS = (
+    "id",
+    "project_id",
+    "type",
+    "title",
+    "mermaid_code",
+    "metadata",
+    "created_at",
+)
+_DIAGRAM_GET = operator.attrgetter(
+    "id",
+    "project_id",
+    "type",
+    "title",
+    "mermaid_code",
+    "diagram_metadata",
+    "created_at",
+)
+
+
 class Diagram(Base):
     """Diagram model - stores generated Mermaid diagrams for a project."""
 
     __tablename__ = "diagrams"
+    __table_args__ = (
+        # Diagrams are always looked up by project and type together
+        Index("ix_diagrams_project_type", "project_id", "type"),
+    )
 
     # Primary key
     id = Column(String, primary_key=True, index=True)
@@ -19,7 +46,7 @@ class Diagram(Base):
     project_id = Column(String, ForeignKey("projects.id"), nullable=False, index=True)
 
     # Diagram type
-    type = Column(SQLEnum(DiagramType), nullable=False)
+    type = Column(StringEnum(DiagramType), nullable=False)
 
     # Diagram content
     title = Column(String, nullable=False)
@@ -27,22 +54,19 @@ class Diagram(Base):
 
     # Metadata for interactivity (node positions, colors, file mappings)
     # Note: 'metadata' is reserved by SQLAlchemy, so we use 'diagram_metadata'
-    diagram_metadata = Column(JSON, nullable=True)
+    diagram_metadata = Column(JSONType, nullable=True)
 
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=func.now(), server_default=func.now())
 
+    # Relationships
+    project = relationship("Project", back_populates="diagrams")
+
+    _REPR = "<Diagram(id=%s, type=%s, project_id=%s)>"
+
     def __repr__(self):
-        return f"<Diagram(id={self.id}, type={self.type}, project_id={self.project_id})>"
+        return self._REPR % (self.id, self.type, self.project_id)
 
     def to_dict(self):
         """Convert model to dictionary for API responses."""
-        return {
-            "id": self.id,
-            "project_id": self.project_id,
-            "type": self.type,
-            "title": self.title,
-            "mermaid_code": self.mermaid_code,
-            "metadata": self.diagram_metadata,
-            "created_at": self.created_at,
-        }
+        return dict(zip(_DIAGRAM_KEYS, _DIAGRAM_GET(self)))
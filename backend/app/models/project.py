@@ -1,13 +1,35 @@
 """Project database model."""
 
-from sqlalchemy import Column, String, DateTime, JSON, Enum as SQLEnum
+import operator
+
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
-from app.database import Base
+from app.database import Base, JSONType, StringEnum
 from app.schemas.project import SourceType, ProjectStatus
 import enum
 
 
+# Serialized field order for Project.to_dict(); one C-level attrgetter per row
+_PROJECT_KEYS = (
+    "id",
+    "name",
+    "description",
+    "source_type",
+    "source",
+    "branch",
+    "local_path",
+    "status",
+    "settings",
+    "stats",
+    "created_at",
+    "updated_at",
+    "last_analyzed_at",
+)
+_PROJECT_GET = operator.attrgetter(*_PROJECT_KEYS)
+
+
 class Project(Base):
     """Project model - represents a code repository being analyzed."""
 
@@ -21,40 +43,32 @@ class Project(Base):
     description = Column(String, nullable=True)
 
     # Source information
-    source_type = Column(SQLEnum(SourceType), nullable=False)
+    source_type = Column(StringEnum(SourceType), nullable=False)
     source = Column(String, nullable=False)  # Git URL or local path
     branch = Column(String, nullable=False, default="main")
     local_path = Column(String, nullable=True)  # Where repo is cloned
 
     # Status
-    status = Column(SQLEnum(ProjectStatus), nullable=False, default=ProjectStatus.pending)
+    status = Column(StringEnum(ProjectStatus), nullable=False, default=ProjectStatus.pending)
 
     # Settings and stats (stored as JSON)
-    settings = Column(JSON, nullable=True)
-    stats = Column(JSON, nullable=True)
+    settings = Column(JSONType, nullable=True)
+    stats = Column(JSONType, nullable=True)
 
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=func.now(), server_default=func.now())
     updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now(), server_default=func.now())
     last_analyzed_at = Column(DateTime, nullable=True)
 
+    # Relationships - never lazy-loaded; callers opt in with selectinload()
+    diagrams = relationship("Diagram", back_populates="project", lazy="raise", passive_deletes=True)
+    reports = relationship("Report", back_populates="project", lazy="raise", passive_deletes=True)
+
+    _REPR = "<Project(id=%s, name=%s, status=%s)>"
+
     def __repr__(self):
-        return f"<Project(id={self.id}, name={self.name}, status={self.status})>"
+        return self._REPR % (self.id, self.name, self.status)
 
     def to_dict(self):
         """Convert model to dictionary for API responses."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "source_type": self.source_type,
-            "source": self.source,
-            "branch": self.branch,
-            "local_path": self.local_path,
-            "status": self.status,
-            "settings": self.settings,
-            "stats": self.stats,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "last_analyzed_at": self.last_analyzed_at,
-        }
+        return dict(zip(_PROJECT_KEYS, _PROJECT_GET(self)))
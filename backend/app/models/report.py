@@ -1,15 +1,39 @@
 """Report database model."""
 
-from sqlalchemy import Column, String, DateTime, JSON, ForeignKey, Text, Integer
+import operator
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Integer, Index
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
-from app.database import Base
+from app.database import Base, JSONType
+
+
+# Serialized field order for Report.to_dict()
+_REPORT_KEYS = (
+    "id",
+    "project_id",
+    "type",
+    "title",
+    "content",
+    "sections",
+    "report_metadata",
+    "model_used",
+    "generation_time_ms",
+    "created_at",
+    "updated_at",
+)
+_REPORT_GET = operator.attrgetter(*_REPORT_KEYS)
 
 
 class Report(Base):
     """Report model - stores generated analysis reports."""
 
     __tablename__ = "reports"
+    __table_args__ = (
+        # Reports are always looked up by project and type together
+        Index("ix_reports_project_type", "project_id", "type"),
+    )
 
     # Primary key
     id = Column(String, primary_key=True, index=True)
@@ -18,7 +42,7 @@ class Report(Base):
     project_id = Column(String, ForeignKey("projects.id"), nullable=False, index=True)
 
     # Report type: summary, architecture, dependencies, developer
-    type = Column(String, nullable=False, index=True)
+    type = Column(String, nullable=False)
 
     # Report title
     title = Column(String, nullable=False)
@@ -27,10 +51,10 @@ class Report(Base):
     content = Column(Text, nullable=False)
 
     # Structured sections (JSON array of {id, title, content})
-    sections = Column(JSON, nullable=True)
+    sections = Column(JSONType, nullable=True)
 
     # Metadata (languages, frameworks, patterns, etc.)
-    report_metadata = Column(JSON, nullable=True)
+    report_metadata = Column(JSONType, nullable=True)
 
     # Generation info
     model_used = Column(String, nullable=True)  # LLM model used
@@ -40,21 +64,14 @@ class Report(Base):
     created_at = Column(DateTime, nullable=False, default=func.now(), server_default=func.now())
     updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now(), server_default=func.now())
 
+    # Relationships
+    project = relationship("Project", back_populates="reports")
+
+    _REPR = "<Report(id=%s, project_id=%s, type=%s)>"
+
     def __repr__(self):
-        return f"<Report(id={self.id}, project_id={self.project_id}, type={self.type})>"
+        return self._REPR % (self.id, self.project_id, self.type)
 
     def to_dict(self):
         """Convert model to dictionary for API responses."""
-        return {
-            "id": self.id,
-            "project_id": self.project_id,
-            "type": self.type,
-            "title": self.title,
-            "content": self.content,
-            "sections": self.sections,
-            "report_metadata": self.report_metadata,
-            "model_used": self.model_used,
-            "generation_time_ms": self.generation_time_ms,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-        }
+        return dict(zip(_REPORT_KEYS, _REPORT_GET(self)))
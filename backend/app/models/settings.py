@@ -1,12 +1,29 @@
 """Settings database models."""
 
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Enum as SQLEnum
+import operator
+
+from sqlalchemy import Column, String, DateTime, Boolean, Text
 from sqlalchemy.sql import func
 
-from app.database import Base
+from app.database import Base, StringEnum
 from app.schemas.settings import ProviderType
 
 
+# Plain column fields for LLMSettingsModel.to_dict(); provider_type and
+# has_api_key are derived separately so the encrypted key never leaks out
+_SETTINGS_KEYS = (
+    "id",
+    "model",
+    "base_url",
+    "api_format",
+    "created_at",
+    "updated_at",
+    "last_health_check",
+    "last_health_status",
+)
+_SETTINGS_GET = operator.attrgetter(*_SETTINGS_KEYS)
+
+
 class LLMSettingsModel(Base):
     """Persistent LLM settings.
 
@@ -21,7 +38,7 @@ class LLMSettingsModel(Base):
 
     # Provider configuration
     provider_type = Column(
-        SQLEnum(ProviderType),
+        StringEnum(ProviderType),
         nullable=False,
         default=ProviderType.OLLAMA_CONTAINER,
     )
@@ -40,23 +57,14 @@ class LLMSettingsModel(Base):
     last_health_check = Column(DateTime, nullable=True)
     last_health_status = Column(Boolean, nullable=True)
 
+    _REPR = "<LLMSettingsModel(id=%s, provider_type=%s, model=%s)>"
+
     def __repr__(self) -> str:
-        return (
-            f"<LLMSettingsModel(id={self.id}, provider_type={self.provider_type}, "
-            f"model={self.model})>"
-        )
+        return self._REPR % (self.id, self.provider_type, self.model)
 
     def to_dict(self) -> dict:
         """Convert model to dictionary (excludes encrypted API key)."""
-        return {
-            "id": self.id,
-            "provider_type": self.provider_type.value if self.provider_type else None,
-            "model": self.model,
-            "base_url": self.base_url,
-            "api_format": self.api_format,
-            "has_api_key": bool(self.api_key_encrypted),
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "last_health_check": self.last_health_check,
-            "last_health_status": self.last_health_status,
-        }
+        result = dict(zip(_SETTINGS_KEYS, _SETTINGS_GET(self)))
+        result["provider_type"] = self.provider_type.value if self.provider_type else None
+        result["has_api_key"] = bool(self.api_key_encrypted)
+        return result
@@ -1,9 +1,15 @@
 """Settings repository for database operations."""
 
 import logging
-from datetime import datetime
-from typing import Optional
-
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.settings import LLMSettingsModel
@@ -15,6 +21,32 @@ logger = logging.getLogger(__name__)
 # Default settings ID (singleton pattern)
 DEFAULT_SETTINGS_ID = "default"
 
+# Built once so the compiled SELECT is served from the engine's statement cache
+_GET_SETTINGS_STMT = select(LLMSettingsModel).where(
+    LLMSettingsModel.id == bindparam("id")
+)
+
+# Health probes reporting an unchanged status within this window are not
+# re-committed; the row keeps the timestamp of the last persisted probe
+HEALTH_WRITE_INTERVAL_SECONDS = 5.0
+
+
+@dataclass
+class _LastHealthWrite:
+    """Last health status committed for a settings row (process-wide)."""
+
+    is_healthy: bool
+    written_at: float  # time.monotonic() of the commit
+
+
+_last_health_writes: Dict[str, _LastHealthWrite] = {}
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
 
 class SettingsRepository:
     """Repository for LLM settings persistence.
@@ -39,9 +71,9 @@ class SettingsRepository:
         Returns:
             LLMSettingsModel if settings exist, None otherwise.
         """
-        return self.db.query(LLMSettingsModel).filter(
-            LLMSettingsModel.id == DEFAULT_SETTINGS_ID
-        ).first()
+        return self.db.execute(
+            _GET_SETTINGS_STMT, {"id": DEFAULT_SETTINGS_ID}
+        ).scalar_one_or_none()
 
     def get_or_create_llm_settings(self) -> LLMSettingsModel:
         """Get existing LLM settings or create default.
@@ -52,19 +84,48 @@ class SettingsRepository:
         settings = self.get_llm_settings()
 
         if settings is None:
-            logger.info("Creating default LLM settings")
-            settings = LLMSettingsModel(
-                id=DEFAULT_SETTINGS_ID,
-                provider_type=ProviderType.OLLAMA_CONTAINER,
-                model="qwen2.5-coder:7b",
-                base_url="http://localhost:11434",
-            )
-            self.db.add(settings)
-            self.db.commit()
-            self.db.refresh(settings)
+            self._insert_default_settings()
+            settings = self.get_llm_settings()
 
         return settings
 
+    def _insert_default_settings(self) -> None:
+        """Insert the default settings row unless it already exists.
+
+        Uses a single ``INSERT ... ON CONFLICT DO NOTHING`` so concurrent
+        first-time callers cannot race each other into an IntegrityError.
+        Dialects without that construct fall back to a plain insert, with a
+        conflicting insert rolled back.
+        """
+        values = {
+            "id": DEFAULT_SETTINGS_ID,
+            "provider_type": ProviderType.OLLAMA_CONTAINER,
+            "model": "qwen2.5-coder:7b",
+            "base_url": "http://localhost:11434",
+        }
+
+        insert = _UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if insert is None:
+            try:
+                self.db.add(LLMSettingsModel(**values))
+                self.db.commit()
+            except IntegrityError:
+                # Another caller created the row first
+                self.db.rollback()
+                return
+            logger.info("Created default LLM settings")
+            return
+
+        stmt = insert(LLMSettingsModel).values(**values).on_conflict_do_nothing(
+            index_elements=["id"]
+        )
+
+        result = self.db.execute(stmt)
+        self.db.commit()
+
+        if result.rowcount:
+            logger.info("Created default LLM settings")
+
     def save_llm_settings(
         self,
         provider_type: ProviderType,
@@ -77,6 +138,10 @@ class SettingsRepository:
 
         If an API key is provided, it will be encrypted before storage.
 
+        The row is written with a single ``UPDATE ... RETURNING`` (or an
+        UPDATE and a reload, on dialects without RETURNING); the default
+        row is only inserted first if the update matched nothing.
+
         Args:
             provider_type: The provider type (ollama_container, openrouter_byok, etc.)
             model: The model name/identifier
@@ -87,30 +152,51 @@ class SettingsRepository:
         Returns:
             The saved LLMSettingsModel.
         """
-        settings = self.get_or_create_llm_settings()
-
-        # Update fields
-        settings.provider_type = provider_type
-        settings.model = model
-        settings.base_url = base_url
-        settings.api_format = api_format
+        values = {
+            "provider_type": provider_type,
+            "model": model,
+            "base_url": base_url,
+            "api_format": api_format,
+            # Reset health check cache on settings change
+            "last_health_check": None,
+            "last_health_status": None,
+        }
 
         # Encrypt API key if provided
         if api_key is not None:
             if api_key:
-                settings.api_key_encrypted = self.secrets.encrypt(api_key)
+                values["api_key_encrypted"] = self.secrets.encrypt(api_key)
                 logger.debug("API key encrypted and saved")
             else:
                 # Empty string means clear the API key
-                settings.api_key_encrypted = None
+                values["api_key_encrypted"] = None
                 logger.debug("API key cleared")
 
-        # Reset health check cache on settings change
-        settings.last_health_check = None
-        settings.last_health_status = None
+        stmt = (
+            update(LLMSettingsModel)
+            .where(LLMSettingsModel.id == DEFAULT_SETTINGS_ID)
+            .values(**values)
+        )
+
+        if self.db.get_bind().dialect.update_returning:
+            stmt = stmt.returning(LLMSettingsModel).execution_options(
+                populate_existing=True
+            )
+            settings = self.db.execute(stmt).scalar_one_or_none()
+            if settings is None:
+                self._insert_default_settings()
+                settings = self.db.execute(stmt).scalar_one()
+        else:
+            # No RETURNING on this dialect (e.g. MySQL): update, then reload
+            if not self.db.execute(stmt).rowcount:
+                self._insert_default_settings()
+                self.db.execute(stmt)
+            settings = self.db.execute(
+                _GET_SETTINGS_STMT.execution_options(populate_existing=True),
+                {"id": DEFAULT_SETTINGS_ID},
+            ).scalar_one()
 
         self.db.commit()
-        self.db.refresh(settings)
 
         logger.info(
             f"LLM settings saved: provider={provider_type.value}, model={model}"
@@ -121,6 +207,10 @@ class SettingsRepository:
     def get_decrypted_api_key(self, settings: LLMSettingsModel) -> Optional[str]:
         """Decrypt and return the API key.
 
+        The plaintext is memoized on the settings instance (as an unmapped
+        attribute) together with the ciphertext it came from, so repeated
+        calls only pay for Fernet decryption when the stored key changes.
+
         Args:
             settings: The LLM settings model with encrypted key
 
@@ -130,15 +220,23 @@ class SettingsRepository:
         Raises:
             InvalidToken: If the encrypted key is corrupted or tampered with.
         """
-        if not settings.api_key_encrypted:
+        ciphertext = settings.api_key_encrypted
+        if not ciphertext:
             return None
 
+        cached = settings.__dict__.get("_decrypted_api_key")
+        if cached is not None and cached[0] == ciphertext:
+            return cached[1]
+
         try:
-            return self.secrets.decrypt(settings.api_key_encrypted)
+            api_key = self.secrets.decrypt(ciphertext)
         except InvalidToken:
             logger.error("Failed to decrypt API key - key may be corrupted")
             raise
 
+        settings.__dict__["_decrypted_api_key"] = (ciphertext, api_key)
+        return api_key
+
     def update_health_status(
         self,
         settings: LLMSettingsModel,
@@ -146,13 +244,29 @@ class SettingsRepository:
     ) -> None:
         """Update the cached health check status.
 
+        Repeated probes with the same result are coalesced: if the row
+        already holds ``is_healthy`` and was written less than
+        ``HEALTH_WRITE_INTERVAL_SECONDS`` ago, no commit is issued.
+
         Args:
             settings: The settings model to update
             is_healthy: Whether the provider is healthy
         """
-        settings.last_health_check = datetime.utcnow()
+        now = time.monotonic()
+        last = _last_health_writes.get(settings.id)
+        if (
+            last is not None
+            and last.is_healthy == is_healthy
+            and settings.last_health_status == is_healthy
+            and now - last.written_at < HEALTH_WRITE_INTERVAL_SECONDS
+        ):
+            return
+
+        # Naive UTC, since the column stores no time zone
+        settings.last_health_check = datetime.now(timezone.utc).replace(tzinfo=None)
         settings.last_health_status = is_healthy
         self.db.commit()
+        _last_health_writes[settings.id] = _LastHealthWrite(is_healthy, now)
 
     def delete_llm_settings(self) -> bool:
         """Delete LLM settings (reset to default on next access).
@@ -1,83 +1,65 @@
-"""Pydantic schemas for request/response validation."""
+"""Pydantic schemas for request/response validation.
 
-from .project import (
-    ProjectCreate,
-    ProjectUpdate,
-    ProjectResponse,
-    ProjectListResponse,
-    ProjectStats,
-)
-from .analysis import (
-    AnalysisCreate,
-    AnalysisResponse,
-    AnalysisProgress,
-    AnalysisStep,
-)
-from .report import (
-    ReportResponse,
-    ReportListResponse,
-    ReportContent,
-)
-from .diagram import (
-    DiagramResponse,
-    DiagramListResponse,
-)
-from .chat import (
-    ChatRequest,
-    ChatResponse,
-    ChatSessionResponse,
-    ChatSessionListResponse,
-)
-from .search import (
-    SearchRequest,
-    SearchResponse,
-    SearchResult,
-)
-from .files import (
-    FileTreeResponse,
-    FileContentResponse,
-    FileNode,
-)
-from .settings import (
-    SettingsResponse,
-    SettingsUpdate,
-    ProvidersResponse,
-)
+Submodules are imported lazily (PEP 562): importing ``app.schemas.project``
+no longer pulls in every other schema module, and names re-exported here
+are resolved on first attribute access.
+"""
 
-__all__ = [
+import importlib
+
+# Public name -> submodule that defines it
+_SUBMODULES = {
     # Project
-    "ProjectCreate",
-    "ProjectUpdate",
-    "ProjectResponse",
-    "ProjectListResponse",
-    "ProjectStats",
+    "ProjectCreate": "project",
+    "ProjectUpdate": "project",
+    "ProjectResponse": "project",
+    "ProjectListResponse": "project",
+    "ProjectStats": "project",
     # Analysis
-    "AnalysisCreate",
-    "AnalysisResponse",
-    "AnalysisProgress",
-    "AnalysisStep",
+    "AnalysisCreate": "analysis",
+    "AnalysisResponse": "analysis",
+    "AnalysisProgress": "analysis",
+    "AnalysisStep": "analysis",
     # Report
-    "ReportResponse",
-    "ReportListResponse",
-    "ReportContent",
+    "ReportResponse": "report",
+    "ReportListResponse": "report",
+    "ReportContent": "report",
     # Diagram
-    "DiagramResponse",
-    "DiagramListResponse",
+    "DiagramResponse": "diagram",
+    "DiagramListResponse": "diagram",
     # Chat
-    "ChatRequest",
-    "ChatResponse",
-    "ChatSessionResponse",
-    "ChatSessionListResponse",
+    "ChatRequest": "chat",
+    "ChatResponse": "chat",
+    "ChatSessionResponse": "chat",
+    "ChatSessionListResponse": "chat",
     # Search
-    "SearchRequest",
-    "SearchResponse",
-    "SearchResult",
+    "SearchRequest": "search",
+    "SearchResponse": "search",
+    "SearchResult": "search",
     # Files
-    "FileTreeResponse",
-    "FileContentResponse",
-    "FileNode",
+    "FileTreeResponse": "files",
+    "FileContentResponse": "files",
+    "FileNode": "files",
     # Settings
-    "SettingsResponse",
-    "SettingsUpdate",
-    "ProvidersResponse",
-]
+    "SettingsResponse": "settings",
+    "SettingsUpdate": "settings",
+    "ProvidersResponse": "settings",
+}
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access to a re-exported name."""
+    try:
+        submodule = _SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
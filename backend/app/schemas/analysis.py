@@ -1,6 +1,6 @@
 """Analysis schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, List
 from datetime import datetime
 from enum import Enum
@@ -31,6 +31,8 @@ class AnalysisStep(BaseModel):
     duration_ms: Optional[int] = None
     details: Optional[Dict] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class AnalysisProgress(BaseModel):
     """Analysis progress."""
@@ -65,8 +67,7 @@ class AnalysisResponse(BaseModel):
     completed_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AnalysisStartResponse(BaseModel):
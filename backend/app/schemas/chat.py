@@ -1,6 +1,6 @@
 """Chat schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional, List, Dict
 from datetime import datetime
 from enum import Enum
@@ -57,8 +57,7 @@ class ChatResponse(BaseModel):
     response: ChatResponseContent
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChatMessage(BaseModel):
@@ -69,6 +68,8 @@ class ChatMessage(BaseModel):
     sources: Optional[List[ChatSource]] = None
     created_at: datetime
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ChatSessionResponse(BaseModel):
     """Chat session response."""
@@ -77,8 +78,7 @@ class ChatSessionResponse(BaseModel):
     messages: List[ChatMessage]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChatSessionListItem(BaseModel):
@@ -104,3 +104,6 @@ class ChatSessionUpdate(BaseModel):
     """Update chat session request."""
     title: Optional[str] = None
     is_active: Optional[bool] = None
+
+
+CHAT_SESSION_LIST_ADAPTER = TypeAdapter(List[ChatSessionListItem])
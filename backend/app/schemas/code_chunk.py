@@ -1,6 +1,6 @@
 """Code chunk schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -55,8 +55,7 @@ class ChunkResponse(BaseModel):
     content_hash: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChunkWithContent(BaseModel):
@@ -1,6 +1,6 @@
 """Diagram schemas."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Dict, List
 from datetime import datetime
 from enum import Enum
@@ -24,8 +24,7 @@ class DiagramResponse(BaseModel):
     metadata: Optional[Dict] = None
     generated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DiagramListItem(BaseModel):
@@ -1,6 +1,6 @@
 """File schemas."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -33,8 +33,7 @@ class FileTreeResponse(BaseModel):
     root: FileNode
     stats: FileTreeStats
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FileContentResponse(BaseModel):
@@ -48,5 +47,4 @@ class FileContentResponse(BaseModel):
     encoding: str = "utf-8"
     last_modified: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,7 +1,7 @@
 """Project schemas."""
 
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, List
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -24,9 +24,11 @@ class ProjectStatus(str, Enum):
 
 
 class ProjectSettings(BaseModel):
-    """Project settings."""
-    ignore_patterns: List[str] = Field(default_factory=lambda: ["*.log", "node_modules"])
-    analyze_languages: List[str] = Field(default_factory=lambda: ["python", "javascript", "typescript"])
+    """Project settings (immutable; defaults are shared tuples)."""
+    ignore_patterns: Tuple[str, ...] = ("*.log", "node_modules")
+    analyze_languages: Tuple[str, ...] = ("python", "javascript", "typescript")
+
+    model_config = ConfigDict(frozen=True)
 
 
 class LanguageStats(BaseModel):
@@ -76,8 +78,7 @@ class ProjectResponse(BaseModel):
     updated_at: datetime
     last_analyzed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ProjectListItem(BaseModel):
@@ -98,3 +99,7 @@ class ProjectListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+
+
+# Validates a whole page of list items in a single core-schema call
+PROJECT_LIST_ADAPTER = TypeAdapter(List[ProjectListItem])
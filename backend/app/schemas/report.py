@@ -1,6 +1,6 @@
 """Report schemas."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional, Dict, List
 from datetime import datetime
 from enum import Enum
@@ -38,8 +38,7 @@ class ReportResponse(BaseModel):
     model_used: Optional[str] = None
     generated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ReportListItem(BaseModel):
@@ -54,3 +53,6 @@ class ReportListItem(BaseModel):
 class ReportListResponse(BaseModel):
     """Report list response."""
     items: List[ReportListItem]
+
+
+REPORT_LIST_ADAPTER = TypeAdapter(List[ReportListItem])
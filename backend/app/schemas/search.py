@@ -1,6 +1,6 @@
 """Search schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict
 
 
@@ -36,6 +36,8 @@ class SearchResult(BaseModel):
     language: str
     context: Optional[SearchContext] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class SearchResponse(BaseModel):
     """Search response."""
@@ -44,5 +46,4 @@ class SearchResponse(BaseModel):
     total_results: int
     search_time_ms: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
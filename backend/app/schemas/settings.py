@@ -4,7 +4,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 
 
 class ProviderType(str, Enum):
@@ -51,8 +52,7 @@ class SettingsResponse(BaseModel):
     embedding: EmbeddingSettings
     analysis: AnalysisSettings
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SettingsUpdate(BaseModel):
@@ -73,7 +73,8 @@ class ProvidersResponse(BaseModel):
     providers: List[ProviderInfo]
 
 
-class ModelInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ModelInfo:
     """Model information."""
     name: str
     parameters: str
@@ -96,7 +97,8 @@ class TestConnectionResponse(BaseModel):
 
 
 # Hardware detection schemas
-class GPUInfoResponse(BaseModel):
+@dataclass(frozen=True, slots=True)
+class GPUInfoResponse:
     """GPU information response."""
     detected: bool
     name: Optional[str] = None
@@ -106,7 +108,8 @@ class GPUInfoResponse(BaseModel):
     compute_capability: Optional[str] = None
 
 
-class CPUInfoResponse(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CPUInfoResponse:
     """CPU information response."""
     name: str
     cores: int
@@ -115,7 +118,8 @@ class CPUInfoResponse(BaseModel):
     ram_available_gb: float
 
 
-class ModelRecommendationResponse(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ModelRecommendationResponse:
     """Model recommendation response."""
     name: str
     reason: str
@@ -164,15 +168,16 @@ class LLMConfigUpdate(BaseModel):
         description="API key (plain text, will be encrypted before storage)",
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "provider_type": "openrouter_byok",
                 "model": "anthropic/claude-3-haiku",
                 "base_url": "https://openrouter.ai/api/v1",
                 "api_key": "sk-or-v1-xxxxx",
             }
-        }
+        },
+    )
 
 
 class LLMConfigResponse(BaseModel):
@@ -207,9 +212,9 @@ class LLMConfigResponse(BaseModel):
         description="Timestamp of last health check",
     )
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "provider_type": "ollama_container",
                 "model": "qwen2.5-coder:7b",
@@ -218,7 +223,8 @@ class LLMConfigResponse(BaseModel):
                 "status": "ready",
                 "last_health_check": "2024-01-25T12:00:00Z",
             }
-        }
+        },
+    )
 
 
 class LLMConfigUpdateResponse(BaseModel):
@@ -230,8 +236,8 @@ class LLMConfigUpdateResponse(BaseModel):
     status: str = Field("unknown", description="Current provider status")
     reloaded: bool = Field(False, description="Whether the provider was reloaded")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "provider_type": "ollama_container",
@@ -239,7 +245,8 @@ class LLMConfigUpdateResponse(BaseModel):
                 "status": "ready",
                 "reloaded": True,
             }
-        }
+        },
+    )
 
 
 # Validation schemas
@@ -267,8 +274,8 @@ class LLMValidationResponse(BaseModel):
         None, description="Additional validation details"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "valid": True,
                 "provider_status": "ready",
@@ -283,30 +290,24 @@ class LLMValidationResponse(BaseModel):
                     },
                 },
             }
-        }
+        },
+    )
 
 
 # OpenRouter models schemas
-class OpenRouterPricing(BaseModel):
+@dataclass(frozen=True, slots=True)
+class OpenRouterPricing:
     """OpenRouter model pricing."""
 
     input_per_million: float = Field(..., description="Cost per million input tokens")
     output_per_million: float = Field(..., description="Cost per million output tokens")
 
 
-class OpenRouterModel(BaseModel):
-    """OpenRouter model information."""
-
-    id: str = Field(..., description="Model ID (e.g., anthropic/claude-3.5-sonnet)")
-    name: str = Field(..., description="Display name")
-    provider: str = Field(..., description="Provider name (e.g., anthropic)")
-    context_length: int = Field(..., description="Maximum context length in tokens")
-    pricing: OpenRouterPricing = Field(..., description="Model pricing")
-    capabilities: List[str] = Field(..., description="Model capabilities")
-    description: Optional[str] = Field(None, description="Model description")
-
-    class Config:
-        json_schema_extra = {
+@dataclass(
+    frozen=True,
+    slots=True,
+    config=ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "anthropic/claude-3.5-sonnet",
                 "name": "Claude 3.5 Sonnet",
@@ -320,6 +321,18 @@ class OpenRouterModel(BaseModel):
                 "description": "Most capable Claude model",
             }
         }
+    ),
+)
+class OpenRouterModel:
+    """OpenRouter model information."""
+
+    id: str = Field(..., description="Model ID (e.g., anthropic/claude-3.5-sonnet)")
+    name: str = Field(..., description="Display name")
+    provider: str = Field(..., description="Provider name (e.g., anthropic)")
+    context_length: int = Field(..., description="Maximum context length in tokens")
+    pricing: OpenRouterPricing = Field(..., description="Model pricing")
+    capabilities: List[str] = Field(..., description="Model capabilities")
+    description: Optional[str] = Field(None, description="Model description")
 
 
 class OpenRouterModelsResponse(BaseModel):
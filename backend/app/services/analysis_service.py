@@ -2,93 +2,213 @@
 
 import asyncio
 import logging
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
 from app.models.project import Project
 from app.schemas.project import ProjectStatus, SourceType
 from app.services.git_service import GitService
-from app.services.analyzer.generic_analyzer import GenericAnalyzer
-from app.services.chunking_service import ChunkingService
-from app.services.llm import get_embedding_provider, get_vector_service
+from app.services.analyzer.generic_analyzer import analyze_repository
+from app.services.analyzer.utils.tree_sitter_utils import load_languages
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# How long a successful embedding/vector health check is trusted, so bursts
+# of re-analyses don't re-probe the same endpoints every time
+HEALTH_CACHE_TTL_SECONDS = 10.0
+
+# Endpoint -> time.monotonic() deadline until which it is considered healthy
+_healthy_until: Dict[str, float] = {}
+
+# Statuses in which an analysis is in progress for a project
+_ACTIVE_STATUSES = frozenset({
+    ProjectStatus.cloning,
+    ProjectStatus.scanning,
+    ProjectStatus.analyzing,
+    ProjectStatus.embedding,
+})
+
+# Parent directory for cloned repositories
+REPOS_ROOT = Path("./repos")
+_repos_root_ready = False
+
 
 async def _debug_delay(phase: str) -> None:
     """Add debug delay between analysis phases if configured."""
     if settings.debug_analysis_delay > 0:
-        logger.debug(f"Debug delay: waiting {settings.debug_analysis_delay}s after {phase}")
+        logger.debug("Debug delay: waiting %ss after %s", settings.debug_analysis_delay, phase)
         await asyncio.sleep(settings.debug_analysis_delay)
 
 
-async def run_analysis(project_id: str) -> None:
+def _endpoint_key(service) -> str:
+    """Identify a service by the endpoint it probes."""
+    base_url = getattr(service, "base_url", None)
+    if base_url:
+        return base_url
+    return f"{getattr(service, 'host', '')}:{getattr(service, 'port', '')}"
+
+
+async def _cached_health_check(service) -> bool:
+    """Run ``service.health_check()``, reusing a recent positive result."""
+    key = _endpoint_key(service)
+    if _healthy_until.get(key, 0.0) > time.monotonic():
+        return True
+
+    healthy = await service.health_check()
+    if healthy:
+        _healthy_until[key] = time.monotonic() + HEALTH_CACHE_TTL_SECONDS
+    else:
+        _healthy_until.pop(key, None)
+    return healthy
+
+
+def _ensure_repos_root() -> None:
+    """Create the clone root once per process rather than once per analysis."""
+    global _repos_root_ready
+
+    if not _repos_root_ready:
+        REPOS_ROOT.mkdir(parents=True, exist_ok=True)
+        _repos_root_ready = True
+
+
+def _parse_cache_dir() -> Optional[str]:
+    """Get the analyzer parse cache directory, or None if caching is off."""
+    if not settings.parse_cache_enabled:
+        return None
+    return str(Path(settings.data_dir) / "parse-cache")
+
+
+def _file_index_path(project_id: str) -> Optional[str]:
+    """Get a project's incremental analysis index file, or None if caching is off."""
+    if not settings.parse_cache_enabled:
+        return None
+    return str(Path(settings.data_dir) / "file-index" / f"{project_id}.json")
+
+
+def _load_project(db: Session, project_id: str) -> Optional[Project]:
+    """Load a project by ID, or None if it does not exist."""
+    return db.query(Project).filter(Project.id == project_id).first()
+
+
+def _set_status(db: Session, project_id: str, status: ProjectStatus, **values) -> None:
+    """
+    Persist a status transition, plus any other column values, as one UPDATE.
+
+    Each call is a UI-visible phase boundary, so it commits immediately.
+    The ORM-enabled update also synchronizes the in-session Project
+    instance, so callers can keep reading ``project.<column>``.
+    """
+    db.execute(
+        update(Project)
+        .where(Project.id == project_id)
+        .values(status=status, **values)
+    )
+    db.commit()
+
+
+def _transition_if(db: Session, project_id: str, status: ProjectStatus, condition) -> bool:
+    """
+    Set the status only if ``condition`` holds, as one UPDATE and commit.
+
+    Checking and writing in the same statement saves the separate SELECT,
+    and two callers can't both see the old status and both transition.
+
+    Returns:
+        True if the project exists and was transitioned
+    """
+    result = db.execute(
+        update(Project)
+        .where(Project.id == project_id, condition)
+        .values(status=status)
+    )
+    db.commit()
+    return result.rowcount > 0
+
+
+async def run_analysis(project_id: str, force: bool = False) -> None:
     """
     Run complete code analysis on a project.
 
     Status progression: pending → cloning → scanning → analyzing → ready
     On error: status → failed
 
+    Files unchanged since the previous analysis (same mtime and size) reuse
+    their earlier results, so re-analysis costs scale with what changed.
+
     Args:
         project_id: Project ID to analyze
+        force: Re-analyze and re-parse every file, bypassing both the
+            previous results and the parse cache
+
+    Blocking work runs off the event loop so other requests are served
+    while an analysis is in progress: database round-trips and cloning in
+    worker threads via ``asyncio.to_thread`` (the session is only ever used
+    by one thread at a time), and per-file parsing in the shared process
+    pool.
     """
     db = SessionLocal()
     git_service = GitService()
 
     try:
         # Load project from database
-        logger.info(f"Starting analysis for project {project_id}")
-        project = db.query(Project).filter(Project.id == project_id).first()
+        logger.info("Starting analysis for project %s", project_id)
+        project = await asyncio.to_thread(_load_project, db, project_id)
 
         if not project:
-            logger.error(f"Project not found: {project_id}")
+            logger.error("Project not found: %s", project_id)
             return
 
         # ========================================================================
         # Phase 1: CLONING
         # ========================================================================
         if project.source_type == SourceType.git_url:
-            logger.info(f"Phase 1: Cloning repository for project {project_id}")
-            project.status = ProjectStatus.cloning
-            db.commit()
+            logger.info("Phase 1: Cloning repository for project %s", project_id)
+            await asyncio.to_thread(_set_status, db, project_id, ProjectStatus.cloning)
             await _debug_delay("cloning status set")
 
             # Determine clone location
-            clone_dir = Path("./repos") / project_id
-            clone_dir.parent.mkdir(parents=True, exist_ok=True)
-
-            # Clone repository
-            success, error = git_service.clone_repository(
-                git_url=project.source,
-                local_path=str(clone_dir),
-                branch=project.branch,
-                max_size_mb=settings.max_repo_size_mb
+            _ensure_repos_root()
+            clone_dir = REPOS_ROOT / project_id
+
+            # Clone repository, loading Tree-sitter grammars meanwhile since
+            # they don't depend on the cloned content
+            (success, error), _ = await asyncio.gather(
+                asyncio.to_thread(
+                    git_service.clone_repository,
+                    git_url=project.source,
+                    local_path=str(clone_dir),
+                    branch=project.branch,
+                    max_size_mb=settings.max_repo_size_mb
+                ),
+                asyncio.to_thread(load_languages),
             )
 
             if not success:
                 raise Exception(f"Failed to clone repository: {error}")
 
-            # Update local path
-            project.local_path = str(clone_dir)
-            db.commit()
+            # Local path is persisted together with the scanning transition
+            local_path = str(clone_dir)
 
         elif project.source_type == SourceType.local_path:
-            logger.info(f"Using local path for project {project_id}")
+            logger.info("Using local path for project %s", project_id)
 
             # Validate local path exists
-            local_path = Path(project.source)
-            if not local_path.exists():
+            source_path = Path(project.source)
+            if not source_path.exists():
                 raise Exception(f"Local path does not exist: {project.source}")
 
-            if not local_path.is_dir():
+            if not source_path.is_dir():
                 raise Exception(f"Local path is not a directory: {project.source}")
 
-            # Set local_path
-            project.local_path = project.source
-            db.commit()
+            # Local path is persisted together with the scanning transition
+            local_path = project.source
 
         else:
             raise Exception(f"Unknown source type: {project.source_type}")
@@ -96,46 +216,60 @@ async def run_analysis(project_id: str) -> None:
         # ========================================================================
         # Phase 2: SCANNING
         # ========================================================================
-        logger.info(f"Phase 2: Scanning repository for project {project_id}")
-        project.status = ProjectStatus.scanning
-        db.commit()
-        await _debug_delay("scanning status set")
-
-        # Initialize analyzer
-        analyzer = GenericAnalyzer(
-            repo_path=project.local_path,
-            max_file_size_mb=settings.max_file_size_mb,
-            use_gitignore=True
+        logger.info("Phase 2: Scanning repository for project %s", project_id)
+        await asyncio.to_thread(
+            _set_status, db, project_id, ProjectStatus.scanning, local_path=local_path
         )
+        await _debug_delay("scanning status set")
 
         # ========================================================================
         # Phase 3: ANALYZING
         # ========================================================================
-        logger.info(f"Phase 3: Analyzing code for project {project_id}")
-        project.status = ProjectStatus.analyzing
-        db.commit()
+        logger.info("Phase 3: Analyzing code for project %s", project_id)
+        await asyncio.to_thread(_set_status, db, project_id, ProjectStatus.analyzing)
         await _debug_delay("analyzing status set")
 
-        # Run analysis
-        stats = analyzer.analyze()
+        # For git checkouts, take the file list from the index rather than
+        # walking the tree (None for non-git paths, which are walked)
+        file_list = await asyncio.to_thread(git_service.list_files, local_path)
+
+        # Run analysis; the analyzer shards per-file parsing across the
+        # shared process pool, so only the orchestration runs in this thread
+        stats = await asyncio.to_thread(
+            analyze_repository,
+            local_path,
+            settings.max_file_size_mb,
+            parse_cache_dir=None if force else _parse_cache_dir(),
+            file_list=file_list,
+            file_index_path=_file_index_path(project_id),
+            incremental=not force,
+        )
 
         # ========================================================================
         # Phase 4: EMBEDDING
         # ========================================================================
-        logger.info(f"Phase 4: Generating embeddings for project {project_id}")
-        project.status = ProjectStatus.embedding
-        project.stats = stats  # Save stats now in case embedding fails
-        db.commit()
+        logger.info("Phase 4: Generating embeddings for project %s", project_id)
+        # Save stats now in case embedding fails
+        await asyncio.to_thread(
+            _set_status, db, project_id, ProjectStatus.embedding, stats=stats
+        )
         await _debug_delay("embedding status set")
 
         # Try to generate embeddings (graceful failure)
         try:
+            # Imported here so processes that never analyze don't load the
+            # embedding/vector clients and chunking dependencies
+            from app.services.chunking_service import ChunkingService
+            from app.services.llm import get_embedding_provider, get_vector_service
+
             embedding_provider = get_embedding_provider()
             vector_service = get_vector_service()
 
-            # Check if embedding service is available
-            embedding_healthy = await embedding_provider.health_check()
-            vector_healthy = await vector_service.health_check()
+            # Check both services are available (probed concurrently)
+            embedding_healthy, vector_healthy = await asyncio.gather(
+                _cached_health_check(embedding_provider),
+                _cached_health_check(vector_service),
+            )
 
             if embedding_healthy and vector_healthy:
                 chunking_service = ChunkingService(
@@ -149,37 +283,39 @@ async def run_analysis(project_id: str) -> None:
                     embedding_provider=embedding_provider,
                     vector_service=vector_service,
                 )
-                logger.info(f"Generated {chunk_count} chunks for project {project_id}")
+                logger.info("Generated %s chunks for project %s", chunk_count, project_id)
             else:
                 logger.warning(
-                    f"Embedding services unavailable (embedding: {embedding_healthy}, "
-                    f"vector: {vector_healthy}), skipping embedding phase"
+                    "Embedding services unavailable (embedding: %s, "
+                    "vector: %s), skipping embedding phase",
+                    embedding_healthy, vector_healthy,
                 )
         except Exception as e:
             # Log but don't fail - embedding is optional
-            logger.warning(f"Embedding phase failed for project {project_id}: {e}")
+            logger.warning("Embedding phase failed for project %s: %s", project_id, e)
 
         # ========================================================================
         # Phase 5: READY
         # ========================================================================
-        logger.info(f"Phase 5: Analysis complete for project {project_id}")
-        project.status = ProjectStatus.ready
-        project.last_analyzed_at = datetime.utcnow()
-        db.commit()
+        logger.info("Phase 5: Analysis complete for project %s", project_id)
+        await asyncio.to_thread(
+            _set_status, db, project_id, ProjectStatus.ready,
+            last_analyzed_at=datetime.now(timezone.utc),
+        )
 
-        logger.info(f"Successfully analyzed project {project_id}: "
-                   f"{stats['files']} files, {stats['lines_of_code']} LOC")
+        logger.info("Successfully analyzed project %s: %s files, %s LOC",
+                    project_id, stats['files'], stats['lines_of_code'])
 
     except Exception as e:
         # Set failed status
-        logger.error(f"Analysis failed for project {project_id}: {e}")
+        logger.error("Analysis failed for project %s: %s", project_id, e)
         try:
-            project = db.query(Project).filter(Project.id == project_id).first()
-            if project:
-                project.status = ProjectStatus.failed
-                db.commit()
+            # Discard any half-finished transaction, then mark failed by ID;
+            # the UPDATE also syncs the in-session project, so no re-SELECT
+            await asyncio.to_thread(db.rollback)
+            await asyncio.to_thread(_set_status, db, project_id, ProjectStatus.failed)
         except Exception as db_error:
-            logger.error(f"Failed to update status to failed: {db_error}")
+            logger.error("Failed to update status to failed: %s", db_error)
 
     finally:
         db.close()
@@ -191,32 +327,28 @@ async def re_analyze(project_id: str, force: bool = False) -> None:
 
     Args:
         project_id: Project ID to re-analyze
-        force: Force re-analysis even if recently analyzed
+        force: Re-analyze every file, not only those changed since the
+            previous analysis
     """
     db = SessionLocal()
 
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
-
-        if not project:
-            logger.error(f"Project not found: {project_id}")
-            return
-
-        # Check if already analyzing
-        if project.status in [ProjectStatus.cloning, ProjectStatus.scanning, ProjectStatus.analyzing, ProjectStatus.embedding]:
-            logger.warning(f"Project {project_id} is already being analyzed")
-            return
-
-        # Reset status to pending
-        project.status = ProjectStatus.pending
-        db.commit()
-
-        # Run analysis
-        await run_analysis(project_id)
-
+        # Reset status to pending, unless already analyzing
+        reset = _transition_if(
+            db, project_id, ProjectStatus.pending,
+            Project.status.notin_(_ACTIVE_STATUSES),
+        )
     finally:
+        # Release the connection before the (long) analysis opens its own
         db.close()
 
+    if not reset:
+        logger.warning("Project %s not found or already being analyzed", project_id)
+        return
+
+    # Run analysis
+    await run_analysis(project_id, force=force)
+
 
 async def cancel_analysis(project_id: str) -> bool:
     """
@@ -231,21 +363,14 @@ async def cancel_analysis(project_id: str) -> bool:
     db = SessionLocal()
 
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
-
-        if not project:
-            return False
-
-        # Check if analyzing
-        if project.status not in [ProjectStatus.cloning, ProjectStatus.scanning, ProjectStatus.analyzing, ProjectStatus.embedding]:
-            return False
-
-        # Set to failed status
-        project.status = ProjectStatus.failed
-        db.commit()
-
-        logger.info(f"Cancelled analysis for project {project_id}")
-        return True
-
+        # Set to failed status, only if analyzing
+        cancelled = _transition_if(
+            db, project_id, ProjectStatus.failed,
+            Project.status.in_(_ACTIVE_STATUSES),
+        )
     finally:
         db.close()
+
+    if cancelled:
+        logger.info("Cancelled analysis for project %s", project_id)
+    return cancelled
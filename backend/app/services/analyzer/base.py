@@ -1,12 +1,26 @@
 """Base analyzer abstract class."""
 
 from abc import ABC, abstractmethod
+from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, Optional
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are memory-mapped rather than read for
+# analysis; below it, mapping costs more than a single read()
+MMAP_MIN_BYTES = 64 * 1024
+
+# Start of a line that contains at least one non-whitespace byte
+_NON_BLANK_LINE = re.compile(rb"^[ \t\r\f\v]*\S", re.MULTILINE)
+
+
+def _count_non_blank_lines(data) -> int:
+    """Count lines with non-whitespace content in a bytes-like buffer."""
+    return sum(1 for _ in _NON_BLANK_LINE.finditer(data))
+
 
 class BaseAnalyzer(ABC):
     """Abstract base class for code analyzers."""
@@ -22,12 +36,7 @@ class BaseAnalyzer(ABC):
         if not self.repo_path.exists():
             raise ValueError(f"Repository path does not exist: {repo_path}")
 
-        self.stats = {
-            "files": 0,
-            "directories": 0,
-            "lines_of_code": 0,
-            "languages": {}
-        }
+        self._reset_stats()
 
     @abstractmethod
     def analyze(self) -> Dict[str, Any]:
@@ -68,6 +77,20 @@ class BaseAnalyzer(ABC):
         """
         pass
 
+    def _reset_stats(self) -> None:
+        """Reset aggregate statistics before an analysis."""
+        self.stats = {
+            "files": 0,
+            "directories": 0,
+            "lines_of_code": 0,
+            "languages": {}
+        }
+
+        # Per-language counters; totals and the nested "languages" shape
+        # are only materialized by get_stats()
+        self._language_files: Counter = Counter()
+        self._language_lines: Counter = Counter()
+
     def _update_stats(self, language: str, file_stats: Dict[str, Any]) -> None:
         """
         Update aggregate statistics.
@@ -76,38 +99,21 @@ class BaseAnalyzer(ABC):
             language: Language name
             file_stats: File analysis results
         """
-        # Initialize language entry if needed
-        if language not in self.stats["languages"]:
-            self.stats["languages"][language] = {
-                "files": 0,
-                "lines": 0
-            }
-
-        # Update counts
-        self.stats["files"] += 1
-        lines = file_stats.get("lines", 0)
-        self.stats["lines_of_code"] += lines
-        self.stats["languages"][language]["files"] += 1
-        self.stats["languages"][language]["lines"] += lines
+        self._language_files[language] += 1
+        self._language_lines[language] += file_stats.get("lines", 0)
 
-    def _count_lines(self, file_path: str) -> int:
+    @staticmethod
+    def _count_source_lines(source: bytes) -> int:
         """
-        Count non-empty lines in file.
+        Count non-empty lines in already-read file content.
 
         Args:
-            file_path: Path to file
+            source: Raw file content
 
         Returns:
             Number of non-empty lines
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = [line.strip() for line in f.readlines()]
-                # Count non-empty lines
-                return sum(1 for line in lines if line)
-        except Exception as e:
-            logger.warning(f"Error counting lines in {file_path}: {e}")
-            return 0
+        return _count_non_blank_lines(source)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -116,4 +122,12 @@ class BaseAnalyzer(ABC):
         Returns:
             Statistics dictionary
         """
+        lines = self._language_lines
+        self.stats["files"] = sum(self._language_files.values())
+        self.stats["lines_of_code"] = sum(lines.values())
+        self.stats["languages"] = {
+            language: {"files": files, "lines": lines[language]}
+            for language, files in self._language_files.items()
+        }
         return self.stats
+
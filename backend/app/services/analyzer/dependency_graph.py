@@ -1,15 +1,193 @@
 """Dependency graph builder for code analysis."""
 
+import functools
 import json
 import os
+import posixpath
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 import logging
 
 import networkx as nx
+import numpy as np
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Path separators -> module dots, e.g. "src/utils/helpers" -> "src.utils.helpers"
+_PATH_TO_DOT = str.maketrans({"/": ".", os.sep: "."})
+
+# File path -> DOT node ID: quotes escaped, separators and dots flattened
+_DOT_NODE_ID = str.maketrans({'"': '\\"', "/": "_", ".": "_"})
+
+# Module names are a pure function of (relative path, language); bounded so
+# a long-running server analyzing many repositories doesn't grow unbounded
+MODULE_NAME_CACHE_SIZE = 65536
+
+# Marks a resolution cache miss, since None is a valid cached result
+_NOT_CACHED = object()
+
+
+def _bumps_version(method):
+    """Wrap a graph mutator so it advances the graph's version."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _canonical_cycle(cycle: List[str]) -> Tuple[str, ...]:
+    """Rotate a cycle so its smallest node comes first."""
+    start = min(range(len(cycle)), key=cycle.__getitem__)
+    return tuple(cycle[start:] + cycle[:start])
+
+
+def _import_head(import_name: str) -> str:
+    """Get the first segment of an absolute Python or root-relative JS import."""
+    if import_name.startswith("/"):
+        return import_name.lstrip("/").partition("/")[0]
+    return import_name.partition(".")[0]
+
+
+def _top_n(nodes: List[str], degrees: np.ndarray, n: int) -> List[Tuple[str, int]]:
+    """
+    Get the ``n`` nodes with the highest degree, highest first.
+
+    Same result as a stable descending sort (ties keep node order), but only
+    nodes at or above the n-th largest degree are sorted.
+    """
+    count = len(degrees)
+    if n <= 0 or count == 0:
+        return []
+    if n < count:
+        threshold = np.partition(degrees, count - n)[count - n]
+        candidates = np.flatnonzero(degrees >= threshold)
+    else:
+        candidates = np.arange(count)
+    top = candidates[np.argsort(-degrees[candidates], kind="stable")[:n]]
+    return [(nodes[i], int(degrees[i])) for i in top]
+
+
+def _dag_depths(index: "_AdjacencyIndex") -> Optional[List[int]]:
+    """
+    Longest path to a leaf for every node, or None if the graph has a cycle.
+
+    Kahn's algorithm run backwards over the CSR arrays: leaves are settled
+    first, and a node is settled once all its dependencies are, so each
+    node's depth is final when it is popped.
+    """
+    pred_ptr = index.pred_ptr.tolist()
+    pred_idx = index.pred_idx.tolist()
+    remaining = index.out_degree.tolist()
+    depth = [0] * len(remaining)
+
+    ready = [i for i, degree in enumerate(remaining) if degree == 0]
+    settled = 0
+    while ready:
+        i = ready.pop()
+        settled += 1
+        next_depth = depth[i] + 1
+        for p in pred_idx[pred_ptr[i]:pred_ptr[i + 1]]:
+            if depth[p] < next_depth:
+                depth[p] = next_depth
+            remaining[p] -= 1
+            if remaining[p] == 0:
+                ready.append(p)
+
+    return depth if settled == len(depth) else None
+
+
+class _VersionedDiGraph(nx.DiGraph):
+    """
+    DiGraph that counts structural changes.
+
+    Derived data (the CSR snapshot, cycles, depths) is cached against
+    ``version``, so it stays valid until a node or edge is added or removed,
+    including by callers that mutate ``DependencyGraph.graph`` directly.
+    """
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        self.version = 0
+        super().__init__(incoming_graph_data, **attr)
+
+    add_node = _bumps_version(nx.DiGraph.add_node)
+    add_nodes_from = _bumps_version(nx.DiGraph.add_nodes_from)
+    remove_node = _bumps_version(nx.DiGraph.remove_node)
+    remove_nodes_from = _bumps_version(nx.DiGraph.remove_nodes_from)
+    add_edge = _bumps_version(nx.DiGraph.add_edge)
+    add_edges_from = _bumps_version(nx.DiGraph.add_edges_from)
+    remove_edge = _bumps_version(nx.DiGraph.remove_edge)
+    remove_edges_from = _bumps_version(nx.DiGraph.remove_edges_from)
+    clear = _bumps_version(nx.DiGraph.clear)
+    clear_edges = _bumps_version(nx.DiGraph.clear_edges)
+
+
+class _AdjacencyIndex:
+    """
+    Read-only CSR (compressed sparse row) snapshot of a graph's structure.
+
+    Node ``i`` is ``nodes[i]`` (graph iteration order); its successors are
+    ``col_idx[row_ptr[i]:row_ptr[i + 1]]``, in the graph's successor order.
+    The transpose is kept the same way, with predecessors in node order in
+    ``pred_idx[pred_ptr[i]:pred_ptr[i + 1]]``. Degrees are precomputed
+    arrays and ``node_attrs[i]`` is node ``i``'s attribute dict (the graph's
+    own, so attribute edits show through), so per-node queries are plain
+    indexing rather than NetworkX view lookups.
+    """
+
+    __slots__ = (
+        "graph", "version", "nodes", "node_id", "node_attrs",
+        "row_ptr", "col_idx", "out_degree", "in_degree",
+        "pred_ptr", "pred_idx",
+    )
+
+    def __init__(self, graph: nx.DiGraph):
+        self.graph = graph
+        self.version = getattr(graph, "version", None)
+        self.nodes: List[str] = list(graph)
+        self.node_id: Dict[str, int] = {node: i for i, node in enumerate(self.nodes)}
+        self.node_attrs: List[Dict[str, Any]] = [attrs for _, attrs in graph.nodes(data=True)]
+
+        succ = graph.succ
+        node_id = self.node_id
+        count = len(self.nodes)
+
+        self.out_degree = np.fromiter(
+            (len(succ[node]) for node in self.nodes), dtype=np.int32, count=count
+        )
+        self.row_ptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(self.out_degree, out=self.row_ptr[1:])
+        self.col_idx = np.fromiter(
+            (node_id[target] for node in self.nodes for target in succ[node]),
+            dtype=np.int32,
+            count=int(self.row_ptr[-1]),
+        )
+        self.in_degree = np.bincount(self.col_idx, minlength=count).astype(np.int32)
+
+        # Transpose: edge sources grouped by target, stable so each group
+        # stays in source order
+        sources = np.repeat(np.arange(count, dtype=np.int32), self.out_degree)
+        self.pred_idx = sources[np.argsort(self.col_idx, kind="stable")]
+        self.pred_ptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(self.in_degree, out=self.pred_ptr[1:])
+
+    def is_current(self, graph: nx.DiGraph) -> bool:
+        """Check whether this snapshot still describes ``graph``."""
+        return (
+            graph is self.graph
+            and self.version is not None
+            and getattr(graph, "version", None) == self.version
+        )
+
+    def successors(self, i: int) -> np.ndarray:
+        """Get the successor ids of node ``i``."""
+        return self.col_idx[self.row_ptr[i]:self.row_ptr[i + 1]]
+
+    def predecessors(self, i: int) -> np.ndarray:
+        """Get the predecessor ids of node ``i``."""
+        return self.pred_idx[self.pred_ptr[i]:self.pred_ptr[i + 1]]
+
 
 class DependencyGraph:
     """
@@ -36,9 +214,43 @@ class DependencyGraph:
             repo_path: Absolute path to the repository root
         """
         self.repo_path = Path(repo_path).resolve()
-        self.graph: nx.DiGraph = nx.DiGraph()
+        self._repo_prefix = os.path.join(str(self.repo_path), "")
+        # Input file path -> relative node path
+        self._relative_paths: Dict[str, str] = {}
+        self.graph: nx.DiGraph = _VersionedDiGraph()
         self._file_to_module: Dict[str, str] = {}
         self._module_to_file: Dict[str, str] = {}
+        # Every dotted suffix of every module name -> first file registered
+        # with it, e.g. "helpers" and "utils.helpers" for "src.utils.helpers"
+        self._module_suffixes: Dict[str, str] = {}
+        # First segment of anything an absolute import can resolve to: module
+        # name segments plus top-level path components. Imports starting
+        # elsewhere (stdlib, third-party) are external without a lookup.
+        self._resolvable_heads: Set[str] = set()
+        # Relative path -> imports it was registered with, for re-linking
+        self._file_imports: Dict[str, List[str]] = {}
+        # (import, source dir, language) -> resolved path, for the current
+        # set of registered files
+        self._resolve_cache: Dict[Tuple[str, str, str], Optional[str]] = {}
+        self._adjacency_index: Optional[_AdjacencyIndex] = None
+
+        # Derived results, valid for the current adjacency snapshot
+        self._cycles_cache: Optional[List[Tuple[List[str], FrozenSet[str]]]] = None
+        self._depths_cache: Optional[Dict[str, int]] = None
+
+    def _adjacency(self) -> _AdjacencyIndex:
+        """
+        Get the CSR snapshot of the graph, rebuilding it after changes.
+
+        Rebuilding also drops the cached cycles and depths, which were
+        computed for the previous structure.
+        """
+        index = self._adjacency_index
+        if index is None or not index.is_current(self.graph):
+            index = self._adjacency_index = _AdjacencyIndex(self.graph)
+            self._cycles_cache = None
+            self._depths_cache = None
+        return index
 
     def build_from_analysis(
         self,
@@ -58,24 +270,161 @@ class DependencyGraph:
         """
         logger.info(f"Building dependency graph from {len(file_imports)} files")
 
-        # First pass: Register all files as nodes
-        for file_path in file_imports.keys():
+        # First pass: Register all files as nodes, in one batch
+        rel_paths = {}
+        nodes_batch = []
+        for file_path, imports in file_imports.items():
             rel_path = self._get_relative_path(file_path)
             module_name = self._file_to_module_name(rel_path, language)
 
-            self.graph.add_node(
-                rel_path,
-                module_name=module_name,
-                file_path=file_path,
-                language=language
-            )
-            self._file_to_module[rel_path] = module_name
-            self._module_to_file[module_name] = rel_path
+            rel_paths[file_path] = rel_path
+            nodes_batch.append((rel_path, {
+                "module_name": module_name,
+                "file_path": file_path,
+                "language": language,
+            }))
+            self._register_file(rel_path, module_name, imports)
 
-        # Second pass: Add edges for imports
-        for file_path, imports in file_imports.items():
-            source_rel_path = self._get_relative_path(file_path)
-            source_dir = str(Path(source_rel_path).parent)
+        self.graph.add_nodes_from(nodes_batch)
+        # Newly registered files may change how imports resolve
+        self._resolve_cache.clear()
+
+        # Second pass: Collect import edges and external dependencies
+        self._link_imports([
+            (rel_paths[file_path], imports, language)
+            for file_path, imports in file_imports.items()
+        ])
+
+        logger.info(
+            f"Graph built: {self.graph.number_of_nodes()} nodes, "
+            f"{self.graph.number_of_edges()} edges"
+        )
+
+        return self
+
+    def update_from_analysis(
+        self,
+        changed_file_imports: Dict[str, List[str]],
+        removed_files: Iterable[str] = (),
+        language: str = "Python"
+    ) -> "DependencyGraph":
+        """
+        Apply a change set to a built graph instead of rebuilding it.
+
+        Removed files are dropped with their edges, changed (or new) files
+        are upserted, and only imports whose resolution can have changed
+        are resolved again: those of the changed files, of files that
+        imported a removed file, and of files with an import a new file
+        could now satisfy.
+
+        Args:
+            changed_file_imports: Mapping of changed or added file paths to
+                                  their full list of imports
+            removed_files: Paths of files deleted since the last build
+            language: Programming language of the changed files
+
+        Returns:
+            Self for method chaining
+        """
+        logger.info(
+            f"Updating dependency graph: {len(changed_file_imports)} changed files"
+        )
+
+        # Files whose imports must be resolved again, as an ordered set
+        stale: Dict[str, None] = {}
+
+        removed = [
+            rel_path for rel_path in map(self._get_relative_path, removed_files)
+            if rel_path in self._file_to_module
+        ]
+        if removed:
+            for rel_path in removed:
+                if rel_path in self.graph:
+                    stale.update(dict.fromkeys(self.graph.predecessors(rel_path)))
+            self.graph.remove_nodes_from([r for r in removed if r in self.graph])
+            for rel_path in removed:
+                module_name = self._file_to_module.pop(rel_path)
+                if self._module_to_file.get(module_name) == rel_path:
+                    del self._module_to_file[module_name]
+                self._file_imports.pop(rel_path, None)
+                stale.pop(rel_path, None)
+
+            # Removed files may have been the match for a suffix or head
+            self._module_suffixes.clear()
+            self._resolvable_heads.clear()
+            for rel_path, module_name in self._file_to_module.items():
+                self._index_module(rel_path, module_name)
+
+        new_heads: Set[str] = set()
+        nodes_batch = []
+        for file_path, imports in changed_file_imports.items():
+            rel_path = self._get_relative_path(file_path)
+            module_name = self._file_to_module_name(rel_path, language)
+            if rel_path not in self._file_to_module:
+                new_heads.update(self._import_heads(rel_path, module_name))
+
+            nodes_batch.append((rel_path, {
+                "module_name": module_name,
+                "file_path": file_path,
+                "language": language,
+            }))
+            self._register_file(rel_path, module_name, imports)
+            stale[rel_path] = None
+
+        self.graph.add_nodes_from(nodes_batch)
+        self._resolve_cache.clear()
+
+        # A new file can only capture imports starting with one of its heads
+        # (see _resolvable_heads), or relative ones
+        if new_heads:
+            for rel_path, imports in self._file_imports.items():
+                if rel_path not in stale and any(
+                    imp.startswith(".") or _import_head(imp) in new_heads
+                    for imp in imports
+                ):
+                    stale[rel_path] = None
+
+        # Re-link stale files from scratch
+        stale_nodes = [n for n in stale if n in self.graph and n in self._file_imports]
+        self.graph.remove_edges_from([
+            (node, target) for node in stale_nodes
+            for target in list(self.graph.successors(node))
+        ])
+        node_attrs = self.graph.nodes
+        for node in stale_nodes:
+            node_attrs[node].pop("external_deps", None)
+        self._link_imports([
+            (node, self._file_imports[node], node_attrs[node].get("language", language))
+            for node in stale_nodes
+        ])
+
+        logger.info(
+            f"Graph updated: {len(stale_nodes)} files re-linked, "
+            f"{self.graph.number_of_nodes()} nodes, "
+            f"{self.graph.number_of_edges()} edges"
+        )
+
+        return self
+
+    def _register_file(self, rel_path: str, module_name: str, imports: List[str]) -> None:
+        """Record a file's module name and imports for resolution."""
+        self._file_to_module[rel_path] = module_name
+        self._module_to_file[module_name] = rel_path
+        self._file_imports[rel_path] = list(imports)
+        self._index_module(rel_path, module_name)
+
+    def _link_imports(self, sources: List[Tuple[str, List[str], str]]) -> None:
+        """
+        Resolve imports and add the resulting edges and external dependencies.
+
+        Args:
+            sources: (relative path, imports, language) of each importing file
+        """
+        edges_batch = []
+        # Node -> external imports, as an insertion-ordered set
+        external_deps: Dict[str, Dict[str, None]] = {}
+        for source_rel_path, imports, language in sources:
+            source_dir = Path(source_rel_path).parent.as_posix()
 
             for imp in imports:
                 # Try to resolve the import to a file in the repository
@@ -87,39 +436,69 @@ class DependencyGraph:
 
                 if resolved and resolved in self.graph:
                     # Internal dependency - add edge
-                    self.graph.add_edge(
-                        source_rel_path,
-                        resolved,
-                        import_name=imp,
-                        is_relative=imp.startswith(".")
-                    )
+                    edges_batch.append((source_rel_path, resolved, {
+                        "import_name": imp,
+                        "is_relative": imp.startswith("."),
+                    }))
                 else:
-                    # External dependency - store as node attribute
-                    if source_rel_path in self.graph:
-                        external = self.graph.nodes[source_rel_path].get(
-                            "external_deps", []
-                        )
-                        if imp not in external:
-                            external.append(imp)
-                        self.graph.nodes[source_rel_path]["external_deps"] = external
+                    # External dependency - stored as node attribute below
+                    external_deps.setdefault(source_rel_path, {})[imp] = None
+
+        self.graph.add_edges_from(edges_batch)
+
+        node_attrs = self.graph.nodes
+        for node, deps in external_deps.items():
+            attrs = node_attrs[node]
+            existing = attrs.get("external_deps")
+            if existing:
+                # Merge as ordered sets: existing first, then new ones
+                deps = {**dict.fromkeys(existing), **deps}
+            attrs["external_deps"] = list(deps)
+
+    @staticmethod
+    def _import_heads(rel_path: str, module_name: str) -> Set[str]:
+        """Get the first segments of imports that can resolve to a file."""
+        heads = set(module_name.split("."))
+        heads.add(rel_path.partition("/")[0])
+        return heads
+
+    def _index_module(self, rel_path: str, module_name: str) -> None:
+        """Register a module for import resolution by suffix and by first segment."""
+        parts = module_name.split(".")
+        for i in range(len(parts)):
+            self._module_suffixes.setdefault(".".join(parts[i:]), rel_path)
+        self._resolvable_heads.update(self._import_heads(rel_path, module_name))
 
-        logger.info(
-            f"Graph built: {self.graph.number_of_nodes()} nodes, "
-            f"{self.graph.number_of_edges()} edges"
-        )
+    def _get_relative_path(self, file_path: str) -> str:
+        """
+        Convert absolute path to relative path from repo root.
 
-        return self
+        Relative paths always use "/" separators, so resolution can build
+        candidate keys by plain string joins on every platform.
+        """
+        rel_path = self._relative_paths.get(file_path)
+        if rel_path is None:
+            rel_path = self._relative_paths[file_path] = self._make_relative(file_path)
+        return rel_path
+
+    def _make_relative(self, file_path: str) -> str:
+        """Compute a relative node path, resolving symlinks only when needed."""
+        # Paths already under the resolved repo root are sliced lexically,
+        # sparing the per-component filesystem lookups of resolve()
+        normalized = os.path.normpath(file_path)
+        if normalized.startswith(self._repo_prefix):
+            return normalized[len(self._repo_prefix):].replace(os.sep, "/")
 
-    def _get_relative_path(self, file_path: str) -> str:
-        """Convert absolute path to relative path from repo root."""
         try:
             abs_path = Path(file_path).resolve()
-            return str(abs_path.relative_to(self.repo_path))
+            return abs_path.relative_to(self.repo_path).as_posix()
         except ValueError:
             # Already relative or outside repo
             return file_path
 
-    def _file_to_module_name(self, rel_path: str, language: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=MODULE_NAME_CACHE_SIZE)
+    def _file_to_module_name(rel_path: str, language: str) -> str:
         """
         Convert file path to module name.
 
@@ -136,7 +515,7 @@ class DependencyGraph:
                 # Handle __init__.py -> parent module
                 if path.stem == "__init__":
                     without_ext = str(path.parent)
-                return without_ext.replace(os.sep, ".").replace("/", ".")
+                return without_ext.translate(_PATH_TO_DOT)
             return rel_path
 
         elif language in ("JavaScript", "TypeScript", "TSX"):
@@ -164,11 +543,23 @@ class DependencyGraph:
         Returns:
             Relative file path if found in repo, None otherwise
         """
+        # The same imports recur across files; only relative ones depend on
+        # where they are imported from
+        scope = source_dir if import_name.startswith(".") else ""
+        key = (import_name, scope, language)
+        resolved = self._resolve_cache.get(key, _NOT_CACHED)
+        if resolved is not _NOT_CACHED:
+            return resolved
+
         if language == "Python":
-            return self._resolve_python_import(import_name, source_dir)
+            resolved = self._resolve_python_import(import_name, source_dir)
         elif language in ("JavaScript", "TypeScript", "TSX"):
-            return self._resolve_js_import(import_name, source_dir)
-        return None
+            resolved = self._resolve_js_import(import_name, source_dir)
+        else:
+            resolved = None
+
+        self._resolve_cache[key] = resolved
+        return resolved
 
     def _resolve_python_import(
         self,
@@ -186,27 +577,27 @@ class DependencyGraph:
         if import_name.startswith("."):
             return self._resolve_relative_python_import(import_name, source_dir)
 
+        # Most absolute imports are stdlib or third-party
+        if _import_head(import_name) not in self._resolvable_heads:
+            return None
+
         # Absolute import: convert dots to path separators
-        path_parts = import_name.split(".")
+        module_path = import_name.replace(".", "/")
 
         # Try different file extensions
         for ext in [".py", ".pyi"]:
             # Try as module file
-            potential_path = os.path.join(*path_parts) + ext
+            potential_path = module_path + ext
             if potential_path in self._file_to_module:
                 return potential_path
 
             # Try as package (__init__.py)
-            init_path = os.path.join(*path_parts, "__init__" + ext)
+            init_path = module_path + "/__init__" + ext
             if init_path in self._file_to_module:
                 return init_path
 
-        # Check if it matches any registered module
-        for rel_path, module in self._file_to_module.items():
-            if module == import_name or module.endswith("." + import_name):
-                return rel_path
-
-        return None
+        # Check if it matches (the tail of) any registered module
+        return self._module_suffixes.get(import_name)
 
     def _resolve_relative_python_import(
         self,
@@ -233,19 +624,22 @@ class DependencyGraph:
         # Build target path
         if module_part:
             path_parts = module_part.split(".")
-            target_dir = current_dir / os.path.join(*path_parts)
+            target_dir = current_dir.joinpath(*path_parts).as_posix()
         else:
-            target_dir = current_dir
+            target_dir = current_dir.as_posix()
+
+        # Package at the repo root is "__init__.py", not "./__init__.py"
+        package_prefix = "" if target_dir == "." else target_dir + "/"
 
         # Try different file patterns
         for ext in [".py", ".pyi"]:
             # As file
-            file_path = str(target_dir) + ext
+            file_path = target_dir + ext
             if file_path in self._file_to_module:
                 return file_path
 
             # As package
-            init_path = str(target_dir / ("__init__" + ext))
+            init_path = package_prefix + "__init__" + ext
             if init_path in self._file_to_module:
                 return init_path
 
@@ -273,12 +667,14 @@ class DependencyGraph:
             if source_dir == ".":
                 resolved = import_name[2:] if import_name.startswith("./") else import_name
             else:
-                resolved = str(Path(source_dir) / import_name)
+                resolved = f"{source_dir}/{import_name}"
 
             # Normalize path
-            resolved = os.path.normpath(resolved)
+            resolved = posixpath.normpath(resolved)
         else:
             resolved = import_name.lstrip("/")
+            if resolved.partition("/")[0] not in self._resolvable_heads:
+                return None
 
         # Try different extensions
         extensions = [".ts", ".tsx", ".js", ".jsx", ".mts", ".cts", ".mjs", ".cjs"]
@@ -290,7 +686,7 @@ class DependencyGraph:
                 return file_path
 
             # Try index file
-            index_path = os.path.join(resolved, "index" + ext)
+            index_path = resolved + "/index" + ext
             if index_path in self._file_to_module:
                 return index_path
 
@@ -311,12 +707,42 @@ class DependencyGraph:
         Example:
             [["a.py", "b.py", "c.py", "a.py"]]  # a -> b -> c -> a
         """
+        # Copies, so callers can't modify the cached cycles
+        return [list(cycle) for cycle, _ in self._cycles()]
+
+    def _cycles(self) -> List[Tuple[List[str], FrozenSet[str]]]:
+        """
+        Get the cached cycles, each paired with the set of its nodes.
+
+        Cycle enumeration is the most expensive query and every export needs
+        it, so it runs once per graph structure.
+        """
+        self._adjacency()
+        if self._cycles_cache is None:
+            self._cycles_cache = self._find_circular_dependencies()
+        return self._cycles_cache
+
+    def _find_circular_dependencies(self) -> List[Tuple[List[str], FrozenSet[str]]]:
+        """
+        Enumerate distinct cycles, each closed by repeating its first node.
+
+        Cycles are rotated to start at their smallest node, so the same loop
+        found from different start nodes is reported once, and in a stable
+        form across runs.
+        """
+        seen: Set[Tuple[str, ...]] = set()
+        cycles: List[Tuple[List[str], FrozenSet[str]]] = []
         try:
-            cycles = list(nx.simple_cycles(self.graph))
-            # Add the first node at the end to show complete cycle
-            return [[*cycle, cycle[0]] for cycle in cycles]
+            for cycle in nx.simple_cycles(self.graph):
+                key = _canonical_cycle(cycle)
+                if key in seen:
+                    continue
+                seen.add(key)
+                # Add the first node at the end to show complete cycle
+                cycles.append(([*key, key[0]], frozenset(key)))
         except nx.NetworkXError:
             return []
+        return cycles
 
     def get_circular_dependencies_report(self) -> Dict[str, Any]:
         """
@@ -349,54 +775,40 @@ class DependencyGraph:
         Returns:
             Dictionary mapping file paths to their dependency depth
         """
-        depths: Dict[str, int] = {}
-
-        # Get all leaf nodes (nodes with no outgoing edges)
-        leaf_nodes = self.get_leaf_nodes()
+        return dict(self._depths())
 
-        # Initialize leaf nodes with depth 0
-        for leaf in leaf_nodes:
-            depths[leaf] = 0
+    def _depths(self) -> Dict[str, int]:
+        """Get the cached depth map; callers must not modify it."""
+        self._adjacency()
+        if self._depths_cache is None:
+            self._depths_cache = self._compute_dependency_depth()
+        return self._depths_cache
 
-        # Use reverse topological sort for DAGs
-        try:
-            # For DAGs, we can compute efficiently
-            for node in reversed(list(nx.topological_sort(self.graph))):
-                if node not in depths:
-                    successors = list(self.graph.successors(node))
-                    if successors:
-                        depths[node] = max(depths.get(s, 0) for s in successors) + 1
-                    else:
-                        depths[node] = 0
-        except nx.NetworkXUnfeasible:
-            # Graph has cycles - use BFS-based approach
-            for node in self.graph.nodes():
-                if node not in depths:
-                    depths[node] = self._calculate_node_depth(node, set())
-
-        return depths
-
-    def _calculate_node_depth(
-        self,
-        node: str,
-        visited: Set[str]
-    ) -> int:
-        """Calculate depth for a single node, handling cycles."""
-        if node in visited:
-            return 0  # Cycle detected, stop
+    def _compute_dependency_depth(self) -> Dict[str, int]:
+        """
+        Compute the dependency depth of every node in one O(V + E) pass.
 
-        visited.add(node)
-        successors = list(self.graph.successors(node))
+        Leaves are at depth 0, every other node one deeper than its deepest
+        dependency. In an acyclic graph this runs directly on the CSR
+        snapshot; otherwise strongly connected components are collapsed
+        first, so files in an import cycle share one depth.
+        """
+        index = self._adjacency()
+        depth = _dag_depths(index)
+        if depth is not None:
+            return dict(zip(index.nodes, depth))
 
-        if not successors:
-            return 0
+        condensed = nx.condensation(self.graph)
+        component_of = condensed.graph["mapping"]
+        successors = condensed.succ
 
-        max_depth = 0
-        for successor in successors:
-            depth = self._calculate_node_depth(successor, visited.copy())
-            max_depth = max(max_depth, depth)
+        depth = [0] * condensed.number_of_nodes()
+        for component in reversed(list(nx.topological_sort(condensed))):
+            targets = successors[component]
+            if targets:
+                depth[component] = max([depth[t] for t in targets]) + 1
 
-        return max_depth + 1
+        return {node: depth[component_of[node]] for node in index.nodes}
 
     def get_leaf_nodes(self) -> List[str]:
         """
@@ -405,10 +817,8 @@ class DependencyGraph:
         Returns:
             List of file paths that have no outgoing edges
         """
-        return [
-            node for node in self.graph.nodes()
-            if self.graph.out_degree(node) == 0
-        ]
+        index = self._adjacency()
+        return [index.nodes[i] for i in np.flatnonzero(index.out_degree == 0).tolist()]
 
     def get_root_nodes(self) -> List[str]:
         """
@@ -419,10 +829,8 @@ class DependencyGraph:
         Returns:
             List of file paths that have no incoming edges
         """
-        return [
-            node for node in self.graph.nodes()
-            if self.graph.in_degree(node) == 0
-        ]
+        index = self._adjacency()
+        return [index.nodes[i] for i in np.flatnonzero(index.in_degree == 0).tolist()]
 
     def get_module_metrics(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -431,21 +839,30 @@ class DependencyGraph:
         Returns:
             Dictionary mapping file paths to their metrics
         """
-        depths = self.calculate_dependency_depth()
+        depths = self._depths()
+        index = self._adjacency()
+        node_attrs = index.node_attrs
+        nodes = index.nodes
+        row_ptr = index.row_ptr.tolist()
+        col_idx = index.col_idx.tolist()
+        pred_ptr = index.pred_ptr.tolist()
+        pred_idx = index.pred_idx.tolist()
+        in_degree = index.in_degree.tolist()
 
         metrics = {}
-        for node in self.graph.nodes():
-            node_data = self.graph.nodes[node]
+        for i, node in enumerate(nodes):
+            node_data = node_attrs[i]
+            imports = [nodes[j] for j in col_idx[row_ptr[i]:row_ptr[i + 1]]]
 
             metrics[node] = {
                 "module_name": node_data.get("module_name", node),
-                "imports_count": self.graph.out_degree(node),
-                "imported_by_count": self.graph.in_degree(node),
+                "imports_count": len(imports),
+                "imported_by_count": in_degree[i],
                 "dependency_depth": depths.get(node, 0),
-                "is_leaf": self.graph.out_degree(node) == 0,
-                "is_root": self.graph.in_degree(node) == 0,
-                "imports": list(self.graph.successors(node)),
-                "imported_by": list(self.graph.predecessors(node)),
+                "is_leaf": not imports,
+                "is_root": in_degree[i] == 0,
+                "imports": imports,
+                "imported_by": [nodes[j] for j in pred_idx[pred_ptr[i]:pred_ptr[i + 1]]],
                 "external_deps": node_data.get("external_deps", [])
             }
 
@@ -459,45 +876,52 @@ class DependencyGraph:
             Dictionary representation of the graph
         """
         circular = self.get_circular_dependencies_report()
-        depths = self.calculate_dependency_depth()
-
-        nodes = []
-        for node in self.graph.nodes():
-            node_data = self.graph.nodes[node]
-            nodes.append({
+        depths = self._depths()
+        index = self._adjacency()
+        node_attrs = index.node_attrs
+        out_degree = index.out_degree.tolist()
+        in_degree = index.in_degree.tolist()
+
+        nodes = [
+            {
                 "id": node,
                 "module_name": node_data.get("module_name", node),
                 "language": node_data.get("language", "Unknown"),
-                "imports_count": self.graph.out_degree(node),
-                "imported_by_count": self.graph.in_degree(node),
+                "imports_count": imports_count,
+                "imported_by_count": imported_by_count,
                 "dependency_depth": depths.get(node, 0),
-                "is_leaf": self.graph.out_degree(node) == 0,
-                "is_root": self.graph.in_degree(node) == 0,
+                "is_leaf": imports_count == 0,
+                "is_root": imported_by_count == 0,
                 "external_deps": node_data.get("external_deps", [])
-            })
+            }
+            for node, node_data, imports_count, imported_by_count in zip(
+                index.nodes, node_attrs, out_degree, in_degree
+            )
+        ]
 
-        edges = []
-        for source, target, data in self.graph.edges(data=True):
-            edges.append({
+        edges = [
+            {
                 "source": source,
                 "target": target,
                 "import_name": data.get("import_name", ""),
                 "is_relative": data.get("is_relative", False)
-            })
+            }
+            for source, target, data in self.graph.edges(data=True)
+        ]
+
+        node_count = len(index.nodes)
+        edge_count = len(index.col_idx)
 
         return {
             "nodes": nodes,
             "edges": edges,
             "stats": {
-                "total_nodes": self.graph.number_of_nodes(),
-                "total_edges": self.graph.number_of_edges(),
-                "leaf_nodes": len(self.get_leaf_nodes()),
-                "root_nodes": len(self.get_root_nodes()),
+                "total_nodes": node_count,
+                "total_edges": edge_count,
+                "leaf_nodes": out_degree.count(0),
+                "root_nodes": in_degree.count(0),
                 "max_depth": max(depths.values()) if depths else 0,
-                "avg_imports": (
-                    sum(self.graph.out_degree(n) for n in self.graph.nodes()) /
-                    self.graph.number_of_nodes()
-                ) if self.graph.number_of_nodes() > 0 else 0
+                "avg_imports": edge_count / node_count if node_count > 0 else 0
             },
             "circular_dependencies": circular
         }
@@ -506,12 +930,20 @@ class DependencyGraph:
         """
         Export graph as JSON string.
 
+        The default 2-space output is produced by orjson, which writes
+        non-ASCII characters as-is rather than as ``\\u`` escapes; any other
+        indent, including None for compact output, uses ``json.dumps``.
+
         Args:
             indent: JSON indentation level
 
         Returns:
             JSON string representation
         """
+        # orjson serializes large graphs several times faster; its only
+        # indented layout matches json.dumps(indent=2)
+        if indent == 2:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=indent)
 
     def to_dot(self) -> str:
@@ -527,38 +959,45 @@ class DependencyGraph:
         lines.append("")
 
         # Get metrics for coloring
-        depths = self.calculate_dependency_depth()
+        depths = self._depths()
         max_depth = max(depths.values()) if depths else 0
+        index = self._adjacency()
+        node_attrs = index.node_attrs
+        out_degree = index.out_degree.tolist()
+        in_degree = index.in_degree.tolist()
+
+        # DOT IDs are escaped once per node and reused for its edges
+        safe_nodes = [node.translate(_DOT_NODE_ID) for node in index.nodes]
+
+        # Fill color per depth (darker = deeper), computed once per level
+        depth_colors = []
+        for depth in range(max_depth + 1):
+            intensity = int(200 - (depth / max_depth) * 100) if max_depth > 0 else 200
+            depth_colors.append(f"#{intensity:02x}{intensity:02x}ff")
 
         # Add nodes
-        for node in self.graph.nodes():
-            node_data = self.graph.nodes[node]
+        for i, node in enumerate(index.nodes):
+            node_data = node_attrs[i]
             label = node_data.get("module_name", node)
 
-            # Color based on depth (darker = deeper)
-            depth = depths.get(node, 0)
-            if max_depth > 0:
-                intensity = int(200 - (depth / max_depth) * 100)
-            else:
-                intensity = 200
-            color = f"#{intensity:02x}{intensity:02x}ff"
-
-            # Special colors for roots and leaves
-            if self.graph.in_degree(node) == 0:
+            # Special colors for roots and leaves, otherwise based on depth
+            if in_degree[i] == 0:
                 color = "#90EE90"  # Light green for roots
-            elif self.graph.out_degree(node) == 0:
+            elif out_degree[i] == 0:
                 color = "#FFB6C1"  # Light pink for leaves
+            else:
+                color = depth_colors[depths.get(node, 0)]
 
             safe_label = label.replace('"', '\\"')
-            safe_node = node.replace('"', '\\"').replace("/", "_").replace(".", "_")
-            lines.append(f'    "{safe_node}" [label="{safe_label}", fillcolor="{color}"];')
+            lines.append(f'    "{safe_nodes[i]}" [label="{safe_label}", fillcolor="{color}"];')
 
         lines.append("")
 
         # Add edges
+        node_id = index.node_id
         for source, target, data in self.graph.edges(data=True):
-            safe_source = source.replace('"', '\\"').replace("/", "_").replace(".", "_")
-            safe_target = target.replace('"', '\\"').replace("/", "_").replace(".", "_")
+            safe_source = safe_nodes[node_id[source]]
+            safe_target = safe_nodes[node_id[target]]
 
             # Style for relative imports
             style = "dashed" if data.get("is_relative") else "solid"
@@ -574,7 +1013,7 @@ class DependencyGraph:
         Returns:
             Summary dictionary with key statistics
         """
-        depths = self.calculate_dependency_depth()
+        depths = self._depths()
         circular = self.detect_circular_dependencies()
 
         return {
@@ -591,21 +1030,13 @@ class DependencyGraph:
 
     def _get_most_imported(self, n: int) -> List[Tuple[str, int]]:
         """Get top N most imported modules."""
-        imported_counts = [
-            (node, self.graph.in_degree(node))
-            for node in self.graph.nodes()
-        ]
-        imported_counts.sort(key=lambda x: x[1], reverse=True)
-        return imported_counts[:n]
+        index = self._adjacency()
+        return _top_n(index.nodes, index.in_degree, n)
 
     def _get_most_dependencies(self, n: int) -> List[Tuple[str, int]]:
         """Get top N modules with most dependencies."""
-        dep_counts = [
-            (node, self.graph.out_degree(node))
-            for node in self.graph.nodes()
-        ]
-        dep_counts.sort(key=lambda x: x[1], reverse=True)
-        return dep_counts[:n]
+        index = self._adjacency()
+        return _top_n(index.nodes, index.out_degree, n)
 
     def get_ego_graph(self, file_path: str) -> Dict[str, Any]:
         """
@@ -620,32 +1051,37 @@ class DependencyGraph:
         if file_path not in self.graph:
             return {"error": f"File not found: {file_path}"}
 
-        node_data = self.graph.nodes[file_path]
+        index = self._adjacency()
+        nodes = index.nodes
+        node_attrs = index.node_attrs
+        i = index.node_id[file_path]
+        node_data = node_attrs[i]
 
         # Get what this file imports (outgoing edges)
         imports = []
-        for target in self.graph.successors(file_path):
-            target_data = self.graph.nodes[target]
+        for j in index.successors(i).tolist():
+            target_data = node_attrs[j]
             imports.append({
-                "file": target,
-                "module_name": target_data.get("module_name", target),
+                "file": nodes[j],
+                "module_name": target_data.get("module_name", nodes[j]),
                 "language": target_data.get("language", "Unknown"),
             })
 
         # Get what imports this file (incoming edges)
         imported_by = []
-        for source in self.graph.predecessors(file_path):
-            source_data = self.graph.nodes[source]
+        for j in index.predecessors(i).tolist():
+            source_data = node_attrs[j]
             imported_by.append({
-                "file": source,
-                "module_name": source_data.get("module_name", source),
+                "file": nodes[j],
+                "module_name": source_data.get("module_name", nodes[j]),
                 "language": source_data.get("language", "Unknown"),
             })
 
         # Check if this file is part of any circular dependency
-        circular_deps = self.detect_circular_dependencies()
-        in_cycle = any(file_path in cycle for cycle in circular_deps)
-        cycles_involved = [cycle for cycle in circular_deps if file_path in cycle]
+        cycles_involved = [
+            list(cycle) for cycle, members in self._cycles() if file_path in members
+        ]
+        in_cycle = bool(cycles_involved)
 
         return {
             "file": file_path,
@@ -669,15 +1105,20 @@ class DependencyGraph:
         Returns:
             List of files with import counts
         """
+        index = self._adjacency()
+        node_attrs = index.node_attrs
+        out_degree = index.out_degree.tolist()
+        in_degree = index.in_degree.tolist()
+
         files = []
-        for node in self.graph.nodes():
-            node_data = self.graph.nodes[node]
+        for i, node in enumerate(index.nodes):
+            node_data = node_attrs[i]
             files.append({
                 "file": node,
                 "module_name": node_data.get("module_name", node),
                 "language": node_data.get("language", "Unknown"),
-                "imports_count": self.graph.out_degree(node),
-                "imported_by_count": self.graph.in_degree(node),
+                "imports_count": out_degree[i],
+                "imported_by_count": in_degree[i],
             })
         # Sort by most connections (imports + imported_by)
         files.sort(key=lambda x: x["imports_count"] + x["imported_by_count"], reverse=True)
@@ -1,18 +1,65 @@
 """Generic code analyzer using Tree-sitter."""
 
+import mmap
 import os
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
 
-from .base import BaseAnalyzer
+from tree_sitter import Query, QueryCursor
+
+from .base import MMAP_MIN_BYTES, BaseAnalyzer
 from .dependency_graph import DependencyGraph
-from .utils.language_detector import LanguageDetector
+from .utils.language_detector import LanguageDetector, get_extension
 from .utils.gitignore_parser import GitignoreParser
 from .utils.tree_sitter_utils import TreeSitterManager
+from .utils.parse_cache import ParseCache, grammar_version
+from .utils.file_index import FileIndex
+from .pool import get_analysis_pool
 
 logger = logging.getLogger(__name__)
 
+# Below this many files, pool dispatch and IPC cost more than they save
+PARALLEL_MIN_FILES = 50
+
+# Files sent to a worker per task, to amortize IPC overhead
+PARALLEL_CHUNKSIZE = 32
+
+# Tasks one analysis keeps queued per pool worker. Bounding this keeps a
+# large repository from filling the shared pool's queue ahead of other
+# analyses (their tasks interleave instead) and bounds memory for results
+PARALLEL_PENDING_PER_WORKER = 2
+
+# Extensions that are always binary; skipped before any other check
+BINARY_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp", ".pdf",
+    ".zip", ".tar", ".gz", ".bz2", ".xz", ".7z", ".rar",
+    ".exe", ".dll", ".so", ".dylib", ".bin", ".iso", ".o", ".a",
+    ".mp4", ".mov", ".avi", ".wav", ".mp3", ".ogg",
+    ".woff", ".woff2", ".ttf", ".otf", ".eot",
+    ".class", ".jar", ".pyc", ".pyo", ".whl",
+})
+
+# Leading bytes inspected for a NUL when deciding if content is binary
+BINARY_SNIFF_BYTES = 512
+
+# Threads used to stat candidate files; stat() releases the GIL, so
+# overlapping calls hides filesystem latency on large or cold trees
+STAT_WORKERS = 32
+
+# Below this many candidates, a thread pool costs more than it saves
+STAT_BATCH_MIN_FILES = 64
+
+# Threads used to list directories during the walk; like stat(), scandir()
+# releases the GIL, so directories of one level are listed concurrently
+WALK_WORKERS = min(8, os.cpu_count() or 1)
+
+# Below this many directories in a level, they are listed serially
+WALK_PARALLEL_MIN_DIRS = 8
+
 
 class GenericAnalyzer(BaseAnalyzer):
     """Generic analyzer using Tree-sitter for multiple languages."""
@@ -21,7 +68,12 @@ class GenericAnalyzer(BaseAnalyzer):
         self,
         repo_path: str,
         max_file_size_mb: int = 10,
-        use_gitignore: bool = True
+        use_gitignore: bool = True,
+        parse_cache_dir: Optional[str] = None,
+        file_list: Optional[List[str]] = None,
+        file_index_path: Optional[str] = None,
+        incremental: bool = True,
+        max_workers: Optional[int] = None
     ):
         """
         Initialize generic analyzer.
@@ -30,17 +82,56 @@ class GenericAnalyzer(BaseAnalyzer):
             repo_path: Path to repository
             max_file_size_mb: Maximum file size to analyze in MB (default: 10)
             use_gitignore: Whether to respect .gitignore patterns (default: True)
+            parse_cache_dir: Directory for the on-disk parse cache, or None
+                to disable caching (default: None)
+            file_list: Candidate file paths relative to repo_path, e.g. from
+                ``git ls-files``; the tree is walked when None, or when
+                use_gitignore is False, since such a listing never includes
+                .git (default: None)
+            file_index_path: File recording each file's mtime, size and
+                result, or None to disable incremental analysis (default: None)
+            incremental: Whether to reuse results for files unchanged since
+                the index was last saved; when False every file is analyzed
+                and the index rewritten (default: True)
+            max_workers: Most pool workers this analysis keeps busy at once;
+                1 analyzes every file serially in this process, None uses
+                the whole shared pool (default: None)
         """
         super().__init__(repo_path)
 
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
         self.use_gitignore = use_gitignore
+        self.parse_cache_dir = parse_cache_dir
+        self.parse_cache = ParseCache(parse_cache_dir) if parse_cache_dir else None
+        self.file_list = file_list
+        self.file_index = FileIndex(file_index_path) if file_index_path else None
+        self.incremental = incremental
+        self.max_workers = max_workers
 
         # Initialize utilities
         self.language_detector = LanguageDetector()
         self.tree_sitter_manager = TreeSitterManager()
         self.gitignore_parser = GitignoreParser(use_defaults=True)
 
+        # Language -> (grammar name, import extractor bound to the grammar's
+        # import query), resolved once so each file costs one lookup rather
+        # than support/grammar checks and a comparison chain
+        extractors = {
+            "Python": self._extract_python_imports,
+            "JavaScript": self._extract_javascript_imports,
+            "TypeScript": self._extract_javascript_imports,
+            "TSX": self._extract_javascript_imports,
+        }
+        self._import_dispatch: Dict[str, Tuple[str, Callable[[Any], List[str]]]] = {}
+        for language, extractor in extractors.items():
+            grammar_name = self.language_detector.get_grammar_name(language)
+            if grammar_name and self.language_detector.is_supported_language(language):
+                query = self.tree_sitter_manager.get_import_query(grammar_name)
+                if query is not None:
+                    self._import_dispatch[language] = (
+                        grammar_name, partial(extractor, query=query)
+                    )
+
         # Parse .gitignore if using
         if self.use_gitignore:
             self.gitignore_parser.parse_gitignore(str(self.repo_path))
@@ -50,6 +141,9 @@ class GenericAnalyzer(BaseAnalyzer):
         self._file_imports: Dict[str, List[str]] = {}
         self._file_languages: Dict[str, str] = {}
 
+        # File path -> (mtime_ns, size), recorded while collecting files
+        self._file_versions: Dict[str, Tuple[int, int]] = {}
+
     def analyze(self) -> Dict[str, Any]:
         """
         Run full repository analysis.
@@ -60,40 +154,189 @@ class GenericAnalyzer(BaseAnalyzer):
         logger.info(f"Starting analysis of {self.repo_path}")
 
         # Reset stats and dependency tracking
-        self.stats = {
-            "files": 0,
-            "directories": 0,
-            "lines_of_code": 0,
-            "languages": {}
-        }
+        self._reset_stats()
         self._file_imports = {}
         self._file_languages = {}
+        self._file_versions = {}
         self._dependency_graph = None
 
         # Collect files to analyze
         files_to_analyze = self._collect_files()
         logger.info(f"Found {len(files_to_analyze)} files to analyze")
 
-        # Analyze each file
-        for file_path, language in files_to_analyze:
-            try:
-                file_stats = self.analyze_file(str(file_path), language)
-                self._update_stats(language, file_stats)
-
-                # Track imports for dependency graph
-                self._file_imports[str(file_path)] = file_stats.get("imports", [])
-                self._file_languages[str(file_path)] = language
-            except Exception as e:
-                logger.warning(f"Error analyzing {file_path}: {e}")
+        # Analyze each file, sharded across the shared process pool for
+        # larger repositories; stats are reduced here in the parent
+        if self.file_index is not None:
+            results = self._analyze_changed_files(files_to_analyze)
+        else:
+            results = self._analyze_files(files_to_analyze)
+
+        for file_path, language, file_stats in results:
+            if file_stats is None:
                 continue
 
+            self._update_stats(language, file_stats)
+
+            # Track imports for dependency graph
+            self._file_imports[file_path] = file_stats.get("imports", [])
+            self._file_languages[file_path] = language
+
         # Build dependency graph from collected imports
         self._build_dependency_graph()
 
-        logger.info(f"Analysis complete: {self.stats['files']} files, "
-                   f"{self.stats['lines_of_code']} LOC")
+        stats = self.get_stats()
+        logger.info(f"Analysis complete: {stats['files']} files, "
+                   f"{stats['lines_of_code']} LOC")
+
+        return stats
 
-        return self.get_stats()
+    def _analyze_files(
+        self,
+        files: List[Tuple[Path, str]]
+    ) -> Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]:
+        """
+        Analyze collected files, in parallel when there are enough of them.
+
+        Args:
+            files: List of (file_path, language) tuples
+
+        Yields:
+            (file_path, language, file_stats) tuples, in input order;
+            file_stats is None if the file could not be analyzed
+        """
+        paths = [str(file_path) for file_path, _ in files]
+        languages = [language for _, language in files]
+
+        if len(files) < PARALLEL_MIN_FILES or self.max_workers == 1:
+            results = map(self._analyze_file_safe, paths, languages)
+        else:
+            results = self._analyze_in_pool(paths, languages)
+
+        return zip(paths, languages, results)
+
+    def _analyze_in_pool(
+        self,
+        paths: List[str],
+        languages: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze files in the shared process pool, a bounded window at a time.
+
+        Files are dispatched largest first, so a big file found late in the
+        walk doesn't become the straggler the whole analysis waits on; the
+        largest go one per task, the long tail of small files in chunks.
+        Chunks are submitted as earlier ones complete, so only
+        PARALLEL_PENDING_PER_WORKER tasks per worker (or max_workers tasks,
+        if set) are queued by this analysis at any time.
+
+        Args:
+            paths: File paths
+            languages: Detected language of each file
+
+        Returns:
+            File stats (or None), in input order
+        """
+        pool = get_analysis_pool()
+        workers = self.max_workers or os.cpu_count() or 1
+        if self.max_workers:
+            window = self.max_workers
+        else:
+            window = PARALLEL_PENDING_PER_WORKER * workers
+
+        # Sizes were recorded while collecting files; stable, so equal
+        # sizes keep walk order
+        sizes = [self._file_versions.get(path, (0, 0))[1] for path in paths]
+        order = sorted(range(len(paths)), key=sizes.__getitem__, reverse=True)
+        chunks = [order[i:i + 1] for i in range(min(workers, len(order)))]
+        chunks.extend(
+            order[start:start + PARALLEL_CHUNKSIZE]
+            for start in range(len(chunks), len(order), PARALLEL_CHUNKSIZE)
+        )
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(paths)
+        pending: Deque[Tuple[List[int], Future]] = deque()
+
+        def collect() -> None:
+            indices, future = pending.popleft()
+            for i, file_stats in zip(indices, future.result()):
+                results[i] = file_stats
+
+        for indices in chunks:
+            if len(pending) >= window:
+                collect()
+            pending.append((indices, pool.submit(
+                _analyze_chunk_worker,
+                str(self.repo_path),
+                self.parse_cache_dir,
+                [paths[i] for i in indices],
+                [languages[i] for i in indices],
+            )))
+
+        while pending:
+            collect()
+
+        return results
+
+    def _analyze_changed_files(
+        self,
+        files: List[Tuple[Path, str]]
+    ) -> Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]:
+        """
+        Analyze only files changed since the file index was saved.
+
+        Unchanged files (same mtime and size) reuse their indexed result
+        without being read. The index is rewritten with the current files
+        once all results have been consumed.
+
+        Args:
+            files: List of (file_path, language) tuples
+
+        Yields:
+            (file_path, language, file_stats) tuples, as _analyze_files()
+        """
+        if self.incremental:
+            self.file_index.load()
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        changed = []
+        for file_path, language in files:
+            path = str(file_path)
+            mtime_ns, size = self._file_versions[path]
+            version = grammar_version(self.language_detector.get_grammar_name(language))
+            stats = self.file_index.lookup(path, mtime_ns, size, language, version)
+            if stats is None:
+                changed.append((file_path, language))
+            else:
+                results[path] = stats
+
+        logger.info(f"Reusing results for {len(results)} unchanged files, "
+                    f"analyzing {len(changed)}")
+
+        for path, _, stats in self._analyze_files(changed):
+            results[path] = stats
+
+        for file_path, language in files:
+            path = str(file_path)
+            stats = results[path]
+            if stats is not None:
+                mtime_ns, size = self._file_versions[path]
+                version = grammar_version(self.language_detector.get_grammar_name(language))
+                self.file_index.record(path, mtime_ns, size, language, version, stats)
+            yield path, language, stats
+
+        self.file_index.save()
+
+    def _analyze_file_safe(
+        self,
+        file_path: str,
+        language: str
+    ) -> Optional[Dict[str, Any]]:
+        """Analyze a file, logging and returning None on failure."""
+        try:
+            return self.analyze_file(file_path, language)
+        except Exception as e:
+            logger.warning(f"Error analyzing {file_path}: {e}")
+            return None
 
     def _collect_files(self) -> List[tuple[Path, str]]:
         """
@@ -102,69 +345,215 @@ class GenericAnalyzer(BaseAnalyzer):
         Returns:
             List of (file_path, language) tuples
         """
+        if self.file_list is not None and self.use_gitignore:
+            return self._collect_listed_files()
+
         files = []
+        directories = 0
+
+        for path, language in self._walk(str(self.repo_path)):
+            if language is None:
+                directories += 1
+            else:
+                files.append((Path(path), language))
+
+        self.stats["directories"] += directories
+
+        return self._filter_by_size(files)
+
+    def _walk(self, root: str) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Walk a directory tree with os.scandir(), pruning ignored subtrees.
+
+        Directories are listed level by level; once a level is wide enough,
+        its directories are listed concurrently, since scandir() releases
+        the GIL while it waits on the filesystem. Results are then emitted
+        in the same order as a serial top-down walk, so the file order
+        doesn't depend on thread timing.
 
-        for root, dirs, filenames in os.walk(self.repo_path):
-            root_path = Path(root)
+        Args:
+            root: Directory to walk
 
-            # Filter out ignored directories (modify dirs in-place)
-            dirs[:] = [
-                d for d in dirs
-                if not self._should_ignore_dir(root, d)
-            ]
+        Yields:
+            (dir_path, None) for each non-ignored subdirectory and
+            (file_path, language) for each file to analyze, top-down with
+            a directory's files before its subdirectories
+        """
+        listings: Dict[str, Tuple[List[Tuple[str, str]], List[Tuple[str, bool]]]] = {}
+        level = [(root, "")]
+        executor: Optional[ThreadPoolExecutor] = None
 
-            # Count directories
-            self.stats["directories"] += len(dirs)
+        try:
+            while level:
+                if len(level) < WALK_PARALLEL_MIN_DIRS:
+                    scanned = [self._scan_directory(*entry) for entry in level]
+                else:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=WALK_WORKERS)
+                    scanned = list(executor.map(lambda entry: self._scan_directory(*entry), level))
+
+                next_level = []
+                for (directory, prefix), listing in zip(level, scanned):
+                    listings[directory] = listing
+                    next_level.extend(
+                        (path, f"{prefix}{os.path.basename(path)}/")
+                        for path, descend in listing[1] if descend
+                    )
+                level = next_level
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        def emit(directory: str) -> Iterator[Tuple[str, Optional[str]]]:
+            files, subdirs = listings[directory]
+            yield from files
+            for path, descend in subdirs:
+                yield path, None
+                if descend:
+                    yield from emit(path)
+
+        yield from emit(root)
+
+    def _scan_directory(
+        self,
+        directory: str,
+        prefix: str
+    ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, bool]]]:
+        """
+        List one directory, filtering its entries.
 
-            # Process files in this directory
-            for filename in filenames:
-                file_path = root_path / filename
+        Entries are classified from the directory listing itself. Like
+        os.walk(), symlinked directories are counted but not descended
+        into, and an unreadable directory is treated as empty.
 
-                # Check if file should be ignored
-                if self._should_ignore_file(file_path):
-                    continue
+        Args:
+            directory: Directory to list
+            prefix: Repository-relative POSIX prefix of entries in directory
+                ("" at the root, otherwise ending with "/")
 
-                # Check file size
-                try:
-                    if file_path.stat().st_size > self.max_file_size_bytes:
-                        logger.debug(f"Skipping large file: {file_path}")
+        Returns:
+            ((file_path, language) for each file to analyze,
+            (dir_path, descend) for each non-ignored subdirectory)
+        """
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        if not self._is_ignored(f"{prefix}{name}/"):
+                            subdirs.append((entry.path, not entry.is_symlink()))
                         continue
-                except OSError:
-                    continue
 
-                # Detect language
-                language = self.language_detector.detect_language(str(file_path))
-                if language:
-                    files.append((file_path, language))
+                    # Skip known binary formats outright
+                    if get_extension(name) in BINARY_EXTENSIONS:
+                        continue
+
+                    # Detect language; files of unknown type are not analyzed
+                    language = self.language_detector.detect_language(name)
+                    if not language:
+                        continue
+
+                    # Check if file should be ignored
+                    if self._is_ignored(prefix + name):
+                        continue
 
-        return files
+                    files.append((entry.path, language))
+        except OSError:
+            return [], []
 
-    def _should_ignore_dir(self, root: str, dirname: str) -> bool:
+        return files, subdirs
+
+    def _collect_listed_files(self) -> List[tuple[Path, str]]:
         """
-        Check if directory should be ignored.
+        Collect files to analyze from the precomputed file list.
 
-        Args:
-            root: Parent directory path
-            dirname: Directory name
+        Applies the same filters as the directory walk, including the same
+        .gitignore patterns (the repository root's .gitignore plus the
+        defaults; like the walk, nested .gitignore files are not read), and
+        counts the non-ignored directories that contain listed files.
 
         Returns:
-            True if should be ignored
+            List of (file_path, language) tuples
         """
-        if not self.use_gitignore:
-            return False
+        files = []
+        directories = set()
+
+        for relative_path in self.file_list:
+            directories.update(PurePosixPath(relative_path).parents)
+            file_path = self.repo_path / relative_path
 
-        dir_path = Path(root) / dirname
-        return self.gitignore_parser.should_ignore_dir(
-            str(dir_path),
-            str(self.repo_path)
+            if get_extension(relative_path) in BINARY_EXTENSIONS:
+                continue
+
+            language = self.language_detector.detect_language(relative_path)
+            if not language:
+                continue
+
+            if self._is_ignored(relative_path):
+                continue
+
+            files.append((file_path, language))
+
+        directories.discard(PurePosixPath("."))
+        self.stats["directories"] += sum(
+            1 for directory in directories
+            if not self._is_ignored(f"{directory}/")
         )
 
-    def _should_ignore_file(self, file_path: Path) -> bool:
+        # Files listed in the index but missing from the working tree are
+        # dropped here, as their stat() fails
+        return self._filter_by_size(files)
+
+    def _filter_by_size(self, files: List[tuple[Path, str]]) -> List[tuple[Path, str]]:
+        """
+        Drop files that are too large or can no longer be stat'ed.
+
+        Candidates are stat'ed concurrently once there are enough of them;
+        the mtime and size of kept files are recorded for incremental
+        analysis.
+
+        Args:
+            files: Candidate (file_path, language) tuples
+
+        Returns:
+            The candidates within the size limit, in their original order
+        """
+        paths = [file_path for file_path, _ in files]
+
+        if len(files) < STAT_BATCH_MIN_FILES:
+            results = list(map(_file_stat, paths))
+        else:
+            with ThreadPoolExecutor(max_workers=STAT_WORKERS) as executor:
+                results = list(executor.map(_file_stat, paths))
+
+        kept = []
+        for (file_path, language), stat_result in zip(files, results):
+            if stat_result is None:
+                continue
+            if stat_result.st_size > self.max_file_size_bytes:
+                logger.debug(f"Skipping large file: {file_path}")
+                continue
+            self._file_versions[str(file_path)] = (
+                stat_result.st_mtime_ns, stat_result.st_size
+            )
+            kept.append((file_path, language))
+
+        return kept
+
+    def _is_ignored(self, relative_path: str) -> bool:
         """
-        Check if file should be ignored.
+        Check if a path should be ignored.
 
         Args:
-            file_path: File path
+            relative_path: Repository-relative POSIX path; directories
+                must end with "/" so directory-only patterns apply
 
         Returns:
             True if should be ignored
@@ -172,12 +561,9 @@ class GenericAnalyzer(BaseAnalyzer):
         if not self.use_gitignore:
             return False
 
-        return self.gitignore_parser.should_ignore(
-            str(file_path),
-            str(self.repo_path)
-        )
+        return self.gitignore_parser.match_relative(relative_path)
 
-    def analyze_file(self, file_path: str, language: str) -> Dict[str, Any]:
+    def analyze_file(self, file_path: str, language: str) -> Optional[Dict[str, Any]]:
         """
         Analyze a single file.
 
@@ -186,115 +572,118 @@ class GenericAnalyzer(BaseAnalyzer):
             language: Detected language name
 
         Returns:
-            Dictionary with file metrics:
+            Dictionary with file metrics, or None if the content is binary
+            or cannot be read:
             {
                 "lines": int,
                 "imports": List[str]
             }
         """
+        # Read once; the binary sniff, line count and parse all work on
+        # these bytes instead of reopening the file
+        try:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+                    return self._analyze_content(f.read(), language)
+
+                # Large files are parsed straight from the page cache rather
+                # than copied; the tree references the mapping, so analysis
+                # must finish before it is closed
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                    return self._analyze_content(source, language)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cannot read {file_path}: {e}")
+            return None
+
+    def _analyze_content(self, source, language: str) -> Optional[Dict[str, Any]]:
+        """
+        Analyze file content, through the parse cache if enabled.
+
+        Args:
+            source: Raw file content (bytes or a read-only mmap)
+            language: Detected language name
+
+        Returns:
+            File metrics as analyze_file(), or None if the content is binary
+        """
+        if b"\0" in source[:BINARY_SNIFF_BYTES]:
+            return None
+
+        if self.parse_cache is None:
+            return self._analyze_source(source, language)
+
+        key = ParseCache.key(source, language)
+        version = grammar_version(self.language_detector.get_grammar_name(language))
+
+        stats = self.parse_cache.get(key, version)
+        if stats is None:
+            stats = self._analyze_source(source, language)
+            self.parse_cache.put(key, version, stats)
+        return stats
+
+    def _analyze_source(self, source: bytes, language: str) -> Dict[str, Any]:
+        """Count lines and extract imports from a file's content."""
         stats = {
-            "lines": 0,
+            "lines": self._count_source_lines(source),
             "imports": []
         }
 
-        # Count lines
-        stats["lines"] = self._count_lines(file_path)
-
-        # Try to parse with Tree-sitter if supported
-        if self.language_detector.is_supported_language(language):
-            grammar_name = self.language_detector.get_grammar_name(language)
-            if grammar_name:
-                tree = self.tree_sitter_manager.parse_file(file_path, grammar_name)
-                if tree:
-                    # Extract imports
-                    imports = self._extract_imports(tree, language)
-                    stats["imports"] = imports
+        # Parse with Tree-sitter if imports can be extracted for the language
+        target = self._import_dispatch.get(language)
+        if target is not None:
+            grammar_name, extractor = target
+            tree = self.tree_sitter_manager.parse_code(source, grammar_name)
+            if tree:
+                # Extract imports
+                stats["imports"] = self._extract_imports(tree, extractor)
 
         return stats
 
-    def _extract_imports(self, tree, language: str) -> List[str]:
+    def _extract_imports(self, tree, extractor: Callable[[Any], List[str]]) -> List[str]:
         """
         Extract import statements from syntax tree.
 
         Args:
             tree: Tree-sitter syntax tree
-            language: Language name
+            extractor: Language-specific extractor from the import dispatch
 
         Returns:
             List of imported module names
         """
-        imports = []
-
         try:
-            root_node = tree.root_node
-
-            if language == "Python":
-                imports = self._extract_python_imports(root_node)
-            elif language in ["JavaScript", "TypeScript", "TSX"]:
-                imports = self._extract_javascript_imports(root_node)
-
+            return extractor(tree.root_node)
         except Exception as e:
             logger.debug(f"Error extracting imports: {e}")
+            return []
+
+    def _extract_python_imports(self, root_node, query: Query) -> List[str]:
+        """
+        Extract Python imports (``import foo`` and ``from foo import bar``).
+
+        Relative imports keep their leading dots (``from .b import x`` gives
+        ".b"); ``from . import b`` names modules of the package itself, so
+        it gives ".b" too.
+        """
+        captures = QueryCursor(query).captures(root_node)
+        imports = {node.text.decode('utf-8') for node in captures.get("module", [])}
+
+        for statement in captures.get("relative_import", []):
+            module = statement.child_by_field_name("module_name").text.decode('utf-8')
+            if module.strip("."):
+                imports.add(module)
+                continue
+            for name in statement.children_by_field_name("name"):
+                if name.type == "aliased_import":
+                    name = name.child_by_field_name("name")
+                imports.add(module + name.text.decode('utf-8'))
+
+        return list(imports)
 
-        return imports
-
-    def _extract_python_imports(self, root_node) -> List[str]:
-        """Extract Python imports."""
-        imports = []
-
-        def traverse(node):
-            # import statement: import foo, bar
-            if node.type == "import_statement":
-                for child in node.children:
-                    if child.type == "dotted_name":
-                        imports.append(child.text.decode('utf-8'))
-
-            # from statement: from foo import bar
-            elif node.type == "import_from_statement":
-                for child in node.children:
-                    if child.type == "dotted_name":
-                        imports.append(child.text.decode('utf-8'))
-                        break
-
-            # Recurse
-            for child in node.children:
-                traverse(child)
-
-        traverse(root_node)
-        return list(set(imports))  # Remove duplicates
-
-    def _extract_javascript_imports(self, root_node) -> List[str]:
-        """Extract JavaScript/TypeScript imports."""
-        imports = []
-
-        def traverse(node):
-            # import statement
-            if node.type == "import_statement":
-                # Look for string literals (module names)
-                for child in node.children:
-                    if child.type == "string":
-                        # Remove quotes
-                        import_path = child.text.decode('utf-8').strip('"\'')
-                        imports.append(import_path)
-
-            # require() calls (CommonJS)
-            elif node.type == "call_expression":
-                # Check if it's a require() call
-                func = node.child_by_field_name("function")
-                if func and func.text == b"require":
-                    args = node.child_by_field_name("arguments")
-                    if args:
-                        for arg in args.children:
-                            if arg.type == "string":
-                                import_path = arg.text.decode('utf-8').strip('"\'')
-                                imports.append(import_path)
-
-            # Recurse
-            for child in node.children:
-                traverse(child)
-
-        traverse(root_node)
-        return list(set(imports))  # Remove duplicates
+    def _extract_javascript_imports(self, root_node, query: Query) -> List[str]:
+        """Extract JavaScript/TypeScript imports and require() calls."""
+        modules = QueryCursor(query).captures(root_node).get("module", [])
+        # Remove quotes
+        return list({node.text.decode('utf-8').strip('"\'') for node in modules})
 
     def _build_dependency_graph(self) -> None:
         """
@@ -354,3 +743,96 @@ class GenericAnalyzer(BaseAnalyzer):
             return {}
 
         return self._dependency_graph.get_summary()
+
+
+def analyze_repository(
+    repo_path: str,
+    max_file_size_mb: int = 10,
+    use_gitignore: bool = True,
+    parse_cache_dir: Optional[str] = None,
+    file_list: Optional[List[str]] = None,
+    file_index_path: Optional[str] = None,
+    incremental: bool = True,
+    max_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Run a full analysis of a repository.
+
+    Module-level (and so picklable) entry point for running an analysis
+    in a worker process.
+
+    Args:
+        repo_path: Path to repository
+        max_file_size_mb: Maximum file size to analyze in MB
+        use_gitignore: Whether to respect .gitignore patterns
+        parse_cache_dir: Directory for the on-disk parse cache, or None
+        file_list: Candidate file paths relative to repo_path, or None to
+            walk the tree
+        file_index_path: File index for incremental analysis, or None
+        incremental: Whether to reuse results for unchanged files
+        max_workers: Most pool workers to keep busy; 1 for serial analysis
+
+    Returns:
+        Analysis statistics, as returned by GenericAnalyzer.analyze()
+    """
+    analyzer = GenericAnalyzer(
+        repo_path=repo_path,
+        max_file_size_mb=max_file_size_mb,
+        use_gitignore=use_gitignore,
+        parse_cache_dir=parse_cache_dir,
+        file_list=file_list,
+        file_index_path=file_index_path,
+        incremental=incremental,
+        max_workers=max_workers
+    )
+    return analyzer.analyze()
+
+
+def _file_stat(file_path: Path) -> Optional[os.stat_result]:
+    """Stat a file, or return None if it cannot be stat'ed."""
+    try:
+        return os.stat(file_path)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _get_worker_analyzer(
+    repo_path: str,
+    parse_cache_dir: Optional[str]
+) -> GenericAnalyzer:
+    """
+    Get this worker process's analyzer for a repository.
+
+    Built once per repository per worker, so grammars and parsers are
+    loaded once rather than per task. File collection already applied
+    .gitignore in the parent, so the worker skips parsing it.
+    """
+    return GenericAnalyzer(
+        repo_path=repo_path,
+        use_gitignore=False,
+        parse_cache_dir=parse_cache_dir
+    )
+
+
+def _analyze_chunk_worker(
+    repo_path: str,
+    parse_cache_dir: Optional[str],
+    file_paths: List[str],
+    languages: List[str]
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Analyze a chunk of files in a pool worker.
+
+    Args:
+        repo_path: Path to repository the files belong to
+        parse_cache_dir: Parse cache directory, or None if disabled
+        file_paths: Paths to files
+        languages: Detected language of each file
+
+    Returns:
+        File metrics as returned by GenericAnalyzer.analyze_file(), in
+        order, with None for files that could not be analyzed
+    """
+    analyzer = _get_worker_analyzer(repo_path, parse_cache_dir)
+    return list(map(analyzer._analyze_file_safe, file_paths, languages))
@@ -0,0 +1,48 @@
+"""Shared process pool for CPU-bound analysis work."""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Lazily created so importing the analyzer package never starts processes
+_analysis_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_analysis_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared analysis process pool, creating it on first use.
+
+    Workers are started with ``spawn`` rather than ``fork``: the API
+    process holds database connections and helper threads that are not
+    safe to duplicate into a child.
+
+    Returns:
+        ProcessPoolExecutor sized to the number of CPUs
+    """
+    global _analysis_pool
+
+    with _pool_lock:
+        if _analysis_pool is None:
+            max_workers = os.cpu_count() or 1
+            _analysis_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info("Started analysis process pool with %s workers", max_workers)
+        return _analysis_pool
+
+
+def shutdown_analysis_pool() -> None:
+    """Shut down the shared analysis pool, if it was started."""
+    global _analysis_pool
+
+    with _pool_lock:
+        if _analysis_pool is not None:
+            _analysis_pool.shutdown(wait=False, cancel_futures=True)
+            _analysis_pool = None
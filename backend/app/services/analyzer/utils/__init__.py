@@ -3,5 +3,13 @@
 from .language_detector import LanguageDetector
 from .gitignore_parser import GitignoreParser
 from .tree_sitter_utils import TreeSitterManager
+from .parse_cache import ParseCache
+from .file_index import FileIndex
 
-__all__ = ["LanguageDetector", "GitignoreParser", "TreeSitterManager"]
+__all__ = [
+    "LanguageDetector",
+    "GitignoreParser",
+    "TreeSitterManager",
+    "ParseCache",
+    "FileIndex",
+]
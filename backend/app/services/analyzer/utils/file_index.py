@@ -0,0 +1,114 @@
+"""Per-project index of file metadata for incremental analysis."""
+
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class FileIndex:
+    """
+    Map of file path to (mtime, size) and the analysis result at that version.
+
+    A file whose modification time and size still match its entry is taken
+    to be unchanged, so its stored result is reused without reading it.
+    Entries modified at or after the time the index was saved are "racy"
+    (a later write within the same timestamp tick would go unnoticed) and
+    are never reused.
+
+    The index is stored as one JSON file, replaced atomically on save.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize file index.
+
+        Args:
+            path: JSON file the index is loaded from and saved to
+        """
+        self.path = Path(path)
+        self._previous: Dict[str, list] = {}
+        self._saved_ns = 0
+        self._entries: Dict[str, list] = {}
+
+    def load(self) -> None:
+        """Load the previously saved index; a missing or corrupt file is empty."""
+        try:
+            data = orjson.loads(self.path.read_bytes())
+            self._previous = data["files"]
+            self._saved_ns = data["saved_ns"]
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            self._previous = {}
+            self._saved_ns = 0
+
+    def lookup(
+        self,
+        file_path: str,
+        mtime_ns: int,
+        size: int,
+        language: str,
+        version: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored result for a file, if it is unchanged.
+
+        Args:
+            file_path: Path identifying the file
+            mtime_ns: Current modification time in nanoseconds
+            size: Current size in bytes
+            language: Detected language name
+            version: Grammar version the result must have been produced with
+
+        Returns:
+            Stored file stats, or None if the file changed or is unknown
+        """
+        entry = self._previous.get(file_path)
+        if entry is None or mtime_ns >= self._saved_ns:
+            return None
+        if entry[:4] != [mtime_ns, size, language, version]:
+            return None
+        return entry[4]
+
+    def record(
+        self,
+        file_path: str,
+        mtime_ns: int,
+        size: int,
+        language: str,
+        version: str,
+        stats: Dict[str, Any]
+    ) -> None:
+        """
+        Record a file's current version and result for the next save.
+
+        Args:
+            file_path: Path identifying the file
+            mtime_ns: Modification time in nanoseconds
+            size: Size in bytes
+            language: Detected language name
+            version: Grammar version the result was produced with
+            stats: File stats to store
+        """
+        self._entries[file_path] = [mtime_ns, size, language, version, stats]
+
+    def save(self) -> None:
+        """Replace the stored index with the recorded entries."""
+        data = {"saved_ns": time.time_ns(), "files": self._entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps(data))
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write file index {self.path}: {e}")
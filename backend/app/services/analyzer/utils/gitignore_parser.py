@@ -1,7 +1,9 @@
 """Gitignore pattern parsing and matching utilities."""
 
+import os
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Pattern, Tuple
 import logging
 from pathspec import PathSpec
 from pathspec.patterns import GitWildMatchPattern
@@ -73,6 +75,70 @@ DEFAULT_IGNORE_PATTERNS = [
 ]
 
 
+# Most match results kept per parser; past this, new paths are matched
+# without being cached, to cap memory on very large trees
+IGNORE_CACHE_MAX_ENTRIES = 200_000
+
+# Named groups in pathspec's pattern regexes; renamed to plain groups when
+# patterns are joined, since a name may only occur once per regex
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+
+class _CombinedMatcher:
+    """
+    Match paths against a PathSpec's patterns with one regex search per run.
+
+    Consecutive patterns with the same effect (ignore, or re-include for
+    "!" patterns) are joined into a single alternation. Runs are tried
+    last to first, and the first run that matches decides, which is the
+    same "last matching pattern wins" rule PathSpec.match_file() applies
+    by testing every pattern in turn.
+    """
+
+    def __init__(self, spec: PathSpec):
+        """
+        Compile the spec's patterns.
+
+        Args:
+            spec: Compiled gitignore patterns
+        """
+        runs: List[Tuple[bool, List[str]]] = []
+        for pattern in spec.patterns:
+            if pattern.include is None:
+                continue
+            source = _NAMED_GROUP.sub("(?:", pattern.regex.pattern)
+            if runs and runs[-1][0] == pattern.include:
+                runs[-1][1].append(source)
+            else:
+                runs.append((pattern.include, [source]))
+
+        self._runs: List[Tuple[bool, Pattern[str]]] = [
+            (include, re.compile("|".join(f"(?:{source})" for source in sources)))
+            for include, sources in reversed(runs)
+        ]
+
+    def match(self, relative_path: str) -> bool:
+        """
+        Check whether a relative POSIX path is ignored.
+
+        Args:
+            relative_path: Path relative to the repository root
+
+        Returns:
+            True if the last matching pattern ignores the path
+        """
+        # Same normalization as pathspec.util.normalize_file()
+        if relative_path.startswith("/"):
+            relative_path = relative_path[1:]
+        elif relative_path.startswith("./"):
+            relative_path = relative_path[2:]
+
+        for include, regex in self._runs:
+            if regex.search(relative_path) is not None:
+                return include
+        return False
+
+
 class GitignoreParser:
     """Parse .gitignore files and match paths against patterns."""
 
@@ -87,7 +153,26 @@ class GitignoreParser:
         if use_defaults:
             self.patterns.extend(DEFAULT_IGNORE_PATTERNS)
 
-        self.pathspec: Optional[PathSpec] = None
+        self._pathspec: Optional[PathSpec] = None
+        # The same patterns joined into a few regexes, used for matching
+        self._matcher: Optional[_CombinedMatcher] = None
+        # Set when patterns were added since the spec was last compiled
+        self._dirty = False
+        # Relative POSIX path (directories with a trailing "/") -> result,
+        # valid for the current compiled spec
+        self._ignore_cache: Dict[str, bool] = {}
+
+        # Repository root, and the same with a trailing separator for
+        # relativizing paths by string prefix
+        self._repo_root: Optional[str] = None
+        self._repo_prefix: Optional[str] = None
+
+    @property
+    def pathspec(self) -> Optional[PathSpec]:
+        """Compiled patterns, rebuilt on first use after patterns change."""
+        if self._dirty:
+            self._build_pathspec()
+        return self._pathspec
 
     def parse_gitignore(self, repo_path: str) -> None:
         """
@@ -96,6 +181,7 @@ class GitignoreParser:
         Args:
             repo_path: Path to repository
         """
+        self.set_repo_root(repo_path)
         gitignore_path = Path(repo_path) / ".gitignore"
 
         if gitignore_path.exists():
@@ -116,24 +202,39 @@ class GitignoreParser:
         # Build PathSpec from patterns
         self._build_pathspec()
 
+    def set_repo_root(self, repo_path: str) -> None:
+        """
+        Set the repository root that checked paths are relative to.
+
+        Args:
+            repo_path: Path to repository
+        """
+        self._repo_root = str(repo_path)
+        self._repo_prefix = os.path.join(self._repo_root, "")
+
     def _build_pathspec(self) -> None:
         """Build PathSpec object from patterns."""
+        self._dirty = False
+        self._ignore_cache.clear()
         try:
-            self.pathspec = PathSpec.from_lines(
+            self._pathspec = PathSpec.from_lines(
                 GitWildMatchPattern,
                 self.patterns
             )
+            self._matcher = _CombinedMatcher(self._pathspec)
         except Exception as e:
             logger.error(f"Error building PathSpec: {e}")
-            self.pathspec = None
+            self._pathspec = None
+            self._matcher = None
 
-    def should_ignore(self, file_path: str, repo_path: str) -> bool:
+    def should_ignore(self, file_path: str, repo_path: Optional[str] = None) -> bool:
         """
         Check if file should be ignored.
 
         Args:
             file_path: Absolute or relative file path
-            repo_path: Repository root path
+            repo_path: Repository root path (default: the root set by
+                parse_gitignore() or set_repo_root())
 
         Returns:
             True if file should be ignored, False otherwise
@@ -142,48 +243,93 @@ class GitignoreParser:
             return False
 
         try:
-            # Convert to relative path from repo root
-            file_path_obj = Path(file_path)
-            repo_path_obj = Path(repo_path)
-
-            # Always try to compute relative path from repo root
-            # This handles both absolute and relative paths that include the repo path
-            try:
-                relative_path = file_path_obj.relative_to(repo_path_obj)
-            except ValueError:
-                # Path doesn't start with repo_path, use as-is
-                # This can happen for paths already relative to repo root
-                relative_path = file_path_obj
-
-            # Convert to POSIX path for matching
-            posix_path = relative_path.as_posix()
-
-            # Match against patterns
-            return self.pathspec.match_file(posix_path)
-
-        except ValueError:
-            # Path is outside repo
-            return False
+            return self._match(self._relative_posix(file_path, repo_path))
         except Exception as e:
             logger.warning(f"Error checking ignore for {file_path}: {e}")
             return False
 
-    def should_ignore_dir(self, dir_path: str, repo_path: str) -> bool:
+    def should_ignore_dir(self, dir_path: str, repo_path: Optional[str] = None) -> bool:
         """
         Check if directory should be ignored.
 
         Args:
             dir_path: Directory path
-            repo_path: Repository root path
+            repo_path: Repository root path (default: the root set by
+                parse_gitignore() or set_repo_root())
 
         Returns:
             True if directory should be ignored, False otherwise
         """
-        # For directories, add trailing slash for proper matching
-        if not dir_path.endswith('/'):
-            dir_path = dir_path + '/'
+        if self.pathspec is None:
+            return False
+
+        try:
+            # Trailing slash so directory-only patterns ("build/") apply;
+            # added after conversion, since Path() would strip it
+            relative_path = self._relative_posix(dir_path, repo_path).rstrip('/')
+            return self._match(relative_path + '/')
+        except Exception as e:
+            logger.warning(f"Error checking ignore for {dir_path}: {e}")
+            return False
+
+    def match_relative(self, relative_path: str) -> bool:
+        """
+        Check a repository-relative POSIX path against the patterns.
+
+        Skips the path conversion done by should_ignore(), for callers that
+        already track relative paths (e.g. while walking the tree).
+
+        Args:
+            relative_path: Path relative to the repository root, using "/"
+                separators; directories must end with "/"
+
+        Returns:
+            True if the path should be ignored, False otherwise
+        """
+        if self.pathspec is None:
+            return False
+
+        return self._match(relative_path)
+
+    def _match(self, relative_path: str) -> bool:
+        """
+        Match a relative POSIX path against the compiled spec, memoized.
 
-        return self.should_ignore(dir_path, repo_path)
+        Callers must have checked that the spec exists (which also brings
+        it, and so the cache, up to date).
+        """
+        cache = self._ignore_cache
+        result = cache.get(relative_path)
+        if result is None:
+            result = self._matcher.match(relative_path)
+            if len(cache) < IGNORE_CACHE_MAX_ENTRIES:
+                cache[relative_path] = result
+        return result
+
+    def _relative_posix(self, path: str, repo_path: Optional[str]) -> str:
+        """
+        Convert a path to a POSIX path relative to the repository root.
+
+        Paths that don't start with repo_path are assumed to already be
+        relative to the repository root and are used as-is.
+        """
+        if repo_path is None or repo_path == self._repo_root:
+            repo_path, prefix = self._repo_root, self._repo_prefix
+        else:
+            prefix = os.path.join(repo_path, "")
+
+        # Plain string slicing for the common case of a path under the root
+        if prefix is not None and path.startswith(prefix):
+            relative = path[len(prefix):]
+            return relative.replace(os.sep, "/") if os.sep != "/" else relative
+
+        path_obj = Path(path)
+        if repo_path is not None:
+            try:
+                path_obj = path_obj.relative_to(Path(repo_path))
+            except ValueError:
+                pass
+        return path_obj.as_posix()
 
     def add_pattern(self, pattern: str) -> None:
         """
@@ -193,7 +339,7 @@ class GitignoreParser:
             pattern: Gitignore-style pattern
         """
         self.patterns.append(pattern)
-        self._build_pathspec()
+        self._dirty = True
 
     def add_patterns(self, patterns: List[str]) -> None:
         """
@@ -203,12 +349,15 @@ class GitignoreParser:
             patterns: List of gitignore-style patterns
         """
         self.patterns.extend(patterns)
-        self._build_pathspec()
+        self._dirty = True
 
     def clear_patterns(self) -> None:
         """Clear all patterns."""
         self.patterns = []
-        self.pathspec = None
+        self._pathspec = None
+        self._matcher = None
+        self._dirty = False
+        self._ignore_cache.clear()
 
     def get_patterns(self) -> List[str]:
         """
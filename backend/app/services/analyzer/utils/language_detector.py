@@ -1,7 +1,7 @@
 """Language detection utilities based on file extensions."""
 
+import os
 from typing import Optional, Set
-from pathlib import Path
 
 
 # Map file extensions to language names
@@ -113,6 +113,33 @@ SUPPORTED_LANGUAGES = {
     "TSX",
 }
 
+# Lowercased extension -> language lookup used by detect_language(), with
+# .tsx (TypeScript in LANGUAGE_MAP) resolved to its own grammar
+_DETECT_MAP = {extension.lower(): language for extension, language in LANGUAGE_MAP.items()}
+_DETECT_MAP[".tsx"] = "TSX"
+
+
+def get_extension(file_path: str) -> str:
+    """
+    Get a file's extension, lowercased, using plain string operations.
+
+    Matches ``Path(file_path).suffix.lower()`` without building a Path:
+    a leading dot (".bashrc") or trailing dot ("file.") is not an extension.
+
+    Args:
+        file_path: File name or path
+
+    Returns:
+        Extension including the dot (e.g. ".py"), or "" if there is none
+    """
+    start = file_path.rfind("/") + 1
+    if os.sep != "/":
+        start = max(start, file_path.rfind(os.sep) + 1)
+    dot = file_path.rfind(".")
+    if dot <= start or dot == len(file_path) - 1:
+        return ""
+    return file_path[dot:].lower()
+
 
 class LanguageDetector:
     """Detect programming language from file extension."""
@@ -133,14 +160,7 @@ class LanguageDetector:
         Returns:
             Language name or None if unknown
         """
-        path = Path(file_path)
-        extension = path.suffix.lower()
-
-        # Special case for .tsx files
-        if extension == ".tsx":
-            return "TSX"
-
-        return self.language_map.get(extension)
+        return _DETECT_MAP.get(get_extension(file_path))
 
     def is_supported_language(self, language: str) -> bool:
         """
@@ -0,0 +1,130 @@
+"""On-disk cache of per-file analysis results."""
+
+import hashlib
+import logging
+import os
+import tempfile
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape or meaning of cached entries changes
+CACHE_FORMAT_VERSION = 4
+
+# Distribution providing each Tree-sitter grammar
+GRAMMAR_PACKAGES = {
+    "python": "tree-sitter-python",
+    "javascript": "tree-sitter-javascript",
+    "typescript": "tree-sitter-typescript",
+    "tsx": "tree-sitter-typescript",
+}
+
+
+@lru_cache(maxsize=None)
+def grammar_version(grammar_name: Optional[str]) -> str:
+    """
+    Get a version tag for the grammar used to parse a language.
+
+    Args:
+        grammar_name: Tree-sitter grammar identifier, or None if the
+            language is not parsed
+
+    Returns:
+        Version string that changes whenever parse output could change
+    """
+    parts = [f"v{CACHE_FORMAT_VERSION}"]
+    package = GRAMMAR_PACKAGES.get(grammar_name) if grammar_name else None
+    if package:
+        for dist in ("tree-sitter", package):
+            try:
+                parts.append(f"{dist}={metadata.version(dist)}")
+            except metadata.PackageNotFoundError:
+                parts.append(f"{dist}=unknown")
+    return ";".join(parts)
+
+
+class ParseCache:
+    """
+    Content-addressed cache of file analysis results.
+
+    Entries live at ``<cache_dir>/<hash[:2]>/<hash[2:]>.json`` and are keyed
+    by the SHA-256 of the file content and language, so unchanged files are
+    not re-parsed on re-analysis. Each entry records the grammar version it
+    was produced with; a mismatch is treated as a miss.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize parse cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in
+        """
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(source: bytes, language: str) -> str:
+        """
+        Compute the cache key for file content.
+
+        Args:
+            source: Raw file content
+            language: Detected language name
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        digest = hashlib.sha256(source)
+        digest.update(b"\0" + language.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key[2:]}.json"
+
+    def get(self, key: str, version: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key from key()
+            version: Expected grammar version
+
+        Returns:
+            Cached file stats, or None on a miss
+        """
+        try:
+            entry = orjson.loads(self._entry_path(key).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+        if entry.get("grammar_ver") != version:
+            return None
+        return entry.get("stats")
+
+    def put(self, key: str, version: str, stats: Dict[str, Any]) -> None:
+        """
+        Store a result, atomically replacing any existing entry.
+
+        Args:
+            key: Cache key from key()
+            version: Grammar version the stats were produced with
+            stats: File stats to cache
+        """
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps({"grammar_ver": version, "stats": stats}))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write parse cache entry {path}: {e}")
@@ -1,11 +1,126 @@
 """Tree-sitter utilities for code parsing."""
 
+from functools import lru_cache
 from typing import Dict, Optional
 import logging
-from tree_sitter import Language, Parser, Tree
+import threading
+from tree_sitter import Language, Parser, Query, Tree
 
 logger = logging.getLogger(__name__)
 
+# Per-thread parser cache; a Parser holds mutable parse state, so it is
+# shared by every manager on a thread but never across threads
+_thread_parsers = threading.local()
+
+# Import patterns per language; every module name or path is captured as
+# @module. Only direct dotted names count for Python (aliased imports are
+# not captured); relative from-imports are captured whole, as
+# @relative_import, since their module may be in the imported names.
+_JS_IMPORT_QUERY = """
+(import_statement source: (string) @module)
+(call_expression
+  function: (identifier) @function
+  arguments: (arguments (string) @module)
+  (#eq? @function "require"))
+"""
+IMPORT_QUERIES: Dict[str, str] = {
+    "python": """
+(import_statement name: (dotted_name) @module)
+(import_from_statement module_name: (dotted_name) @module)
+(import_from_statement module_name: (relative_import)) @relative_import
+""",
+    "javascript": _JS_IMPORT_QUERY,
+    "typescript": _JS_IMPORT_QUERY,
+    "tsx": _JS_IMPORT_QUERY,
+}
+
+
+@lru_cache(maxsize=None)
+def load_languages() -> Dict[str, Language]:
+    """
+    Load Tree-sitter grammars for supported languages.
+
+    Grammars are loaded once per process and shared by every
+    TreeSitterManager; call this ahead of time to take the cost off the
+    first analysis.
+
+    Returns:
+        Mapping of language identifier to Language
+    """
+    languages: Dict[str, Language] = {}
+
+    try:
+        # Load Python
+        import tree_sitter_python
+        languages["python"] = Language(tree_sitter_python.language())
+        logger.info("Loaded Python grammar")
+
+        # Load JavaScript
+        import tree_sitter_javascript
+        languages["javascript"] = Language(tree_sitter_javascript.language())
+        logger.info("Loaded JavaScript grammar")
+
+        # Load TypeScript
+        import tree_sitter_typescript
+        languages["typescript"] = Language(tree_sitter_typescript.language_typescript())
+        logger.info("Loaded TypeScript grammar")
+
+        # Load TSX
+        languages["tsx"] = Language(tree_sitter_typescript.language_tsx())
+        logger.info("Loaded TSX grammar")
+
+    except ImportError as e:
+        logger.error(f"Failed to load Tree-sitter grammar: {e}")
+    except Exception as e:
+        logger.error(f"Error loading grammars: {e}")
+
+    return languages
+
+
+def get_parser(language: str) -> Optional[Parser]:
+    """
+    Get this thread's parser for a language, creating it on first use.
+
+    Args:
+        language: Language identifier (e.g., 'python', 'javascript')
+
+    Returns:
+        Parser instance or None if language not supported
+    """
+    parsers = getattr(_thread_parsers, "parsers", None)
+    if parsers is None:
+        parsers = _thread_parsers.parsers = {}
+
+    parser = parsers.get(language)
+    if parser is None:
+        grammar = load_languages().get(language)
+        if grammar is None:
+            return None
+        parser = parsers[language] = Parser(grammar)
+    return parser
+
+
+@lru_cache(maxsize=None)
+def get_import_query(language: str) -> Optional[Query]:
+    """
+    Get the compiled import query for a language.
+
+    Queries are immutable, so each is compiled once per process and shared
+    across threads; matching runs natively in a QueryCursor.
+
+    Args:
+        language: Language identifier (e.g., 'python', 'javascript')
+
+    Returns:
+        Query capturing imported modules as ``module``, or None if the
+        language has no grammar or import patterns
+    """
+    grammar = load_languages().get(language)
+    source = IMPORT_QUERIES.get(language)
+    if grammar is None or source is None:
+        return None
+    return Query(grammar, source)
+
 
 class TreeSitterManager:
     """Manage Tree-sitter parsers and languages."""
@@ -18,34 +133,7 @@ class TreeSitterManager:
 
     def _load_languages(self) -> None:
         """Load Tree-sitter grammars for supported languages."""
-        try:
-            # Load Python
-            import tree_sitter_python
-            py_lang = Language(tree_sitter_python.language())
-            self.languages["python"] = py_lang
-            logger.info("Loaded Python grammar")
-
-            # Load JavaScript
-            import tree_sitter_javascript
-            js_lang = Language(tree_sitter_javascript.language())
-            self.languages["javascript"] = js_lang
-            logger.info("Loaded JavaScript grammar")
-
-            # Load TypeScript
-            import tree_sitter_typescript
-            ts_lang = Language(tree_sitter_typescript.language_typescript())
-            self.languages["typescript"] = ts_lang
-            logger.info("Loaded TypeScript grammar")
-
-            # Load TSX
-            tsx_lang = Language(tree_sitter_typescript.language_tsx())
-            self.languages["tsx"] = tsx_lang
-            logger.info("Loaded TSX grammar")
-
-        except ImportError as e:
-            logger.error(f"Failed to load Tree-sitter grammar: {e}")
-        except Exception as e:
-            logger.error(f"Error loading grammars: {e}")
+        self.languages.update(load_languages())
 
     def get_parser(self, language: str) -> Optional[Parser]:
         """
@@ -63,15 +151,28 @@ class TreeSitterManager:
         if language in self.parsers:
             return self.parsers[language]
 
-        # Create new parser if language is available
+        # Reuse the thread's parser if language is available
         if language in self.languages:
-            parser = Parser(self.languages[language])
-            self.parsers[language] = parser
-            return parser
+            parser = get_parser(language)
+            if parser is not None:
+                self.parsers[language] = parser
+                return parser
 
         logger.warning(f"No grammar available for language: {language}")
         return None
 
+    def get_import_query(self, language: str) -> Optional[Query]:
+        """
+        Get the compiled import query for a language.
+
+        Args:
+            language: Language identifier (e.g., 'python', 'javascript')
+
+        Returns:
+            Query instance or None if language not supported
+        """
+        return get_import_query(language.lower())
+
     def parse_file(self, file_path: str, language: str) -> Optional[Tree]:
         """
         Parse a file and return syntax tree.
@@ -154,6 +154,12 @@ class ChunkingService:
             ]
 
             for filename in files:
+                # Detect language first; it needs only the name, and rejects
+                # most non-code files before any path or stat() work
+                language = self.language_detector.detect_language(filename)
+                if not language:
+                    continue
+
                 file_path = root_path / filename
 
                 # Check if should ignore
@@ -168,11 +174,6 @@ class ChunkingService:
                 except OSError:
                     continue
 
-                # Detect language
-                language = self.language_detector.detect_language(str(file_path))
-                if not language:
-                    continue
-
                 # Read content
                 try:
                     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
@@ -3,7 +3,7 @@
 import subprocess
 import shutil
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -233,3 +233,44 @@ class GitService:
         except Exception as e:
             logger.error(f"Error getting commit hash: {e}")
             return None
+
+    def list_files(self, local_path: str) -> Optional[List[str]]:
+        """
+        List files in a git working tree using the git index.
+
+        Includes tracked and untracked files, which is much cheaper than
+        walking the tree. No ignore rules are applied here: git's own
+        (nested .gitignore files, .git/info/exclude and the user's global
+        core.excludesFile) would make the result depend on the server's git
+        configuration, so callers filter the list with GitignoreParser, as
+        they would a directory walk.
+
+        Args:
+            local_path: Path to repository
+
+        Returns:
+            Paths relative to the repository root, or None if the path is
+            not a git repository or git failed
+        """
+        if not self.validate_repository(local_path):
+            return None
+
+        try:
+            result = subprocess.run(
+                [
+                    "git", "-C", local_path, "ls-files", "-z",
+                    "--cached", "--others",
+                ],
+                capture_output=True,
+                timeout=self.timeout
+            )
+            if result.returncode != 0:
+                logger.warning(f"git ls-files failed: {result.stderr.decode(errors='replace')}")
+                return None
+
+            paths = result.stdout.decode("utf-8", errors="surrogateescape").split("\0")
+            # Unmerged paths appear once per stage; keep the first occurrence
+            return list(dict.fromkeys(path for path in paths if path))
+        except Exception as e:
+            logger.error(f"Error listing files: {e}")
+            return None
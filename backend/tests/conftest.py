@@ -10,7 +10,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
-from app.database import Base, get_db
+from app.database import Base, get_db, json_serializer, json_deserializer
 from app.main import app
 from app.models.project import Project
 from app.schemas.project import ProjectStatus, SourceType
@@ -37,6 +37,8 @@ def test_db_engine():
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,  # Ensures same connection is reused for in-memory SQLite
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
     Base.metadata.create_all(bind=engine)
     yield engine
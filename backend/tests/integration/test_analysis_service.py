@@ -23,6 +23,13 @@ class SessionWrapper:
 class TestAnalysisService:
     """Test Analysis Service integration."""
 
+    @pytest.fixture(autouse=True)
+    def _isolated_data_dir(self, tmp_path, monkeypatch):
+        """Keep parse cache and file index writes out of the working tree."""
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+
     def _mock_session_local(self, test_db_session, mocker):
         """Helper to mock SessionLocal and prevent session close."""
         # Create wrapper that prevents close
@@ -286,6 +293,42 @@ class TestAnalysisService:
         assert project.stats["languages"]["Python"]["files"] >= 1
         assert project.stats["languages"]["Python"]["lines"] > 0
 
+    @pytest.mark.asyncio
+    async def test_analyzer_runs_off_event_loop(
+        self,
+        test_db_session,
+        project_factory,
+        sample_python_repo,
+        mocker
+    ):
+        """Test the analyzer runs in a worker thread, not on the event loop."""
+        import threading
+        from app.services.analyzer.generic_analyzer import GenericAnalyzer
+
+        self._mock_session_local(test_db_session, mocker)
+
+        threads = []
+        original_analyze = GenericAnalyzer.analyze
+
+        def record_thread(analyzer):
+            threads.append(threading.current_thread())
+            return original_analyze(analyzer)
+
+        mocker.patch.object(GenericAnalyzer, "analyze", record_thread)
+
+        project = project_factory(
+            name="Off Loop Test",
+            source_type=SourceType.local_path,
+            source=str(sample_python_repo),
+            status=ProjectStatus.pending
+        )
+
+        await run_analysis(project.id)
+
+        test_db_session.refresh(project)
+        assert project.status == ProjectStatus.ready
+        assert threads and threads[0] is not threading.main_thread()
+
     @pytest.mark.asyncio
     async def test_project_not_found(self, test_db_session, mocker):
         """Test analysis handles non-existent project gracefully."""
@@ -324,6 +367,37 @@ class TestAnalysisService:
         assert project.status == ProjectStatus.ready
         assert project.stats is not None
 
+    @pytest.mark.asyncio
+    async def test_re_analyze_force_analyzes_every_file(
+        self,
+        test_db_session,
+        project_factory,
+        sample_python_repo,
+        mocker
+    ):
+        """Test re-analysis reuses unchanged results unless forced."""
+        from app.services.analyzer.generic_analyzer import GenericAnalyzer
+
+        self._mock_session_local(test_db_session, mocker)
+
+        project = project_factory(
+            name="Force Re-analyze Test",
+            source_type=SourceType.local_path,
+            source=str(sample_python_repo),
+            status=ProjectStatus.pending
+        )
+        await run_analysis(project.id)
+
+        analyze_file = mocker.spy(GenericAnalyzer, "analyze_file")
+        await re_analyze(project.id)
+        assert analyze_file.call_count == 0
+
+        await re_analyze(project.id, force=True)
+        test_db_session.refresh(project)
+
+        assert analyze_file.call_count == project.stats["files"]
+        assert project.status == ProjectStatus.ready
+
     @pytest.mark.asyncio
     async def test_re_analyze_already_analyzing(
         self,
@@ -410,3 +484,35 @@ class TestAnalysisService:
 
         # Status should still be ready
         assert project.status == ProjectStatus.ready
+
+
+class TestCachedHealthCheck:
+    """Test health-check result caching used before the embedding phase."""
+
+    @pytest.mark.asyncio
+    async def test_positive_result_is_reused(self, mocker):
+        """Test a healthy endpoint is probed once within the TTL."""
+        from unittest.mock import AsyncMock
+        from app.services import analysis_service
+
+        mocker.patch.dict(analysis_service._healthy_until, clear=True)
+        service = MagicMock(base_url="http://embed:1")
+        service.health_check = AsyncMock(return_value=True)
+
+        assert await analysis_service._cached_health_check(service) is True
+        assert await analysis_service._cached_health_check(service) is True
+        assert service.health_check.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_negative_result_is_not_cached(self, mocker):
+        """Test an unhealthy endpoint is probed again next time."""
+        from unittest.mock import AsyncMock
+        from app.services import analysis_service
+
+        mocker.patch.dict(analysis_service._healthy_until, clear=True)
+        service = MagicMock(base_url="http://embed:2")
+        service.health_check = AsyncMock(return_value=False)
+
+        assert await analysis_service._cached_health_check(service) is False
+        assert await analysis_service._cached_health_check(service) is False
+        assert service.health_check.await_count == 2
@@ -251,7 +251,7 @@ class TestProjectAPI:
         assert data["estimated_duration_seconds"] == 120
 
         # Verify run_analysis was called
-        mock_run_analysis.assert_called_once_with(project.id)
+        mock_run_analysis.assert_called_once_with(project.id, force=False)
 
     @patch("app.api.routes.projects.run_analysis")
     def test_start_analysis_with_options(self, mock_run_analysis, client, project_factory, test_db):
@@ -332,7 +332,30 @@ class TestProjectAPI:
         assert data["status"] == "queued"
 
         # Verify run_analysis was called
-        mock_run_analysis.assert_called_once_with(project.id)
+        mock_run_analysis.assert_called_once_with(project.id, force=True)
+
+    def test_forced_start_analyzes_every_file(self, client, project_factory, test_db, tmp_path):
+        """Test a forced start runs a full, non-incremental analysis."""
+        project = project_factory(
+            name="Test Project",
+            source_type=SourceType.local_path,
+            source=str(tmp_path),
+            status=ProjectStatus.ready,
+        )
+        stats = {"files": 0, "lines_of_code": 0, "languages": {}, "directories": 0}
+
+        with patch("app.services.analysis_service.SessionLocal", return_value=test_db), \
+             patch("app.services.analysis_service.analyze_repository", return_value=stats) as analyze, \
+             patch("app.services.analysis_service._cached_health_check", return_value=False):
+            response = client.post(
+                f"/api/projects/{project.id}/analyze",
+                json={"force": True}
+            )
+
+        assert response.status_code == 200
+        analyze.assert_called_once()
+        assert analyze.call_args.kwargs["incremental"] is False
+        assert analyze.call_args.kwargs["parse_cache_dir"] is None
 
     @patch("app.api.routes.projects.run_analysis")
     def test_start_analysis_updates_project_status(self, mock_run_analysis, client, project_factory, test_db):
@@ -5,6 +5,7 @@ import pytest
 from pathlib import Path
 import tempfile
 import shutil
+from unittest.mock import patch
 
 from app.services.analyzer.dependency_graph import DependencyGraph
 
@@ -107,6 +108,20 @@ class TestDependencyGraphInit:
         graph = DependencyGraph(temp_repo)
         assert graph.repo_path == temp_repo.resolve()
 
+    def test_relative_paths_under_repo_skip_resolve(self, temp_repo):
+        """Test paths under the resolved root are sliced, others resolved."""
+        root = temp_repo.resolve()
+        graph = DependencyGraph(str(temp_repo))
+
+        with patch("app.services.analyzer.dependency_graph.Path.resolve") as resolve:
+            assert graph._get_relative_path(str(root / "src" / "a.py")) == "src/a.py"
+            assert graph._get_relative_path(str(root / "src" / "a.py")) == "src/a.py"
+        resolve.assert_not_called()
+
+        outside = str(root / ".." / "elsewhere.py")
+        assert graph._get_relative_path(outside) == outside
+        assert graph._get_relative_path("src/b.py") == "src/b.py"
+
 
 class TestBuildFromAnalysis:
     """Test building dependency graph from analysis data."""
@@ -156,6 +171,70 @@ class TestBuildFromAnalysis:
         assert "os" in external
         assert "requests" in external
 
+    def test_external_dependencies_merged_across_builds(self, temp_repo):
+        """Test rebuilding a file merges its external deps in first-seen order."""
+        (temp_repo / "main.py").write_text("")
+        main = str(temp_repo / "main.py")
+
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis({main: ["os", "requests", "os"]})
+        graph.build_from_analysis({main: ["json", "requests"]})
+
+        assert graph.graph.nodes["main.py"]["external_deps"] == ["os", "requests", "json"]
+
+    def test_update_matches_full_rebuild(self, temp_repo):
+        """Test applying a change set gives the same graph as rebuilding."""
+        for rel in ["main.py", "utils.py", "helpers.py", "pkg/a.py", "pkg/b.py", "lib/helpers.py"]:
+            (temp_repo / rel).parent.mkdir(parents=True, exist_ok=True)
+            (temp_repo / rel).write_text("")
+
+        def paths(mapping):
+            return {str(temp_repo / rel): imports for rel, imports in mapping.items()}
+
+        before = {
+            "main.py": ["utils", "helpers", "os"],
+            "utils.py": ["helpers"],
+            "helpers.py": [],
+            "pkg/a.py": [".b", "lib.helpers"],
+        }
+        changed = {"utils.py": ["os"], "pkg/b.py": [], "lib/helpers.py": []}
+        after = {**before, **changed}
+        del after["helpers.py"]
+
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(paths(before))
+        graph.get_summary()
+        graph.update_from_analysis(paths(changed), [str(temp_repo / "helpers.py")])
+
+        rebuilt = DependencyGraph(str(temp_repo))
+        rebuilt.build_from_analysis(paths(after))
+
+        assert set(graph.graph.edges()) == set(rebuilt.graph.edges())
+        assert set(graph.graph.nodes()) == set(rebuilt.graph.nodes())
+        for node in rebuilt.graph.nodes():
+            assert graph.graph.nodes[node].get("external_deps") == \
+                rebuilt.graph.nodes[node].get("external_deps")
+        assert graph.get_summary() == rebuilt.get_summary()
+        assert graph.graph.has_edge("main.py", "lib/helpers.py")
+
+    def test_update_only_relinks_affected_files(self, temp_repo):
+        """Test unrelated files are not resolved again on update."""
+        for rel in ["a.py", "b.py", "c.py"]:
+            (temp_repo / rel).write_text("")
+
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis({
+            str(temp_repo / "a.py"): ["os"],
+            str(temp_repo / "b.py"): ["json"],
+        })
+
+        with patch.object(graph, "_link_imports", wraps=graph._link_imports) as link:
+            graph.update_from_analysis({str(temp_repo / "c.py"): ["a"]})
+
+        relinked = [source for source, _, _ in link.call_args.args[0]]
+        assert relinked == ["c.py"]
+        assert graph.graph.has_edge("c.py", "a.py")
+
 
 class TestCircularDependencies:
     """Test circular dependency detection."""
@@ -179,6 +258,19 @@ class TestCircularDependencies:
         cycles = graph.detect_circular_dependencies()
         assert len(cycles) == 0
 
+    def test_cycles_start_at_smallest_node(self, temp_repo, circular_python_imports):
+        """Test cycles are reported in canonical rotation, without duplicates."""
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(circular_python_imports, language="Python")
+
+        with patch(
+            "app.services.analyzer.dependency_graph.nx.simple_cycles",
+            return_value=iter([["c.py", "a.py", "b.py"], ["a.py", "b.py", "c.py"]]),
+        ):
+            cycles = graph.detect_circular_dependencies()
+
+        assert cycles == [["a.py", "b.py", "c.py", "a.py"]]
+
     def test_circular_dependencies_report(self, temp_repo, circular_python_imports):
         """Test getting detailed cycle report."""
         graph = DependencyGraph(str(temp_repo))
@@ -247,6 +339,39 @@ class TestDependencyDepth:
         for file in ["a.py", "b.py", "c.py"]:
             assert file in depths
 
+    def test_depth_cycle_members_share_depth(self, temp_repo):
+        """Test a cycle counts as one level between its importers and imports."""
+        for name in ["main", "a", "b", "leaf"]:
+            (temp_repo / f"{name}.py").write_text("")
+
+        imports = {
+            str(temp_repo / "main.py"): ["a"],
+            str(temp_repo / "a.py"): ["b"],
+            str(temp_repo / "b.py"): ["a", "leaf"],
+            str(temp_repo / "leaf.py"): [],
+        }
+
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(imports, language="Python")
+
+        depths = graph.calculate_dependency_depth()
+
+        assert depths == {"leaf.py": 0, "a.py": 1, "b.py": 1, "main.py": 2}
+
+    def test_depth_dag_skips_condensation(self, temp_repo, complex_python_imports):
+        """Test acyclic graphs are scanned directly, matching the SCC path."""
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(complex_python_imports, language="Python")
+
+        with patch(
+            "app.services.analyzer.dependency_graph.nx.condensation"
+        ) as condensation:
+            depths = graph.calculate_dependency_depth()
+        condensation.assert_not_called()
+
+        graph.graph.add_edge("db.py", "db.py")
+        assert graph.calculate_dependency_depth() == depths
+
 
 class TestLeafAndRootNodes:
     """Test leaf and root node identification."""
@@ -353,6 +478,84 @@ class TestRelativeImportResolution:
             targets = [e[1] for e in index_edges]
             assert "utils.js" in targets
 
+    def test_python_package_imports(self, temp_repo):
+        """Test absolute and relative imports resolve to modules and packages."""
+        for rel in ["__init__.py", "pkg/__init__.py", "pkg/x.py", "pkg/sub/m.py"]:
+            (temp_repo / rel).parent.mkdir(parents=True, exist_ok=True)
+            (temp_repo / rel).write_text("")
+
+        imports = {str(temp_repo / rel): [] for rel in ["__init__.py", "pkg/__init__.py", "pkg/x.py"]}
+        imports[str(temp_repo / "pkg/sub/m.py")] = ["..x", "...", "pkg", "pkg.x"]
+
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(imports, language="Python")
+
+        assert list(graph.graph.successors("pkg/sub/m.py")) == [
+            "pkg/x.py", "__init__.py", "pkg/__init__.py",
+        ]
+
+    def test_external_imports_skip_resolution(self, temp_repo):
+        """Test imports outside every known first segment are external."""
+        (temp_repo / "src" / "app").mkdir(parents=True)
+        (temp_repo / "src" / "app" / "helpers.py").write_text("")
+
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis({str(temp_repo / "src/app/helpers.py"): []})
+
+        assert graph._resolvable_heads == {"src", "app", "helpers"}
+        assert graph._resolve_python_import("os.path", ".") is None
+        assert graph._resolve_python_import("app.helpers", ".") == "src/app/helpers.py"
+        assert graph._resolve_python_import("src.app.helpers", ".") == "src/app/helpers.py"
+        assert graph._resolve_js_import("/lib/helpers", ".") is None
+
+    def test_python_import_matches_module_suffix(self, temp_repo):
+        """Test imports resolve by module-name suffix, first registered wins."""
+        for rel in ["src/app/helpers.py", "lib/helpers.py", "main.py"]:
+            (temp_repo / rel).parent.mkdir(parents=True, exist_ok=True)
+            (temp_repo / rel).write_text("")
+
+        imports = {
+            str(temp_repo / "src/app/helpers.py"): [],
+            str(temp_repo / "lib/helpers.py"): [],
+            str(temp_repo / "main.py"): ["app.helpers", "helpers", "pp.helpers"],
+        }
+
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(imports, language="Python")
+
+        assert set(graph.graph.successors("main.py")) == {"src/app/helpers.py"}
+        assert graph.graph.nodes["main.py"]["external_deps"] == ["pp.helpers"]
+
+
+    def test_repeated_imports_resolved_once(self, temp_repo):
+        """Test an import shared by many files is resolved once per build."""
+        (temp_repo / "pkg").mkdir()
+        for name in ["a", "b", "helpers"]:
+            (temp_repo / "pkg" / f"{name}.py").write_text("")
+
+        imports = {
+            str(temp_repo / "pkg" / "a.py"): ["os", ".helpers"],
+            str(temp_repo / "pkg" / "b.py"): ["os", ".helpers"],
+            str(temp_repo / "pkg" / "helpers.py"): ["os"],
+        }
+
+        graph = DependencyGraph(str(temp_repo))
+        with patch.object(
+            graph, "_resolve_python_import", wraps=graph._resolve_python_import
+        ) as resolve:
+            graph.build_from_analysis(imports, language="Python")
+            assert resolve.call_count == 2
+
+            (temp_repo / "os.py").write_text("")
+            graph.build_from_analysis(
+                {str(temp_repo / "os.py"): [], str(temp_repo / "pkg" / "a.py"): ["os"]},
+                language="Python",
+            )
+
+        assert resolve.call_count == 3
+        assert graph.graph.has_edge("pkg/a.py", "os.py")
+        assert graph.graph.has_edge("pkg/b.py", "pkg/helpers.py")
+
 
 class TestExportFormats:
     """Test export functionality."""
@@ -394,6 +597,14 @@ class TestExportFormats:
         json_str = graph.to_json(indent=4)
         assert "    " in json_str  # 4-space indent
 
+    def test_to_json_matches_stdlib_output(self, temp_repo, circular_python_imports):
+        """Test the default and compact exports match json.dumps output."""
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(circular_python_imports, language="Python")
+
+        assert graph.to_json() == json.dumps(graph.to_dict(), indent=2)
+        assert graph.to_json(indent=None) == json.dumps(graph.to_dict())
+
     def test_to_dot(self, temp_repo, simple_python_imports):
         """Test DOT format export."""
         graph = DependencyGraph(str(temp_repo))
@@ -419,6 +630,16 @@ class TestExportFormats:
         # Leaf nodes should have pink color
         assert "#FFB6C1" in dot  # Light pink for leaves
 
+    def test_to_dot_depth_colors(self, temp_repo, simple_python_imports):
+        """Test interior nodes are shaded by depth."""
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(simple_python_imports, language="Python")
+
+        dot = graph.to_dot()
+
+        # utils.py is at depth 1 of 2: intensity 200 - 50 = 150 (0x96)
+        assert '"utils_py" [label="utils", fillcolor="#9696ff"];' in dot
+
 
 class TestModuleMetrics:
     """Test module-level metrics."""
@@ -470,6 +691,17 @@ class TestGetSummary:
         assert "db.py" in most_imported
         assert most_imported["db.py"] == 2
 
+    def test_summary_top_modules_ordered(self, temp_repo, complex_python_imports):
+        """Test top-N lists are by count descending, ties in node order."""
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(complex_python_imports, language="Python")
+
+        assert graph._get_most_imported(2) == [("db.py", 2), ("services.py", 1)]
+        assert graph._get_most_dependencies(10) == [
+            ("app.py", 2), ("services.py", 1), ("models.py", 1), ("db.py", 0),
+        ]
+        assert graph._get_most_imported(0) == []
+
     def test_summary_with_cycles(self, temp_repo, circular_python_imports):
         """Test summary includes cycle information."""
         graph = DependencyGraph(str(temp_repo))
@@ -630,3 +862,67 @@ class TestTypeScriptSpecific:
         graph.build_from_analysis(imports, language="TSX")
 
         assert graph.graph.number_of_nodes() == 2
+
+
+class TestAdjacencyIndex:
+    """Test the cached CSR snapshot of the graph structure."""
+
+    def test_snapshot_reused_until_graph_changes(self, temp_repo, simple_python_imports):
+        """Test the snapshot is cached and rebuilt after direct graph edits."""
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(simple_python_imports)
+
+        first = graph._adjacency()
+        assert graph._adjacency() is first
+        assert graph.get_leaf_nodes() == ["helpers.py"]
+
+        graph.graph.add_node("extra.py", module_name="extra", language="Python")
+        graph.graph.add_edge("helpers.py", "extra.py")
+
+        assert graph._adjacency() is not first
+        assert graph.get_leaf_nodes() == ["extra.py"]
+        assert graph.calculate_dependency_depth()["main.py"] == 3
+
+    def test_snapshot_matches_networkx(self, temp_repo, complex_python_imports):
+        """Test CSR successors and degrees agree with the NetworkX graph."""
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(complex_python_imports)
+
+        index = graph._adjacency()
+        for i, node in enumerate(index.nodes):
+            assert [index.nodes[j] for j in index.successors(i)] == list(graph.graph.successors(node))
+            assert index.out_degree[i] == graph.graph.out_degree(node)
+            assert index.in_degree[i] == graph.graph.in_degree(node)
+            assert index.node_attrs[i] is graph.graph.nodes[node]
+            assert sorted(index.nodes[j] for j in index.predecessors(i)) == sorted(
+                graph.graph.predecessors(node)
+            )
+
+    def test_cycles_and_depths_computed_once_per_structure(
+        self, temp_repo, circular_python_imports, monkeypatch
+    ):
+        """Test exports reuse cached cycles/depths until the graph changes."""
+        import networkx as nx
+        from app.services.analyzer import dependency_graph
+
+        graph = DependencyGraph(str(temp_repo))
+        graph.build_from_analysis(circular_python_imports)
+
+        calls = []
+        original = nx.simple_cycles
+        monkeypatch.setattr(
+            dependency_graph.nx, "simple_cycles",
+            lambda g: calls.append(1) or original(g),
+        )
+
+        graph.to_dict()
+        graph.get_summary()
+        graph.to_dot()
+        cycles = graph.detect_circular_dependencies()
+        cycles[0].append("mutated")
+        assert len(calls) == 1
+        assert "mutated" not in graph.detect_circular_dependencies()[0]
+
+        graph.graph.remove_edge(*list(graph.graph.edges())[0])
+        assert graph.detect_circular_dependencies() == []
+        assert len(calls) == 2
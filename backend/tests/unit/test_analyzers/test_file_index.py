@@ -0,0 +1,103 @@
+"""Unit tests for the incremental analysis file index."""
+
+import time
+from unittest.mock import patch
+
+from app.services.analyzer.generic_analyzer import GenericAnalyzer
+from app.services.analyzer.utils.file_index import FileIndex
+
+
+class TestFileIndex:
+    """Test FileIndex storage."""
+
+    def test_save_then_lookup(self, temp_repo_dir):
+        """Test a recorded entry is returned for the same version of a file."""
+        index = FileIndex(str(temp_repo_dir / "index.json"))
+        mtime_ns = time.time_ns() - 10**9
+        index.record("a.py", mtime_ns, 10, "Python", "v1", {"lines": 1, "imports": []})
+        index.save()
+
+        loaded = FileIndex(str(temp_repo_dir / "index.json"))
+        loaded.load()
+
+        assert loaded.lookup("a.py", mtime_ns, 10, "Python", "v1") == {"lines": 1, "imports": []}
+        assert loaded.lookup("a.py", mtime_ns + 1, 10, "Python", "v1") is None
+        assert loaded.lookup("a.py", mtime_ns, 11, "Python", "v1") is None
+        assert loaded.lookup("a.py", mtime_ns, 10, "Python", "v2") is None
+        assert loaded.lookup("b.py", mtime_ns, 10, "Python", "v1") is None
+
+    def test_racy_entries_not_reused(self, temp_repo_dir):
+        """Test files modified at or after the save time are treated as changed."""
+        index = FileIndex(str(temp_repo_dir / "index.json"))
+        future_ns = time.time_ns() + 10**9
+        index.record("a.py", future_ns, 10, "Python", "v1", {"lines": 1, "imports": []})
+        index.save()
+
+        index.load()
+
+        assert index.lookup("a.py", future_ns, 10, "Python", "v1") is None
+
+    def test_missing_or_corrupt_index_is_empty(self, temp_repo_dir):
+        """Test loading a missing or unreadable index yields no entries."""
+        index = FileIndex(str(temp_repo_dir / "index.json"))
+        index.load()
+        assert index.lookup("a.py", 0, 0, "Python", "v1") is None
+
+        (temp_repo_dir / "index.json").write_text("not json")
+        index.load()
+        assert index.lookup("a.py", 0, 0, "Python", "v1") is None
+
+
+class TestIncrementalAnalysis:
+    """Test GenericAnalyzer skips files unchanged since the last analysis."""
+
+    def _make_repo(self, temp_repo_dir):
+        repo = temp_repo_dir / "repo"
+        repo.mkdir()
+        (repo / "main.py").write_text("import utils\n\nprint('hi')\n")
+        (repo / "utils.py").write_text("def helper():\n    pass\n")
+        return repo
+
+    def test_unchanged_files_are_not_analyzed(self, temp_repo_dir):
+        """Test a second analysis reuses every result and yields the same stats."""
+        repo = self._make_repo(temp_repo_dir)
+        index_path = str(temp_repo_dir / "index.json")
+
+        first = GenericAnalyzer(str(repo), file_index_path=index_path).analyze()
+
+        analyzer = GenericAnalyzer(str(repo), file_index_path=index_path)
+        with patch.object(analyzer, "analyze_file") as analyze_file:
+            second = analyzer.analyze()
+
+        analyze_file.assert_not_called()
+        assert second == first
+        assert analyzer.get_dependency_graph().graph.number_of_edges() == 1
+
+    def test_only_changed_files_are_analyzed(self, temp_repo_dir):
+        """Test a modified file is re-analyzed and deleted files drop out."""
+        repo = self._make_repo(temp_repo_dir)
+        index_path = str(temp_repo_dir / "index.json")
+        GenericAnalyzer(str(repo), file_index_path=index_path).analyze()
+
+        (repo / "main.py").write_text("import os\nimport utils\n\nprint('hello')\n")
+        (repo / "utils.py").unlink()
+
+        analyzer = GenericAnalyzer(str(repo), file_index_path=index_path)
+        with patch.object(analyzer, "analyze_file", wraps=analyzer.analyze_file) as analyze_file:
+            stats = analyzer.analyze()
+
+        assert [call.args[0] for call in analyze_file.call_args_list] == [str(repo / "main.py")]
+        assert stats["files"] == 1
+        assert stats["lines_of_code"] == 3
+
+    def test_non_incremental_analyzes_everything(self, temp_repo_dir):
+        """Test incremental=False ignores the previous index."""
+        repo = self._make_repo(temp_repo_dir)
+        index_path = str(temp_repo_dir / "index.json")
+        GenericAnalyzer(str(repo), file_index_path=index_path).analyze()
+
+        analyzer = GenericAnalyzer(str(repo), file_index_path=index_path, incremental=False)
+        with patch.object(analyzer, "analyze_file", wraps=analyzer.analyze_file) as analyze_file:
+            analyzer.analyze()
+
+        assert analyze_file.call_count == 2
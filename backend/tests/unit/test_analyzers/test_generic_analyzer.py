@@ -1,5 +1,6 @@
 """Unit tests for GenericAnalyzer."""
 
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -185,6 +186,59 @@ def function():
         # Should find: ./utils.js
         assert "./utils.js" in imports
 
+    def test_import_patterns(self, temp_repo_dir):
+        """Test which import forms are extracted, at any nesting depth."""
+        (temp_repo_dir / "mod.py").write_text(
+            "import a, b.c as d\n"
+            "from e.f import g\n"
+            "from .rel import h\n"
+            "def load():\n"
+            "    import inner\n"
+        )
+        (temp_repo_dir / "mod.ts").write_text(
+            "import x from './x';\n"
+            "const y = require('y');\n"
+            "const z = load('z');\n"
+            "function f() { return require(\"nested\"); }\n"
+        )
+
+        analyzer = GenericAnalyzer(str(temp_repo_dir))
+        python = analyzer.analyze_file(str(temp_repo_dir / "mod.py"), "Python")
+        typescript = analyzer.analyze_file(str(temp_repo_dir / "mod.ts"), "TypeScript")
+
+        assert sorted(python["imports"]) == [".rel", "a", "e.f", "inner"]
+        assert sorted(typescript["imports"]) == ["./x", "nested", "y"]
+
+    def test_relative_python_imports(self, temp_repo_dir):
+        """Test relative from-imports keep their dots, naming package modules."""
+        (temp_repo_dir / "mod.py").write_text(
+            "from . import b, c as d\n"
+            "from .e import f\n"
+            "from ..g.h import i\n"
+            "from .. import (j)\n"
+        )
+
+        analyzer = GenericAnalyzer(str(temp_repo_dir))
+        python = analyzer.analyze_file(str(temp_repo_dir / "mod.py"), "Python")
+
+        assert sorted(python["imports"]) == ["..g.h", "..j", ".b", ".c", ".e"]
+
+    def test_relative_imports_add_package_edges(self, temp_repo_dir):
+        """Test intra-package relative imports become dependency edges."""
+        package = temp_repo_dir / "pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "a.py").write_text("from . import b\n")
+        (package / "b.py").write_text("VALUE = 1\n")
+        (package / "c.py").write_text("from .b import VALUE\n")
+
+        analyzer = GenericAnalyzer(str(temp_repo_dir))
+        analyzer.analyze()
+        graph = analyzer.get_dependency_graph().graph
+
+        assert graph.has_edge("pkg/a.py", "pkg/b.py")
+        assert graph.has_edge("pkg/c.py", "pkg/b.py")
+
     def test_stats_aggregation(self, sample_repos_path):
         """Test that statistics are aggregated correctly across files."""
         python_repo = sample_repos_path / "python_simple"
@@ -225,6 +279,57 @@ def function():
         if "Python" in stats["languages"]:
             assert stats["languages"]["Python"]["files"] >= 1
 
+    def test_skip_binary_content_with_code_extension(self, temp_repo_dir):
+        """Test files whose content contains NUL bytes are not analyzed."""
+        (temp_repo_dir / "blob.js").write_bytes(b"var a;\x00\x01\x02\n")
+        (temp_repo_dir / "script.py").write_text("print('hello')\n")
+
+        analyzer = GenericAnalyzer(str(temp_repo_dir))
+        stats = analyzer.analyze()
+
+        assert stats["files"] == 1
+        assert "JavaScript" not in stats["languages"]
+
+    def test_analyze_file_reads_file_once(self, temp_repo_dir):
+        """Test sniffing, line counting and parsing share a single read."""
+        file_path = temp_repo_dir / "main.py"
+        file_path.write_text("import os\n\nprint('hi')\n")
+
+        analyzer = GenericAnalyzer(str(temp_repo_dir))
+        with patch("builtins.open", wraps=open) as opened:
+            file_stats = analyzer.analyze_file(str(file_path), "Python")
+
+        assert opened.call_count == 1
+        assert file_stats == {"lines": 2, "imports": ["os"]}
+
+    def test_analyze_file_memory_maps_large_files(self, temp_repo_dir, monkeypatch):
+        """Test large files are analyzed from a mapping, with the same result."""
+        from app.services.analyzer import generic_analyzer
+
+        file_path = temp_repo_dir / "main.py"
+        file_path.write_text("import os\nfrom pkg import mod\n\nprint('hi')\n")
+
+        expected = GenericAnalyzer(str(temp_repo_dir)).analyze_file(str(file_path), "Python")
+
+        monkeypatch.setattr(generic_analyzer, "MMAP_MIN_BYTES", 1)
+        analyzer = GenericAnalyzer(str(temp_repo_dir), parse_cache_dir=str(temp_repo_dir / "cache"))
+        with patch.object(generic_analyzer.mmap, "mmap", wraps=generic_analyzer.mmap.mmap) as mapped:
+            file_stats = analyzer.analyze_file(str(file_path), "Python")
+
+        mapped.assert_called_once()
+        assert file_stats["lines"] == expected["lines"] == 3
+        assert sorted(file_stats["imports"]) == sorted(expected["imports"]) == ["os", "pkg"]
+
+    def test_binary_extensions_skip_ignore_matching(self, temp_repo_dir):
+        """Test known binary extensions are rejected before gitignore matching."""
+        (temp_repo_dir / "logo.png").write_bytes(b"\x89PNG")
+
+        analyzer = GenericAnalyzer(str(temp_repo_dir))
+        with patch.object(analyzer, "_is_ignored", return_value=False) as should_ignore:
+            analyzer.analyze()
+
+        should_ignore.assert_not_called()
+
     def test_skip_large_files(self, temp_repo_dir):
         """Test that files exceeding size limit are skipped."""
         # Create a small file
@@ -306,6 +411,23 @@ if True
         stats_after = analyzer.get_stats()
         assert stats_after["files"] == 1
 
+    def test_update_stats_aggregates_per_language(self, temp_repo_dir):
+        """Test per-file updates are materialized into totals and languages."""
+        analyzer = GenericAnalyzer(str(temp_repo_dir))
+
+        analyzer._update_stats("Python", {"lines": 10})
+        analyzer._update_stats("JavaScript", {"lines": 3})
+        analyzer._update_stats("Python", {"lines": 5})
+
+        stats = analyzer.get_stats()
+        assert stats["files"] == 3
+        assert stats["lines_of_code"] == 18
+        assert stats["languages"] == {
+            "Python": {"files": 2, "lines": 15},
+            "JavaScript": {"files": 1, "lines": 3},
+        }
+        assert list(stats["languages"]) == ["Python", "JavaScript"]
+
     def test_get_dependency_graph_before_analysis(self, temp_repo_dir):
         """Test get_dependency_graph returns None before analyze() is called."""
         (temp_repo_dir / "main.py").write_text("import utils")
@@ -371,6 +493,301 @@ if True
         assert dep_graph.graph.number_of_nodes() >= 1
 
 
+class TestIgnoredDirectories:
+    """Test ignored directories are pruned from the walk."""
+
+    def test_ignored_directory_not_descended(self, temp_repo_dir):
+        """Test directory patterns prune the whole subtree."""
+        (temp_repo_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_repo_dir / "node_modules" / "pkg" / "index.js").write_text("x\n")
+        (temp_repo_dir / "src").mkdir()
+        (temp_repo_dir / "src" / "main.py").write_text("print('hi')\n")
+
+        analyzer = GenericAnalyzer(str(temp_repo_dir))
+        with patch.object(analyzer, "_is_ignored", wraps=analyzer._is_ignored) as is_ignored:
+            stats = analyzer.analyze()
+
+        checked = [call.args[0] for call in is_ignored.call_args_list]
+        assert "node_modules/" in checked
+        assert not any(path.startswith("node_modules/pkg") for path in checked)
+        assert stats["files"] == 1
+        assert stats["directories"] == 1
+
+    def test_ignored_directory_not_listed(self, temp_repo_dir):
+        """Test the walk never lists ignored or symlinked directories."""
+        (temp_repo_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_repo_dir / "src").mkdir()
+        (temp_repo_dir / "src" / "main.py").write_text("print('hi')\n")
+        (temp_repo_dir / "link").symlink_to(temp_repo_dir / "src")
+
+        analyzer = GenericAnalyzer(str(temp_repo_dir))
+        with patch("app.services.analyzer.generic_analyzer.os.scandir", wraps=os.scandir) as scandir:
+            stats = analyzer.analyze()
+
+        scanned = {Path(call.args[0]).name for call in scandir.call_args_list}
+        assert scanned == {temp_repo_dir.name, "src"}
+        assert stats["files"] == 1
+        assert stats["directories"] == 2
+
+    def test_parallel_walk_matches_serial(self, temp_repo_dir, monkeypatch):
+        """Test listing directories concurrently yields the serial order."""
+        from app.services.analyzer import generic_analyzer
+
+        for package in ("a", "b", "c"):
+            for module in ("x", "y"):
+                directory = temp_repo_dir / package / module
+                directory.mkdir(parents=True)
+                (directory / "mod.py").write_text("import os\n")
+            (temp_repo_dir / package / "__init__.py").write_text("")
+        (temp_repo_dir / "b" / "node_modules").mkdir()
+        (temp_repo_dir / "b" / "node_modules" / "dep.js").write_text("x\n")
+
+        serial = list(GenericAnalyzer(str(temp_repo_dir))._walk(str(temp_repo_dir)))
+
+        monkeypatch.setattr(generic_analyzer, "WALK_PARALLEL_MIN_DIRS", 1)
+        with patch.object(generic_analyzer, "ThreadPoolExecutor",
+                          wraps=generic_analyzer.ThreadPoolExecutor) as executor:
+            parallel = list(GenericAnalyzer(str(temp_repo_dir))._walk(str(temp_repo_dir)))
+
+        executor.assert_called_once()
+        assert parallel == serial
+        assert sum(1 for _, language in serial if language is None) == 9
+        assert sum(1 for _, language in serial if language == "Python") == 9
+
+class TestFilterBySize:
+    """Test batched size filtering of candidate files."""
+
+    def test_batched_stat_keeps_order_and_drops_large_or_missing(self, temp_repo_dir, monkeypatch):
+        """Test the threaded path filters like the serial one."""
+        import app.services.analyzer.generic_analyzer as generic_analyzer
+
+        monkeypatch.setattr(generic_analyzer, "STAT_BATCH_MIN_FILES", 1)
+        small = [temp_repo_dir / f"f{i}.py" for i in range(5)]
+        for path in small:
+            path.write_text("x = 1\n")
+        large = temp_repo_dir / "large.py"
+        large.write_text("x" * (2 * 1024 * 1024))
+        missing = temp_repo_dir / "missing.py"
+
+        analyzer = GenericAnalyzer(str(temp_repo_dir), max_file_size_mb=1)
+        candidates = [(path, "python") for path in [small[0], large, *small[1:], missing]]
+
+        assert analyzer._filter_by_size(candidates) == [(path, "python") for path in small]
+
+
+class TestListedFiles:
+    """Test collecting files from a precomputed file list."""
+
+    def test_file_list_matches_walk(self, sample_repos_path):
+        """Test a full file list yields the same stats as walking the tree."""
+        import os
+
+        repo = sample_repos_path / "mixed_language"
+        file_list = [
+            os.path.relpath(os.path.join(root, name), repo)
+            for root, _, names in os.walk(repo)
+            for name in names
+        ]
+
+        walked = GenericAnalyzer(str(repo)).analyze()
+        listed = GenericAnalyzer(str(repo), file_list=file_list).analyze()
+
+        assert listed == walked
+
+    def test_file_list_applies_filters(self, temp_repo_dir):
+        """Test listed files still go through ignore and existence checks."""
+        (temp_repo_dir / "node_modules").mkdir()
+        (temp_repo_dir / "node_modules" / "dep.js").write_text("x\n")
+        (temp_repo_dir / "main.py").write_text("print('hi')\n")
+
+        analyzer = GenericAnalyzer(
+            str(temp_repo_dir),
+            file_list=["main.py", "node_modules/dep.js", "deleted.py"],
+        )
+        stats = analyzer.analyze()
+
+        assert stats["files"] == 1
+        assert stats["languages"] == {"Python": {"files": 1, "lines": 1}}
+
+    def test_git_file_list_matches_walk(self, temp_repo_dir):
+        """Test a git listing is filtered like the walk, nested .gitignore included."""
+        import subprocess
+
+        from app.services.git_service import GitService
+
+        repo = temp_repo_dir / "repo"
+        (repo / "src").mkdir(parents=True)
+        subprocess.run(["git", "init", "-q", str(repo)], check=True)
+        (repo / ".gitignore").write_text("generated.py\n")
+        # Nested .gitignore files are not read by either path
+        (repo / "src" / ".gitignore").write_text("nested.py\n")
+        for name in ("main.py", "nested.py", "generated.py"):
+            (repo / "src" / name).write_text("x = 1\n")
+
+        file_list = GitService().list_files(str(repo))
+        walked = GenericAnalyzer(str(repo)).analyze()
+        listed = GenericAnalyzer(str(repo), file_list=file_list).analyze()
+
+        assert listed == walked
+        assert walked["files"] == 2
+
+    def test_file_list_unused_without_gitignore(self, temp_repo_dir):
+        """Test use_gitignore=False walks the tree instead of using the list."""
+        (temp_repo_dir / "main.py").write_text("print('hi')\n")
+        (temp_repo_dir / "other.py").write_text("print('hi')\n")
+
+        analyzer = GenericAnalyzer(
+            str(temp_repo_dir), use_gitignore=False, file_list=["main.py"]
+        )
+
+        assert analyzer.analyze()["files"] == 2
+
+
+class TestCountLines:
+    """Test byte-level non-empty line counting."""
+
+    @pytest.mark.parametrize("content, expected", [
+        (b"", 0),
+        (b"a", 1),
+        (b"a\n", 1),
+        (b"a\n\n  \t\nb\n", 2),
+        (b"a\r\n\r\nb", 2),
+        (b"   \n\x0c\n", 0),
+        ("caf\u00e9\n\n".encode("utf-8"), 1),
+        # Only "\n" ends a line; old Mac "\r" line endings are one line
+        (b"a\rb\r", 1),
+        # Only ASCII whitespace is blank; a no-break space is content
+        ("\u00a0\nb\n".encode("utf-8"), 2),
+    ])
+    def test_counts_non_blank_lines(self, content, expected):
+        """Test blank and whitespace-only lines are not counted."""
+        assert GenericAnalyzer._count_source_lines(content) == expected
+
+    def test_memory_mapped_files(self, temp_repo_dir):
+        """Test a memory-mapped file is counted the same way as its bytes."""
+        import mmap
+
+        content = b"x = 1\n\n    \nlong_line_" + b"y" * 50 + b"\n  \n z\n\nlast"
+        path = temp_repo_dir / "f.py"
+        path.write_bytes(content)
+        expected = sum(1 for line in content.split(b"\n") if line.strip())
+
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            assert GenericAnalyzer._count_source_lines(mapped) == expected
+
+
+class TestAnalyzeRepository:
+    """Test the picklable analyze_repository entry point."""
+
+    def test_matches_analyzer_stats(self, sample_repos_path):
+        """Test analyze_repository returns the same stats as GenericAnalyzer."""
+        import pickle
+        from app.services.analyzer.generic_analyzer import analyze_repository
+
+        python_repo = str(sample_repos_path / "python_simple")
+
+        assert pickle.loads(pickle.dumps(analyze_repository)) is analyze_repository
+        assert analyze_repository(python_repo) == GenericAnalyzer(python_repo).analyze()
+
+
+class TestParallelAnalysis:
+    """Test per-file analysis sharded across the process pool."""
+
+    def test_parallel_matches_serial(self, temp_repo_dir, monkeypatch):
+        """Test pool-backed analysis yields the same stats and imports as serial."""
+        from app.services.analyzer import generic_analyzer
+
+        file_count = generic_analyzer.PARALLEL_MIN_FILES + 5
+        for i in range(file_count):
+            (temp_repo_dir / f"mod_{i}.py").write_text(
+                f"import os\nimport mod_{(i + 1) % 10}\n\nx = {i}\n"
+            )
+        (temp_repo_dir / "app.js").write_text("const fs = require('fs');\n")
+
+        parallel = GenericAnalyzer(str(temp_repo_dir))
+        parallel_stats = parallel.analyze()
+
+        serial = GenericAnalyzer(str(temp_repo_dir), max_workers=1)
+        with patch.object(generic_analyzer, "get_analysis_pool") as get_pool:
+            serial_stats = serial.analyze()
+        get_pool.assert_not_called()
+
+        assert parallel_stats == serial_stats
+        # Import lists are deduplicated via set(), so compare order-insensitively
+        assert {k: sorted(v) for k, v in parallel._file_imports.items()} == {
+            k: sorted(v) for k, v in serial._file_imports.items()
+        }
+        assert parallel_stats["languages"]["Python"]["files"] == file_count
+
+    def test_pool_submissions_are_bounded(self, temp_repo_dir, monkeypatch):
+        """Test one analysis keeps only a bounded window of tasks queued."""
+        from concurrent.futures import Future
+        from app.services.analyzer import generic_analyzer
+
+        outstanding = []
+        peak = []
+
+        class RecordingPool:
+            def submit(self, fn, *args):
+                future = Future()
+                future.set_result(fn(*args))
+                outstanding.append(future)
+                peak.append(len(outstanding))
+                original_result = future.result
+
+                def result():
+                    outstanding.remove(future)
+                    return original_result()
+
+                future.result = result
+                return future
+
+        monkeypatch.setattr(generic_analyzer, "get_analysis_pool", RecordingPool)
+        monkeypatch.setattr(generic_analyzer, "PARALLEL_CHUNKSIZE", 1)
+        monkeypatch.setattr(generic_analyzer.os, "cpu_count", lambda: 1)
+        for i in range(generic_analyzer.PARALLEL_MIN_FILES + 5):
+            (temp_repo_dir / f"mod_{i}.py").write_text(f"x = {i}\n")
+
+        stats = GenericAnalyzer(str(temp_repo_dir)).analyze()
+
+        assert stats["files"] == generic_analyzer.PARALLEL_MIN_FILES + 5
+        assert max(peak) == generic_analyzer.PARALLEL_PENDING_PER_WORKER
+
+        peak.clear()
+        GenericAnalyzer(str(temp_repo_dir), max_workers=3).analyze()
+        assert max(peak) == 3
+
+    def test_largest_files_dispatched_first(self, temp_repo_dir, monkeypatch):
+        """Test the pool gets the largest files first, one per task."""
+        from concurrent.futures import Future
+        from app.services.analyzer import generic_analyzer
+
+        submitted = []
+
+        class RecordingPool:
+            def submit(self, fn, *args):
+                submitted.append([Path(p).name for p in args[2]])
+                future = Future()
+                future.set_result(fn(*args))
+                return future
+
+        monkeypatch.setattr(generic_analyzer, "get_analysis_pool", RecordingPool)
+        monkeypatch.setattr(generic_analyzer.os, "cpu_count", lambda: 2)
+        file_count = generic_analyzer.PARALLEL_MIN_FILES + 5
+        for i in range(file_count):
+            (temp_repo_dir / f"mod_{i}.py").write_text(f"x = {i}\n")
+        (temp_repo_dir / "big.py").write_text("x = 1\n" * 500)
+        (temp_repo_dir / "bigger.py").write_text("x = 1\n" * 1000)
+
+        analyzer = GenericAnalyzer(str(temp_repo_dir))
+        stats = analyzer.analyze()
+
+        assert submitted[:2] == [["bigger.py"], ["big.py"]]
+        assert len(submitted[2]) == generic_analyzer.PARALLEL_CHUNKSIZE
+        assert stats["files"] == file_count + 2
+        assert stats["lines_of_code"] == file_count + 1500
+
+
 @pytest.fixture
 def sample_repos_path():
     """Path to sample repositories fixtures."""
@@ -2,10 +2,12 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from app.services.analyzer.utils.gitignore_parser import (
     GitignoreParser,
-    DEFAULT_IGNORE_PATTERNS
+    DEFAULT_IGNORE_PATTERNS,
+    _CombinedMatcher,
 )
 
 
@@ -80,6 +82,28 @@ build/**
         assert parser.should_ignore("src/node_modules/lib.js", str(temp_repo_dir)) is True
         assert parser.should_ignore("foo/bar/node_modules/index.js", str(temp_repo_dir)) is True
 
+    def test_should_ignore_dir_matches_directory_patterns(self, temp_repo_dir):
+        """Test directory-only patterns match the directories themselves."""
+        parser = GitignoreParser(use_defaults=False)
+        parser.add_pattern("temp/")
+
+        assert parser.should_ignore_dir("temp", str(temp_repo_dir)) is True
+        assert parser.should_ignore_dir(str(temp_repo_dir / "src" / "temp"), str(temp_repo_dir)) is True
+        assert parser.should_ignore_dir("src", str(temp_repo_dir)) is False
+        # A file named like the directory is not matched
+        assert parser.should_ignore("temp", str(temp_repo_dir)) is False
+
+    def test_match_relative(self):
+        """Test matching precomputed repository-relative paths."""
+        parser = GitignoreParser(use_defaults=False)
+        parser.add_pattern("build/")
+        parser.add_pattern("*.log")
+
+        assert parser.match_relative("src/build/") is True
+        assert parser.match_relative("logs/error.log") is True
+        assert parser.match_relative("src/main.py") is False
+        assert GitignoreParser(use_defaults=False).match_relative("a.log") is False
+
     def test_should_ignore_glob_pattern(self, temp_repo_dir):
         """Test glob pattern matching with **."""
         parser = GitignoreParser(use_defaults=False)
@@ -149,6 +173,53 @@ build/**
         assert "*.tmp" in patterns
         assert "cache/" in patterns
 
+    def test_patterns_compiled_once_per_change(self, temp_repo_dir):
+        """Test adding patterns defers compiling until the next match."""
+        parser = GitignoreParser(use_defaults=False)
+
+        with patch.object(parser, "_build_pathspec", wraps=parser._build_pathspec) as build:
+            for pattern in ["*.log", "*.tmp", "cache/"]:
+                parser.add_pattern(pattern)
+            assert build.call_count == 0
+
+            assert parser.should_ignore("app.log", str(temp_repo_dir)) is True
+            assert parser.should_ignore_dir("cache", str(temp_repo_dir)) is True
+            assert build.call_count == 1
+
+            parser.add_patterns(["*.bak"])
+            assert parser.should_ignore("x.bak", str(temp_repo_dir)) is True
+            assert build.call_count == 2
+
+    def test_match_results_cached_until_patterns_change(self, temp_repo_dir):
+        """Test repeated paths are matched once per compiled spec."""
+        parser = GitignoreParser(use_defaults=False)
+        parser.add_pattern("*.log")
+
+        with patch.object(_CombinedMatcher, "match", autospec=True,
+                          side_effect=lambda matcher, path: path.endswith(".log")) as match:
+            for _ in range(3):
+                assert parser.should_ignore("app.log", str(temp_repo_dir)) is True
+                assert parser.match_relative("src/") is False
+            assert match.call_count == 2
+
+            parser.add_pattern("src/")
+            parser.should_ignore("app.log", str(temp_repo_dir))
+            assert match.call_count == 3
+
+        assert parser.match_relative("src/") is True
+
+    @pytest.mark.parametrize("path", [
+        "app.log", "keep.log", "logs/keep.log", "build/", "build/out.js",
+        "build/keep/", "build/keep/a.js", "docs/guide.md", "docs/README.md",
+        "docs/sub/guide.md", "./app.log", "/app.log", "src/main.py",
+    ])
+    def test_combined_matcher_agrees_with_pathspec(self, path):
+        """Test the joined regexes give PathSpec's result, negations included."""
+        parser = GitignoreParser(use_defaults=True)
+        parser.add_patterns(["!keep.log", "!build/keep/", "docs/*.md", "!docs/README.md"])
+
+        assert parser.match_relative(path) == parser.pathspec.match_file(path)
+
     def test_clear_patterns(self):
         """Test clear_patterns resets state."""
         parser = GitignoreParser(use_defaults=True)
@@ -222,3 +293,16 @@ build/**
         patterns = parser.get_patterns()
         assert "*.log" in patterns
         assert "temp/" in patterns
+
+    def test_should_ignore_uses_parsed_repo_root(self, temp_repo_dir):
+        """Test paths are relativized against the root given to parse_gitignore."""
+        (temp_repo_dir / ".gitignore").write_text("/build/\n")
+        parser = GitignoreParser(use_defaults=False)
+        parser.parse_gitignore(str(temp_repo_dir))
+
+        with patch.object(Path, "relative_to") as relative_to:
+            assert parser.should_ignore(str(temp_repo_dir / "build" / "out.js")) is True
+            assert parser.should_ignore(str(temp_repo_dir / "src" / "build.js")) is False
+            assert parser.should_ignore_dir(str(temp_repo_dir / "build")) is True
+
+        relative_to.assert_not_called()
@@ -1,8 +1,11 @@
 """Unit tests for LanguageDetector."""
 
 import pytest
+from pathlib import Path
+
 from app.services.analyzer.utils.language_detector import (
     LanguageDetector,
+    get_extension,
     LANGUAGE_MAP,
     GRAMMAR_MAP,
     SUPPORTED_LANGUAGES
@@ -78,6 +81,22 @@ class TestLanguageDetector:
         assert detector.detect_language("app.JS") == "JavaScript"
         assert detector.detect_language("MODULE.TS") == "TypeScript"
 
+    def test_detect_language_ignores_dots_in_directories(self):
+        """Test only the file name's extension is considered."""
+        detector = LanguageDetector()
+
+        assert detector.detect_language("pkg.py/README") is None
+        assert detector.detect_language("src/v1.2/app.tsx") == "TSX"
+        assert detector.detect_language(".py") is None
+
+    @pytest.mark.parametrize("file_path", [
+        "a.py", "A.PY", "archive.tar.GZ", ".bashrc", "file.", "no_extension",
+        "dir.d/file", "dir.d/.hidden", "/repo/src/app.Tsx", ".", "..",
+    ])
+    def test_get_extension_matches_path_suffix(self, file_path):
+        """Test get_extension agrees with Path.suffix.lower()."""
+        assert get_extension(file_path) == Path(file_path).suffix.lower()
+
     def test_is_supported_language(self):
         """Test is_supported_language for Tree-sitter grammars."""
         detector = LanguageDetector()
@@ -0,0 +1,75 @@
+"""Unit tests for the analyzer parse cache."""
+
+from unittest.mock import patch
+
+from app.services.analyzer.generic_analyzer import GenericAnalyzer
+from app.services.analyzer.utils.parse_cache import ParseCache, grammar_version
+
+
+class TestParseCache:
+    """Test ParseCache storage."""
+
+    def test_put_then_get(self, temp_repo_dir):
+        """Test a stored entry is returned for the same key and version."""
+        cache = ParseCache(str(temp_repo_dir / "cache"))
+        key = ParseCache.key(b"import os\n", "Python")
+
+        assert cache.get(key, "v1") is None
+
+        cache.put(key, "v1", {"lines": 1, "imports": ["os"]})
+
+        assert cache.get(key, "v1") == {"lines": 1, "imports": ["os"]}
+        assert (temp_repo_dir / "cache" / key[:2] / f"{key[2:]}.json").exists()
+
+    def test_version_mismatch_is_miss(self, temp_repo_dir):
+        """Test entries from another grammar version are ignored."""
+        cache = ParseCache(str(temp_repo_dir / "cache"))
+        key = ParseCache.key(b"x = 1\n", "Python")
+        cache.put(key, "v1", {"lines": 1, "imports": []})
+
+        assert cache.get(key, "v2") is None
+
+    def test_key_depends_on_content_and_language(self):
+        """Test keys differ by content and by language."""
+        assert ParseCache.key(b"a", "Python") != ParseCache.key(b"b", "Python")
+        assert ParseCache.key(b"a", "Python") != ParseCache.key(b"a", "JavaScript")
+
+    def test_grammar_version_includes_package_versions(self):
+        """Test parsed languages are tagged with their grammar package version."""
+        assert "tree-sitter-python=" in grammar_version("python")
+        assert "tree-sitter-python" not in grammar_version(None)
+
+
+class TestAnalyzerWithParseCache:
+    """Test GenericAnalyzer reuses cached file results."""
+
+    def test_unchanged_files_are_not_reparsed(self, temp_repo_dir):
+        """Test a second analysis of unchanged files skips Tree-sitter."""
+        repo = temp_repo_dir / "repo"
+        repo.mkdir()
+        (repo / "main.py").write_text("import utils\n\nprint('hi')\n")
+        (repo / "utils.py").write_text("def helper():\n    pass\n")
+        cache_dir = str(temp_repo_dir / "cache")
+
+        first = GenericAnalyzer(str(repo), parse_cache_dir=cache_dir).analyze()
+
+        analyzer = GenericAnalyzer(str(repo), parse_cache_dir=cache_dir)
+        with patch.object(analyzer.tree_sitter_manager, "parse_code") as parse_code:
+            second = analyzer.analyze()
+
+        assert second == first
+        parse_code.assert_not_called()
+        assert analyzer._file_imports[str(repo / "main.py")] == ["utils"]
+
+    def test_changed_file_is_reparsed(self, temp_repo_dir):
+        """Test editing a file invalidates its cached result."""
+        repo = temp_repo_dir / "repo"
+        repo.mkdir()
+        (repo / "main.py").write_text("x = 1\n")
+        cache_dir = str(temp_repo_dir / "cache")
+
+        GenericAnalyzer(str(repo), parse_cache_dir=cache_dir).analyze()
+        (repo / "main.py").write_text("import os\n\nx = 1\n")
+        stats = GenericAnalyzer(str(repo), parse_cache_dir=cache_dir).analyze()
+
+        assert stats["lines_of_code"] == 2
@@ -23,6 +23,17 @@ class TestTreeSitterManager:
         # Parsers should be empty initially (lazy loading)
         assert len(manager.parsers) == 0
 
+    def test_grammars_loaded_once_per_process(self):
+        """Test managers share the process-wide grammar objects."""
+        from app.services.analyzer.utils.tree_sitter_utils import load_languages
+
+        first = TreeSitterManager()
+        second = TreeSitterManager()
+
+        assert first.languages["python"] is second.languages["python"]
+        assert first.languages["python"] is load_languages()["python"]
+        assert first.languages is not load_languages()  # Copy; cache stays intact
+
     def test_get_parser_python(self):
         """Test get_parser creates parser for Python."""
         manager = TreeSitterManager()
@@ -72,6 +83,30 @@ class TestTreeSitterManager:
         assert parser1 is parser2  # Same object
         assert len(manager.parsers) == 1  # No new parser created
 
+    def test_parsers_shared_per_thread(self):
+        """Test managers on one thread share parsers, other threads get their own."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        first = TreeSitterManager().get_parser("python")
+        second = TreeSitterManager().get_parser("python")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(lambda: TreeSitterManager().get_parser("python")).result()
+
+        assert first is second
+        assert other is not first
+
+    def test_import_queries_compiled_once(self):
+        """Test import queries are shared per process and None when unsupported."""
+        manager = TreeSitterManager()
+
+        query = manager.get_import_query("Python")
+
+        assert query is not None
+        assert TreeSitterManager().get_import_query("python") is query
+        assert manager.get_import_query("tsx") is not None
+        assert manager.get_import_query("rust") is None
+
     def test_get_parser_case_insensitive(self):
         """Test get_parser handles case-insensitive language names."""
         manager = TreeSitterManager()
@@ -253,6 +253,14 @@ class TestChatMessageModel:
         assert "msg-id" in repr_str
         assert "..." in repr_str  # Should be truncated
 
+    def test_chat_message_repr_short_content(self):
+        """Test ChatMessage __repr__ leaves short and missing content untruncated."""
+        message = ChatMessage(id="msg-id", role=MessageRole.user, content="x" * 50)
+        assert "x" * 50 + ")>" in repr(message)
+
+        message = ChatMessage(id="msg-id", role=MessageRole.user)
+        assert "content=)>" in repr(message)
+
 
 class TestChatSessionMessageRelationship:
     """Test relationship between ChatSession and ChatMessage."""
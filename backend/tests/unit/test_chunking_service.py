@@ -276,6 +276,20 @@ class TestChunkingServiceCollectFiles:
         assert js_file is not None
         assert js_file[2] == "JavaScript"  # LanguageDetector returns capitalized names
 
+    def test_collect_files_checks_extension_before_stat(self, temp_repo):
+        """Test files of unknown type are rejected without being stat'ed."""
+        Path(temp_repo, "data.json").write_text("{}")
+        Path(temp_repo, "logo.png").write_bytes(b"\x89PNG")
+
+        service = ChunkingService()
+        with patch.object(Path, "stat", autospec=True, side_effect=Path.stat) as stat:
+            files = list(service.collect_files(temp_repo))
+
+        stat_names = {call.args[0].name for call in stat.call_args_list}
+        assert {"data.json", "logo.png", "ignored.pyc"}.isdisjoint(stat_names)
+        assert {"main.py", "utils.py", "app.py"} <= stat_names
+        assert len(files) == 3
+
 
 class TestChunkingServiceChunkProject:
     """Tests for chunk_project method."""
@@ -414,3 +414,63 @@ class TestGitService:
         assert success is False
         assert error is not None
         assert "Error" in error
+
+    def test_list_files_uses_git_index(self, temp_repo_dir):
+        """Test list_files returns tracked and untracked files, ignored or not."""
+        import subprocess
+
+        repo = temp_repo_dir / "repo"
+        (repo / "pkg").mkdir(parents=True)
+        subprocess.run(["git", "init", "-q", str(repo)], check=True)
+        (repo / ".gitignore").write_text("ignored.py\n")
+        (repo / "pkg" / "tracked.py").write_text("x = 1\n")
+        (repo / "untracked.py").write_text("y = 2\n")
+        (repo / "ignored.py").write_text("z = 3\n")
+        subprocess.run(["git", "-C", str(repo), "add", "pkg/tracked.py"], check=True)
+
+        service = GitService()
+        files = service.list_files(str(repo))
+
+        assert sorted(files) == [".gitignore", "ignored.py", "pkg/tracked.py", "untracked.py"]
+
+    def test_list_files_ignores_git_exclude_config(self, temp_repo_dir, monkeypatch):
+        """Test nested .gitignore files and git excludes don't filter the list."""
+        import subprocess
+
+        excludes = temp_repo_dir / "global_excludes"
+        excludes.write_text("new.py\n")
+        global_config = temp_repo_dir / "gitconfig"
+        global_config.write_text(f"[core]\n\texcludesFile = {excludes}\n")
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+
+        repo = temp_repo_dir / "repo"
+        (repo / "src").mkdir(parents=True)
+        subprocess.run(["git", "init", "-q", str(repo)], check=True)
+        (repo / ".git" / "info").mkdir(exist_ok=True)
+        (repo / ".git" / "info" / "exclude").write_text("local.py\n")
+        (repo / "src" / ".gitignore").write_text("nested.py\n")
+        for name in ("new.py", "local.py", "nested.py"):
+            (repo / "src" / name).write_text("x = 1\n")
+
+        service = GitService()
+        files = service.list_files(str(repo))
+
+        assert sorted(files) == [
+            "src/.gitignore", "src/local.py", "src/nested.py", "src/new.py",
+        ]
+
+    def test_list_files_not_a_repository(self, temp_repo_dir):
+        """Test list_files returns None outside a git repository."""
+        service = GitService()
+
+        assert service.list_files(str(temp_repo_dir)) is None
+
+    @patch("app.services.git_service.subprocess.run")
+    def test_list_files_git_failure(self, mock_run, temp_repo_dir):
+        """Test list_files returns None when git fails."""
+        (temp_repo_dir / ".git").mkdir()
+        mock_run.return_value = MagicMock(returncode=128, stdout=b"", stderr=b"fatal")
+
+        service = GitService()
+
+        assert service.list_files(str(temp_repo_dir)) is None
@@ -4,7 +4,13 @@ import pytest
 from datetime import datetime
 from uuid import uuid4
 
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from app.models.diagram import Diagram
 from app.models.project import Project
+from app.models.report import Report
+from app.schemas.diagram import DiagramType
 from app.schemas.project import ProjectStatus, SourceType
 
 
@@ -102,6 +108,23 @@ class TestProjectModel:
         assert data["updated_at"] is not None
         assert data["last_analyzed_at"] == now
 
+    def test_project_to_dict_after_expire(self, test_db_session):
+        """Test to_dict() reloads expired attributes instead of returning None."""
+        project = Project(
+            id=str(uuid4()),
+            name="Expired Test",
+            source_type=SourceType.local_path,
+            source="/test/path",
+        )
+        test_db_session.add(project)
+        test_db_session.commit()  # expires all attributes
+
+        data = project.to_dict()
+
+        assert data["name"] == "Expired Test"
+        assert data["branch"] == "main"
+        assert data["created_at"] is not None
+
     def test_project_enum_conversions(self, test_db_session):
         """Test enum conversions for ProjectStatus and SourceType."""
         project = Project(
@@ -270,3 +293,127 @@ class TestProjectModel:
         assert project.settings is None
         assert project.stats is None
         assert project.last_analyzed_at is None
+
+    def test_project_diagrams_require_eager_load(self, test_db_session):
+        """Test Project.diagrams raises on lazy access and loads via selectinload."""
+        project = Project(
+            id=str(uuid4()),
+            name="Relationship Test",
+            source_type=SourceType.local_path,
+            source="/test/path",
+        )
+        diagram = Diagram(
+            id=str(uuid4()),
+            project_id=project.id,
+            type=DiagramType.dependency,
+            title="Deps",
+            mermaid_code="graph TD",
+        )
+        test_db_session.add_all([project, diagram])
+        test_db_session.commit()
+        test_db_session.expire_all()
+
+        lazy_project = test_db_session.get(Project, project.id)
+        with pytest.raises(InvalidRequestError):
+            lazy_project.diagrams
+
+        test_db_session.expire_all()
+        loaded = test_db_session.query(Project).options(
+            selectinload(Project.diagrams)
+        ).filter(Project.id == project.id).one()
+
+        assert [d.id for d in loaded.diagrams] == [diagram.id]
+        assert loaded.diagrams[0].project is loaded
+
+
+class TestReportModel:
+    """Test Report model."""
+
+    def test_generation_time_ms_round_trips_as_int(self, test_db_session):
+        """Test generation_time_ms is stored and read back as an integer."""
+        project = Project(
+            id=str(uuid4()),
+            name="Report Test",
+            source_type=SourceType.local_path,
+            source="/test/path",
+        )
+        report = Report(
+            id=str(uuid4()),
+            project_id=project.id,
+            type="summary",
+            title="Summary",
+            content="# Summary",
+            generation_time_ms=1234,
+        )
+        test_db_session.add_all([project, report])
+        test_db_session.commit()
+        test_db_session.expire_all()
+
+        loaded = test_db_session.get(Report, report.id)
+
+        assert loaded.generation_time_ms == 1234
+        assert isinstance(loaded.generation_time_ms, int)
+
+
+class TestStringEnum:
+    """Test the StringEnum column type."""
+
+    def test_members_stored_by_name_and_loaded_as_enum(self, test_db_session):
+        """Test enum members round-trip through their stored names."""
+        from sqlalchemy import text
+
+        from app.models.settings import LLMSettingsModel
+        from app.schemas.settings import ProviderType
+
+        test_db_session.add(LLMSettingsModel(
+            id="default",
+            provider_type=ProviderType.OPENROUTER_BYOK,
+            model="m",
+        ))
+        test_db_session.commit()
+        test_db_session.expire_all()
+
+        stored = test_db_session.execute(
+            text("SELECT provider_type FROM llm_settings")
+        ).scalar_one()
+        loaded = test_db_session.get(LLMSettingsModel, "default")
+
+        assert stored == "OPENROUTER_BYOK"
+        assert loaded.provider_type is ProviderType.OPENROUTER_BYOK
+
+    def test_value_strings_bind_to_member_names(self, test_db_session):
+        """Test filtering by a raw enum value string matches stored names."""
+        from app.models.settings import LLMSettingsModel
+        from app.schemas.settings import ProviderType
+
+        test_db_session.add(LLMSettingsModel(
+            id="default",
+            provider_type=ProviderType.OLLAMA_EXTERNAL,
+            model="m",
+        ))
+        test_db_session.commit()
+
+        found = test_db_session.query(LLMSettingsModel).filter(
+            LLMSettingsModel.provider_type == "ollama_external"
+        ).count()
+
+        assert found == 1
+
+    def test_unknown_value_is_rejected_on_write(self, test_db_session):
+        """Test a string that is neither a member name nor value is not stored."""
+        from sqlalchemy.exc import StatementError
+
+        from app.models.settings import LLMSettingsModel
+
+        test_db_session.add(LLMSettingsModel(
+            id="default",
+            provider_type="not_a_provider",
+            model="m",
+        ))
+
+        with pytest.raises(StatementError) as exc_info:
+            test_db_session.commit()
+
+        assert isinstance(exc_info.value.orig, LookupError)
+        test_db_session.rollback()
+        assert test_db_session.query(LLMSettingsModel).count() == 0
@@ -0,0 +1,46 @@
+"""Unit tests for shared API response classes."""
+
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+import pytest
+
+from app.api.responses import ORJSONResponse
+from app.schemas.settings import ProviderType, LLMCapabilities
+
+
+class TestORJSONResponse:
+    """Test ORJSONResponse rendering."""
+
+    def test_renders_native_and_fallback_types(self):
+        """Test enums, datetimes, models, sets and paths are encoded."""
+        response = ORJSONResponse({
+            "provider": ProviderType.OLLAMA_CONTAINER,
+            "at": datetime(2024, 1, 25, 12, 0, 0),
+            "model": LLMCapabilities(max_context_length=8, supports_streaming=True),
+            "tags": {"a"},
+            "path": Path("/tmp/repo"),
+            1: "int key",
+        })
+
+        assert orjson.loads(response.body) == {
+            "provider": "ollama_container",
+            "at": "2024-01-25T12:00:00",
+            "model": {"max_context_length": 8, "supports_streaming": True},
+            "tags": ["a"],
+            "path": "/tmp/repo",
+            "1": "int key",
+        }
+        assert response.media_type == "application/json"
+
+    def test_unsupported_type_raises(self):
+        """Test unknown objects raise a serialization error."""
+        with pytest.raises(TypeError):
+            ORJSONResponse({"value": object()})
+
+    def test_bytes_content_passes_through(self):
+        """Test pre-encoded JSON bytes are sent unchanged."""
+        response = ORJSONResponse(b'{"models":[]}')
+
+        assert response.body == b'{"models":[]}'
@@ -153,8 +153,9 @@ class TestProjectSchemas:
         """Test ProjectSettings default values."""
         settings = ProjectSettings()
 
-        assert settings.ignore_patterns == ["*.log", "node_modules"]
-        assert settings.analyze_languages == ["python", "javascript", "typescript"]
+        assert settings.ignore_patterns == ("*.log", "node_modules")
+        assert settings.analyze_languages == ("python", "javascript", "typescript")
+        assert settings.ignore_patterns is ProjectSettings().ignore_patterns
 
     def test_project_settings_custom(self):
         """Test ProjectSettings with custom values."""
@@ -163,8 +164,15 @@ class TestProjectSchemas:
             analyze_languages=["python", "rust"]
         )
 
-        assert settings.ignore_patterns == ["*.tmp", "cache/"]
-        assert settings.analyze_languages == ["python", "rust"]
+        assert settings.ignore_patterns == ("*.tmp", "cache/")
+        assert settings.analyze_languages == ("python", "rust")
+
+    def test_project_settings_is_frozen(self):
+        """Test ProjectSettings rejects attribute assignment."""
+        settings = ProjectSettings()
+
+        with pytest.raises(ValidationError):
+            settings.ignore_patterns = ("*.tmp",)
 
     def test_language_stats(self):
         """Test LanguageStats schema."""
@@ -280,8 +288,8 @@ class TestProjectSchemas:
         )
 
         assert project.settings is not None
-        assert project.settings.ignore_patterns == ["*.log"]
-        assert project.settings.analyze_languages == ["python"]
+        assert project.settings.ignore_patterns == ("*.log",)
+        assert project.settings.analyze_languages == ("python",)
 
     def test_project_response_with_stats(self):
         """Test ProjectResponse with stats."""
@@ -326,3 +334,103 @@ class TestProjectSchemas:
             assert "type" in error
             assert "loc" in error
             assert "msg" in error
+
+
+class TestFrozenResponseSchemas:
+    """Test that hot-path response models are immutable."""
+
+    def test_search_result_is_frozen(self):
+        """Test SearchResult rejects attribute assignment."""
+        from app.schemas.search import SearchResult
+
+        result = SearchResult(
+            score=0.9,
+            file_path="main.py",
+            chunk_type="file",
+            name="main.py",
+            start_line=1,
+            end_line=10,
+            content="print('hi')",
+            language="python",
+        )
+
+        with pytest.raises(ValidationError):
+            result.score = 0.1
+
+    def test_analysis_step_is_frozen(self):
+        """Test AnalysisStep rejects attribute assignment."""
+        from app.schemas.analysis import AnalysisStep, StepStatus
+
+        step = AnalysisStep(name="clone", status=StepStatus.completed)
+
+        with pytest.raises(ValidationError):
+            step.status = StepStatus.failed
+
+
+class TestSchemasPackage:
+    """Test lazy re-exports from the app.schemas package."""
+
+    def test_reexports_resolve_to_submodule_classes(self):
+        """Test every name in __all__ resolves to its defining class."""
+        import app.schemas as schemas
+        from app.schemas.project import ProjectResponse
+
+        assert schemas.ProjectResponse is ProjectResponse
+        for name in schemas.__all__:
+            assert getattr(schemas, name).__name__ == name
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names raise AttributeError."""
+        import app.schemas as schemas
+
+        with pytest.raises(AttributeError):
+            schemas.DoesNotExist
+
+
+class TestLLMConfigUpdate:
+    """Test LLMConfigUpdate field validation."""
+
+    def test_provider_type_string_coerced_to_enum(self):
+        """Test known provider strings validate to the enum member."""
+        from app.schemas.settings import LLMConfigUpdate, ProviderType
+
+        update = LLMConfigUpdate(provider_type="ollama_external", model="m")
+
+        assert update.provider_type is ProviderType.OLLAMA_EXTERNAL
+
+    def test_invalid_values_rejected(self):
+        """Test unknown provider types and api formats are rejected."""
+        from app.schemas.settings import LLMConfigUpdate
+
+        with pytest.raises(ValidationError):
+            LLMConfigUpdate(provider_type="bogus", model="m")
+
+        with pytest.raises(ValidationError) as exc_info:
+            LLMConfigUpdate(provider_type="ollama_external", model="m", api_format="grpc")
+        error = exc_info.value.errors()[0]
+        assert error["loc"] == ("api_format",)
+        assert error["type"] == "literal_error"
+
+
+class TestSettingsDataclasses:
+    """Test read-only settings response dataclasses."""
+
+    def test_openrouter_model_is_frozen_and_slotted(self):
+        """Test OpenRouterModel validates, rejects assignment and has no __dict__."""
+        import dataclasses
+        from app.schemas.settings import OpenRouterModel
+
+        model = OpenRouterModel(
+            id="a/b",
+            name="B",
+            provider="a",
+            context_length="4096",
+            pricing={"input_per_million": 1, "output_per_million": 2},
+            capabilities=["chat"],
+        )
+
+        assert model.context_length == 4096
+        assert model.pricing.output_per_million == 2.0
+        assert not hasattr(model, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            model.name = "C"
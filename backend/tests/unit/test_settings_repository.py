@@ -1,7 +1,7 @@
 """Unit tests for the settings repository."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -92,6 +92,39 @@ class TestGetOrCreateLLMSettings:
         assert result.model == "custom-model"
         assert result.base_url == "https://custom.url"
 
+    def test_default_insert_does_not_overwrite_existing(self, repository, db_session):
+        """Test that the ON CONFLICT insert leaves an existing row untouched."""
+        settings = LLMSettingsModel(
+            id=DEFAULT_SETTINGS_ID,
+            provider_type=ProviderType.OPENROUTER_BYOK,
+            model="custom-model",
+        )
+        db_session.add(settings)
+        db_session.commit()
+
+        repository._insert_default_settings()
+
+        result = repository.get_llm_settings()
+        assert result.provider_type == ProviderType.OPENROUTER_BYOK
+        assert result.model == "custom-model"
+        assert db_session.query(LLMSettingsModel).count() == 1
+
+    def test_default_insert_without_on_conflict_support(self, repository, db_session, monkeypatch):
+        """Test dialects without ON CONFLICT use a plain insert, tolerating conflicts."""
+        monkeypatch.setattr(db_session.get_bind().dialect, "name", "mysql")
+
+        result = repository.get_or_create_llm_settings()
+        assert result.id == DEFAULT_SETTINGS_ID
+        assert result.model == "qwen2.5-coder:7b"
+
+        result.model = "custom-model"
+        db_session.commit()
+
+        repository._insert_default_settings()
+
+        assert repository.get_llm_settings().model == "custom-model"
+        assert db_session.query(LLMSettingsModel).count() == 1
+
 
 class TestSaveLLMSettings:
     """Tests for save_llm_settings method."""
@@ -208,6 +241,30 @@ class TestSaveLLMSettings:
         all_settings = repository.db.query(LLMSettingsModel).all()
         assert len(all_settings) == 1
 
+    def test_save_settings_without_update_returning(self, repository, db_session, monkeypatch):
+        """Test dialects without UPDATE ... RETURNING update, then reload the row."""
+        dialect = db_session.get_bind().dialect
+        monkeypatch.setattr(dialect, "name", "mysql")
+        monkeypatch.setattr(dialect, "update_returning", False)
+
+        created = repository.save_llm_settings(
+            provider_type=ProviderType.OLLAMA_CONTAINER,
+            model="initial-model",
+        )
+        assert created.model == "initial-model"
+
+        updated = repository.save_llm_settings(
+            provider_type=ProviderType.OPENROUTER_BYOK,
+            model="updated-model",
+            base_url="https://new.url",
+        )
+
+        assert updated is created
+        assert updated.provider_type == ProviderType.OPENROUTER_BYOK
+        assert updated.model == "updated-model"
+        assert updated.base_url == "https://new.url"
+        assert db_session.query(LLMSettingsModel).count() == 1
+
 
 class TestGetDecryptedApiKey:
     """Tests for get_decrypted_api_key method."""
@@ -251,6 +308,28 @@ class TestGetDecryptedApiKey:
         with pytest.raises(InvalidToken):
             repository.get_decrypted_api_key(settings)
 
+    def test_get_decrypted_api_key_is_memoized(self, repository, secrets_service, mocker):
+        """Test that repeated calls decrypt once until the key changes."""
+        settings = repository.save_llm_settings(
+            provider_type=ProviderType.OPENROUTER_BYOK,
+            model="test-model",
+            api_key="sk-first-key",
+        )
+        decrypt = mocker.spy(secrets_service, "decrypt")
+
+        assert repository.get_decrypted_api_key(settings) == "sk-first-key"
+        assert repository.get_decrypted_api_key(settings) == "sk-first-key"
+        assert decrypt.call_count == 1
+
+        repository.save_llm_settings(
+            provider_type=ProviderType.OPENROUTER_BYOK,
+            model="test-model",
+            api_key="sk-second-key",
+        )
+
+        assert repository.get_decrypted_api_key(settings) == "sk-second-key"
+        assert decrypt.call_count == 2
+
 
 class TestUpdateHealthStatus:
     """Tests for update_health_status method."""
@@ -273,6 +352,42 @@ class TestUpdateHealthStatus:
         assert settings.last_health_check is not None
         assert settings.last_health_status is False
 
+    def test_update_health_status_records_naive_utc(self, repository, db_session):
+        """Test the health check time is stored as naive UTC wall-clock time."""
+        settings = repository.get_or_create_llm_settings()
+
+        before = datetime.now(timezone.utc).replace(tzinfo=None)
+        repository.update_health_status(settings, is_healthy=True)
+        after = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        db_session.expire_all()
+        stored = repository.get_llm_settings().last_health_check
+
+        assert stored.tzinfo is None
+        assert before <= stored <= after
+
+    def test_repeated_status_within_window_is_coalesced(self, repository, db_session, mocker):
+        """Test that an unchanged status inside the write window skips the commit."""
+        settings = repository.get_or_create_llm_settings()
+        repository.update_health_status(settings, is_healthy=True)
+
+        commit = mocker.spy(db_session, "commit")
+        repository.update_health_status(settings, is_healthy=True)
+
+        commit.assert_not_called()
+        assert settings.last_health_status is True
+
+    def test_status_change_is_written_immediately(self, repository, db_session, mocker):
+        """Test that a changed status is always committed."""
+        settings = repository.get_or_create_llm_settings()
+        repository.update_health_status(settings, is_healthy=True)
+
+        commit = mocker.spy(db_session, "commit")
+        repository.update_health_status(settings, is_healthy=False)
+
+        commit.assert_called_once()
+        assert settings.last_health_status is False
+
 
 class TestDeleteLLMSettings:
     """Tests for delete_llm_settings method."""